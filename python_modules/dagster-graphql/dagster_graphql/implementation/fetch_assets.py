@@ -20,7 +20,6 @@
     DagsterEventType,
     DagsterInstance,
     EventRecordsFilter,
-    MultiPartitionKey,
     MultiPartitionsDefinition,
     _check as check,
 )
@@ -28,8 +27,10 @@
 from dagster._core.definitions.external_asset_graph import ExternalAssetGraph
 from dagster._core.definitions.multi_dimensional_partitions import (
     MultiPartitionsSubset,
+    PartitionDimensionDefinition,
 )
 from dagster._core.definitions.partition import (
+    BitmapPartitionsSubset,
     CachingDynamicPartitionsLoader,
     DefaultPartitionsSubset,
     PartitionsDefinition,
@@ -469,7 +470,9 @@ def build_partition_statuses(
             failed_partitions_subset,
             in_progress_partitions_subset,
         )
-    elif isinstance(materialized_partitions_subset, DefaultPartitionsSubset):
+    elif isinstance(
+        materialized_partitions_subset, (DefaultPartitionsSubset, BitmapPartitionsSubset)
+    ):
         materialized_keys = materialized_partitions_subset.get_partition_keys()
         failed_keys = failed_partitions_subset.get_partition_keys()
         in_progress_keys = in_progress_partitions_subset.get_partition_keys()
@@ -488,6 +491,26 @@ def build_partition_statuses(
         check.failed("Should not reach this point")
 
 
+def _get_dim2_partition_subsets_by_dim1(
+    partitions_subset: MultiPartitionsSubset, secondary_dim: PartitionDimensionDefinition
+) -> Dict[str, PartitionsSubset]:
+    # The subset stores a subset of the primary dimension for each secondary dimension key, so
+    # invert it without building a MultiPartitionKey for each partition in the subset
+    dim2_keys_by_dim1: Dict[str, List[str]] = defaultdict(list)
+    for dim2_key, dim1_subset in partitions_subset.primary_subsets_by_secondary_key.items():
+        for dim1_key in dim1_subset.get_partition_keys():
+            dim2_keys_by_dim1[dim1_key].append(dim2_key)
+
+    dim2_partition_subset_by_dim1: Dict[str, PartitionsSubset] = defaultdict(
+        lambda: secondary_dim.partitions_def.empty_subset()
+    )
+    for dim1_key, dim2_keys in dim2_keys_by_dim1.items():
+        dim2_partition_subset_by_dim1[
+            dim1_key
+        ] = secondary_dim.partitions_def.empty_subset().with_partition_keys(dim2_keys)
+    return dim2_partition_subset_by_dim1
+
+
 def get_2d_run_length_encoded_partitions(
     dynamic_partitions_store: DynamicPartitionsStore,
     materialized_partitions_subset: PartitionsSubset,
@@ -509,47 +532,15 @@ def get_2d_run_length_encoded_partitions(
     primary_dim = materialized_partitions_subset.partitions_def.primary_dimension
     secondary_dim = materialized_partitions_subset.partitions_def.secondary_dimension
 
-    dim2_materialized_partition_subset_by_dim1: Dict[str, PartitionsSubset] = defaultdict(
-        lambda: secondary_dim.partitions_def.empty_subset()
+    dim2_materialized_partition_subset_by_dim1 = _get_dim2_partition_subsets_by_dim1(
+        cast(MultiPartitionsSubset, materialized_partitions_subset), secondary_dim
     )
-    for partition_key in cast(
-        Sequence[MultiPartitionKey], materialized_partitions_subset.get_partition_keys()
-    ):
-        dim2_materialized_partition_subset_by_dim1[
-            partition_key.keys_by_dimension[primary_dim.name]
-        ] = dim2_materialized_partition_subset_by_dim1[
-            partition_key.keys_by_dimension[primary_dim.name]
-        ].with_partition_keys(
-            [partition_key.keys_by_dimension[secondary_dim.name]]
-        )
-
-    dim2_failed_partition_subset_by_dim1: Dict[str, PartitionsSubset] = defaultdict(
-        lambda: secondary_dim.partitions_def.empty_subset()
+    dim2_failed_partition_subset_by_dim1 = _get_dim2_partition_subsets_by_dim1(
+        cast(MultiPartitionsSubset, failed_partitions_subset), secondary_dim
     )
-    for partition_key in cast(
-        Sequence[MultiPartitionKey], failed_partitions_subset.get_partition_keys()
-    ):
-        dim2_failed_partition_subset_by_dim1[
-            partition_key.keys_by_dimension[primary_dim.name]
-        ] = dim2_failed_partition_subset_by_dim1[
-            partition_key.keys_by_dimension[primary_dim.name]
-        ].with_partition_keys(
-            [partition_key.keys_by_dimension[secondary_dim.name]]
-        )
-
-    dim2_in_progress_partition_subset_by_dim1: Dict[str, PartitionsSubset] = defaultdict(
-        lambda: secondary_dim.partitions_def.empty_subset()
+    dim2_in_progress_partition_subset_by_dim1 = _get_dim2_partition_subsets_by_dim1(
+        cast(MultiPartitionsSubset, in_progress_partitions_subset), secondary_dim
     )
-    for partition_key in cast(
-        Sequence[MultiPartitionKey], in_progress_partitions_subset.get_partition_keys()
-    ):
-        dim2_in_progress_partition_subset_by_dim1[
-            partition_key.keys_by_dimension[primary_dim.name]
-        ] = dim2_in_progress_partition_subset_by_dim1[
-            partition_key.keys_by_dimension[primary_dim.name]
-        ].with_partition_keys(
-            [partition_key.keys_by_dimension[secondary_dim.name]]
-        )
 
     materialized_2d_ranges = []
 
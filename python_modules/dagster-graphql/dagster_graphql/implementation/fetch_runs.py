@@ -1,3 +1,4 @@
+import itertools
 from collections import defaultdict
 from typing import (
     TYPE_CHECKING,
@@ -21,7 +22,9 @@
 from dagster._core.definitions.selector import JobSubsetSelector
 from dagster._core.errors import DagsterRunNotFoundError
 from dagster._core.execution.stats import RunStepKeyStatsSnapshot, StepEventStatus
+from dagster._core.instance import DagsterInstance
 from dagster._core.storage.dagster_run import DagsterRunStatus, RunRecord, RunsFilter
+from dagster._core.storage.event_log.base import EventLogCursor
 from dagster._core.storage.tags import TagType, get_tag_type
 
 from .external import ensure_valid_config, get_external_job_or_raise
@@ -37,6 +40,9 @@
     from ..schema.runs import GrapheneRunGroup, GrapheneRunTagKeys, GrapheneRunTags
     from ..schema.util import ResolveInfo
 
+# the maximum number of events returned by an event connection that was not given a limit
+EVENT_CONNECTION_PAGE_SIZE = 10000
+
 
 def get_run_by_id(
     graphene_info: "ResolveInfo", run_id: str
@@ -393,9 +399,47 @@ def get_logs_for_run(
     if not run:
         return GrapheneRunNotFoundError(run_id)
 
+    if limit is None:
+        return get_event_connection_for_run(instance, run_id, run.job_name, cursor)
+
     conn = instance.get_records_for_run(run_id, cursor=cursor, limit=limit)
     return GrapheneEventConnection(
         events=[from_event_record(record.event_log_entry, run.job_name) for record in conn.records],
         cursor=conn.cursor,
         hasMore=conn.has_more,
     )
+
+
+def get_event_connection_for_run(
+    instance: DagsterInstance,
+    run_id: str,
+    job_name: str,
+    cursor: Optional[str] = None,
+    page_size: int = EVENT_CONNECTION_PAGE_SIZE,
+) -> "GrapheneEventConnection":
+    """Resolve the events of a run after the cursor, up to `page_size` events at a time, converting
+    each record as it is streamed from storage. If there are more events, `hasMore` is set and the
+    returned cursor points at the last returned event.
+    """
+    from ..schema.pipelines.pipeline import GrapheneEventConnection
+    from .events import from_event_record
+
+    check.int_param(page_size, "page_size")
+    records = instance.iterate_records_for_run(run_id, cursor=cursor)
+
+    events = []
+    last_storage_id = None
+    for record in itertools.islice(records, page_size):
+        events.append(from_event_record(record.event_log_entry, job_name))
+        last_storage_id = record.storage_id
+    has_more = len(events) == page_size and next(records, None) is not None
+
+    if last_storage_id is not None:
+        next_cursor = EventLogCursor.from_storage_id(last_storage_id).to_string()
+    elif cursor:
+        # no new logs, return the same cursor
+        next_cursor = cursor
+    else:
+        next_cursor = EventLogCursor.from_storage_id(-1).to_string()
+
+    return GrapheneEventConnection(events=events, cursor=next_cursor, hasMore=has_more)
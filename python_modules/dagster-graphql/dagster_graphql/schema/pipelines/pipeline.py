@@ -21,10 +21,14 @@
 from dagster_graphql.implementation.events import iterate_metadata_entries
 from dagster_graphql.schema.metadata import GrapheneMetadataEntry
 
-from ...implementation.events import from_event_record
 from ...implementation.fetch_assets import get_assets_for_run_id, get_unique_asset_id
 from ...implementation.fetch_pipelines import get_job_reference_or_raise
-from ...implementation.fetch_runs import get_runs, get_stats, get_step_stats
+from ...implementation.fetch_runs import (
+    get_event_connection_for_run,
+    get_runs,
+    get_stats,
+    get_step_stats,
+)
 from ...implementation.fetch_schedules import get_schedules_for_pipeline
 from ...implementation.fetch_sensors import get_sensors_for_pipeline
 from ...implementation.loader import BatchRunLoader, RepositoryScopedBatchLoader
@@ -539,14 +543,11 @@ def resolve_assetMaterializations(self, graphene_info: ResolveInfo):
         ]
 
     def resolve_eventConnection(self, graphene_info: ResolveInfo, afterCursor=None):
-        conn = graphene_info.context.instance.get_records_for_run(self.run_id, cursor=afterCursor)
-        return GrapheneEventConnection(
-            events=[
-                from_event_record(record.event_log_entry, self.dagster_run.job_name)
-                for record in conn.records
-            ],
-            cursor=conn.cursor,
-            hasMore=conn.has_more,
+        return get_event_connection_for_run(
+            graphene_info.context.instance,
+            self.run_id,
+            self.dagster_run.job_name,
+            cursor=afterCursor,
         )
 
     def _get_run_record(self, instance):
@@ -111,11 +111,10 @@ async def download_debug_file_endpoint(self, request: Request):
         context = self.make_request_context(request)
 
         run = context.instance.get_run_by_id(run_id)
-        debug_payload = DebugRunPayload.build(context.instance, run)  # type: ignore  # (possible none)
 
         result = io.BytesIO()
         with gzip.GzipFile(fileobj=result, mode="wb") as file:
-            debug_payload.write(file)
+            DebugRunPayload.write_for_run(context.instance, run, file)  # type: ignore  # (possible none)
 
         result.seek(0)  # be kind, please rewind
 
@@ -1,9 +1,11 @@
+import io
 from os import path
 
 import uvicorn
 from click.testing import CliRunner
 from dagster import job, op
 from dagster._cli.debug import export_command
+from dagster._core.debug import DebugRunPayload
 from dagster._core.test_utils import instance_for_test
 from dagster_webserver.debug import webserver_debug_command
 
@@ -36,3 +38,16 @@ def test_roundtrip(monkeypatch):
         assert debug_result.exit_code == 0, debug_result.exception
         assert file_path in debug_result.output
         assert f"run_id: {run_result.run_id}" in debug_result.output
+
+
+def test_streamed_payload_matches():
+    with instance_for_test() as instance:
+        run_result = pipe_test.execute_in_process(instance=instance)
+        run = instance.get_run_by_id(run_result.run_id)
+
+        built = io.BytesIO()
+        DebugRunPayload.build(instance, run).write(built)
+        streamed = io.BytesIO()
+        DebugRunPayload.write_for_run(instance, run, streamed)
+
+        assert streamed.getvalue() == built.getvalue()
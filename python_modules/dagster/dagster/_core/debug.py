@@ -1,11 +1,12 @@
-from typing import NamedTuple, Sequence
+from typing import NamedTuple, Optional, Sequence
 
 import dagster._check as check
+import dagster._seven as seven
 from dagster._core.events.log import EventLogEntry
 from dagster._core.instance import DagsterInstance
 from dagster._core.snap import ExecutionPlanSnapshot, JobSnapshot
 from dagster._core.storage.dagster_run import DagsterRun
-from dagster._serdes import serialize_value, whitelist_for_serdes
+from dagster._serdes import pack_value, serialize_value, whitelist_for_serdes
 
 
 @whitelist_for_serdes(
@@ -46,13 +47,18 @@ def __new__(
         )
 
     @classmethod
-    def build(cls, instance: DagsterInstance, run: DagsterRun) -> "DebugRunPayload":
+    def build(
+        cls,
+        instance: DagsterInstance,
+        run: DagsterRun,
+        event_list: Optional[Sequence[EventLogEntry]] = None,
+    ) -> "DebugRunPayload":
         from dagster import __version__ as dagster_version
 
         return cls(
             version=dagster_version,
             dagster_run=run,
-            event_list=instance.all_logs(run.run_id),
+            event_list=instance.all_logs(run.run_id) if event_list is None else event_list,
             job_snapshot=instance.get_job_snapshot(run.job_snapshot_id),  # type: ignore  # (possible none)
             execution_plan_snapshot=instance.get_execution_plan_snapshot(
                 run.execution_plan_snapshot_id  # type: ignore  # (possible none)
@@ -61,3 +67,40 @@ def build(cls, instance: DagsterInstance, run: DagsterRun) -> "DebugRunPayload":
 
     def write(self, output_file):
         return output_file.write(serialize_value(self).encode("utf-8"))
+
+    @classmethod
+    def write_for_run(cls, instance: DagsterInstance, run: DagsterRun, output_file) -> None:
+        """Write the debug payload for a run, streaming its event log from storage rather than
+        loading it all into memory. The output is identical to that of `build(...).write(...)`.
+        """
+        # `write` serializes with sorted keys, so the fields are written in sorted order, with the
+        # event list written in place of the empty list that the payload is packed with
+        check.invariant(
+            seven.json.dumps.keywords.get("sort_keys") is True,
+            "Expected the serialized debug payload to have sorted keys",
+        )
+        packed_payload = pack_value(cls.build(instance, run, event_list=[]))
+        check.invariant(
+            isinstance(packed_payload, dict) and packed_payload.get("event_list") == [],
+            "Expected the packed debug payload to have an empty event list",
+        )
+
+        output_file.write(b"{")
+        for i, key in enumerate(sorted(packed_payload.keys())):
+            if i:
+                output_file.write(b", ")
+            output_file.write(f"{seven.json.dumps(key)}: ".encode("utf-8"))
+            if key == "event_list":
+                cls._write_event_list(instance, run.run_id, output_file)
+            else:
+                output_file.write(seven.json.dumps(packed_payload[key]).encode("utf-8"))
+        output_file.write(b"}")
+
+    @staticmethod
+    def _write_event_list(instance: DagsterInstance, run_id: str, output_file) -> None:
+        output_file.write(b"[")
+        for i, record in enumerate(instance.iterate_records_for_run(run_id)):
+            if i:
+                output_file.write(b", ")
+            output_file.write(serialize_value(record.event_log_entry).encode("utf-8"))
+        output_file.write(b"]")
@@ -1,5 +1,7 @@
 import hashlib
 import itertools
+import json
+from collections import defaultdict
 from datetime import datetime
 from functools import reduce
 from typing import (
@@ -21,6 +23,7 @@
 from dagster._annotations import public
 from dagster._core.errors import (
     DagsterInvalidDefinitionError,
+    DagsterInvalidDeserializationVersionError,
     DagsterInvalidInvocationError,
     DagsterUnknownPartitionError,
 )
@@ -37,6 +40,7 @@
     PartitionsSubset,
     StaticPartitionsDefinition,
 )
+from .partition_key_range import PartitionKeyRange
 from .time_window_partitions import TimeWindow, TimeWindowPartitionsDefinition
 
 INVALID_STATIC_PARTITIONS_KEY_CHARACTERS = set(["|", ",", "[", "]"])
@@ -501,32 +505,377 @@ def get_num_partitions(
         return reduce(lambda x, y: x * y, dimension_counts, 1)
 
 
-class MultiPartitionsSubset(DefaultPartitionsSubset):
+class MultiPartitionsSubset(PartitionsSubset[MultiPartitionKey]):
+    """A subset of the partitions of a MultiPartitionsDefinition, stored as a subset of the primary
+    dimension for each partition key of the secondary dimension.
+
+    When the primary dimension is time-partitioned, each of these subsets is a
+    TimeWindowPartitionsSubset, so long stretches of time are stored, combined and serialized as
+    a few time windows per secondary key, rather than as the product of the partition keys of the
+    two dimensions.
+    """
+
+    # Every time we change the serialization format, we should increment the version number.
+    # This will ensure that we can gracefully degrade when deserializing old data.
+    SERIALIZATION_VERSION = 2
+    # Versions of the DefaultPartitionsSubset format, which stored the partition keys
+    KEY_LIST_SERIALIZATION_VERSIONS = [1]
+
     def __init__(
         self,
         partitions_def: MultiPartitionsDefinition,
         subset: Optional[Set[str]] = None,
+        primary_subsets_by_secondary_key: Optional[Mapping[str, PartitionsSubset]] = None,
     ):
-        check.inst_param(partitions_def, "partitions_def", MultiPartitionsDefinition)
-        subset = (
-            set(
-                [
-                    partitions_def.get_partition_key_from_str(key)
-                    for key in subset
-                    if MULTIPARTITION_KEY_DELIMITER in key
-                ]
+        self._partitions_def = check.inst_param(
+            partitions_def, "partitions_def", MultiPartitionsDefinition
+        )
+        self._primary_dimension = partitions_def.primary_dimension
+        self._secondary_dimension = partitions_def.secondary_dimension
+        # empty subsets are dropped, so that equal subsets have equal mappings
+        self._primary_subsets_by_secondary_key: Dict[str, PartitionsSubset] = {
+            secondary_key: primary_subset
+            for secondary_key, primary_subset in check.opt_mapping_param(
+                primary_subsets_by_secondary_key,
+                "primary_subsets_by_secondary_key",
+                key_type=str,
+                value_type=PartitionsSubset,
+            ).items()
+            if len(primary_subset) > 0
+        }
+        if subset:
+            self._primary_subsets_by_secondary_key = self.with_partition_keys(
+                subset
+            ).primary_subsets_by_secondary_key
+
+    @property
+    def primary_subsets_by_secondary_key(self) -> Mapping[str, PartitionsSubset]:
+        """The non-empty subsets of the primary dimension's partitions, keyed by the partition key of
+        the secondary dimension that they are combined with.
+        """
+        return self._primary_subsets_by_secondary_key
+
+    def get_primary_subset(self, secondary_key: str) -> PartitionsSubset:
+        primary_subset = self._primary_subsets_by_secondary_key.get(secondary_key)
+        if primary_subset is None:
+            return self._primary_dimension.partitions_def.empty_subset()
+        return primary_subset
+
+    def _get_multipartition_key(self, primary_key: str, secondary_key: str) -> MultiPartitionKey:
+        return MultiPartitionKey(
+            {
+                self._primary_dimension.name: primary_key,
+                self._secondary_dimension.name: secondary_key,
+            }
+        )
+
+    def _get_primary_and_secondary_key(self, partition_key: str) -> Optional[Tuple[str, str]]:
+        if not (
+            isinstance(partition_key, MultiPartitionKey)
+            and partition_key.keys_by_dimension.keys()
+            == {self._primary_dimension.name, self._secondary_dimension.name}
+        ):
+            # like the string representation of a MultiPartitionKey, keys that are strings are
+            # parsed in the order of the dimension names
+            if len(partition_key.split(MULTIPARTITION_KEY_DELIMITER)) != 2:
+                return None
+            partition_key = self._partitions_def.get_partition_key_from_str(partition_key)
+
+        keys_by_dimension = partition_key.keys_by_dimension
+        return (
+            keys_by_dimension[self._primary_dimension.name],
+            keys_by_dimension[self._secondary_dimension.name],
+        )
+
+    def get_partition_keys_not_in_subset(
+        self,
+        current_time: Optional[datetime] = None,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> Iterable[MultiPartitionKey]:
+        return {
+            self._get_multipartition_key(primary_key, secondary_key)
+            for secondary_key in self._secondary_dimension.partitions_def.get_partition_keys(
+                current_time=current_time, dynamic_partitions_store=dynamic_partitions_store
             )
-            if subset
-            else set()
+            for primary_key in self.get_primary_subset(
+                secondary_key
+            ).get_partition_keys_not_in_subset(
+                current_time=current_time, dynamic_partitions_store=dynamic_partitions_store
+            )
+        }
+
+    @public
+    def get_partition_keys(
+        self, current_time: Optional[datetime] = None
+    ) -> Iterable[MultiPartitionKey]:
+        return {
+            self._get_multipartition_key(primary_key, secondary_key)
+            for secondary_key, primary_subset in self._primary_subsets_by_secondary_key.items()
+            for primary_key in primary_subset.get_partition_keys(current_time=current_time)
+        }
+
+    def get_partition_key_ranges(
+        self,
+        current_time: Optional[datetime] = None,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> Sequence[PartitionKeyRange]:
+        partition_keys = self._partitions_def.get_partition_keys(
+            current_time, dynamic_partitions_store=dynamic_partitions_store
+        )
+        cur_range_start = None
+        cur_range_end = None
+        result = []
+        for partition_key in partition_keys:
+            if partition_key in self:
+                if cur_range_start is None:
+                    cur_range_start = partition_key
+                cur_range_end = partition_key
+            else:
+                if cur_range_start is not None and cur_range_end is not None:
+                    result.append(PartitionKeyRange(cur_range_start, cur_range_end))
+                cur_range_start = cur_range_end = None
+
+        if cur_range_start is not None and cur_range_end is not None:
+            result.append(PartitionKeyRange(cur_range_start, cur_range_end))
+
+        return result
+
+    def get_multipartition_keys_with_dimension_value(
+        self, dimension_name: str, dimension_partition_key: str
+    ) -> Sequence[MultiPartitionKey]:
+        """Returns the partition keys in the subset whose key in the given dimension is
+        dimension_partition_key.
+        """
+        check.str_param(dimension_name, "dimension_name")
+        check.str_param(dimension_partition_key, "dimension_partition_key")
+
+        if dimension_name == self._secondary_dimension.name:
+            return [
+                self._get_multipartition_key(primary_key, dimension_partition_key)
+                for primary_key in self.get_primary_subset(
+                    dimension_partition_key
+                ).get_partition_keys()
+            ]
+        elif dimension_name == self._primary_dimension.name:
+            return [
+                self._get_multipartition_key(dimension_partition_key, secondary_key)
+                for secondary_key, primary_subset in self._primary_subsets_by_secondary_key.items()
+                if dimension_partition_key in primary_subset
+            ]
+        check.failed(
+            f"Dimension {dimension_name} not found in MultiPartitionsDefinition with dimensions"
+            f" {self._partitions_def.partition_dimension_names}"
         )
-        super(MultiPartitionsSubset, self).__init__(partitions_def, subset)
 
     def with_partition_keys(self, partition_keys: Iterable[str]) -> "MultiPartitionsSubset":
+        primary_keys_by_secondary_key: Dict[str, List[str]] = defaultdict(list)
+        for partition_key in partition_keys:
+            keys = self._get_primary_and_secondary_key(partition_key)
+            if keys is not None:
+                primary_keys_by_secondary_key[keys[1]].append(keys[0])
+
+        primary_subsets_by_secondary_key = dict(self._primary_subsets_by_secondary_key)
+        for secondary_key, primary_keys in primary_keys_by_secondary_key.items():
+            primary_subsets_by_secondary_key[secondary_key] = self.get_primary_subset(
+                secondary_key
+            ).with_partition_keys(primary_keys)
         return MultiPartitionsSubset(
-            cast(MultiPartitionsDefinition, self._partitions_def),
-            self._subset | set(partition_keys),
+            self._partitions_def, primary_subsets_by_secondary_key=primary_subsets_by_secondary_key
         )
 
+    def with_primary_subset(
+        self, secondary_keys: Iterable[str], primary_subset: PartitionsSubset
+    ) -> "MultiPartitionsSubset":
+        """Returns a subset that additionally contains the partitions of primary_subset combined with
+        each of the given partition keys of the secondary dimension.
+        """
+        primary_subsets_by_secondary_key = dict(self._primary_subsets_by_secondary_key)
+        for secondary_key in secondary_keys:
+            primary_subsets_by_secondary_key[secondary_key] = (
+                self.get_primary_subset(secondary_key) | primary_subset
+            )
+        return MultiPartitionsSubset(
+            self._partitions_def, primary_subsets_by_secondary_key=primary_subsets_by_secondary_key
+        )
+
+    def _get_other_primary_subsets(
+        self, other: PartitionsSubset
+    ) -> Optional[Mapping[str, PartitionsSubset]]:
+        if isinstance(other, MultiPartitionsSubset) and (
+            other.partitions_def is self._partitions_def
+            or other.partitions_def == self._partitions_def
+        ):
+            return other.primary_subsets_by_secondary_key
+        return None
+
+    def __or__(self, other: PartitionsSubset) -> "PartitionsSubset[MultiPartitionKey]":
+        other_primary_subsets = self._get_other_primary_subsets(other)
+        if other_primary_subsets is None:
+            return super().__or__(other)
+
+        primary_subsets_by_secondary_key = dict(self._primary_subsets_by_secondary_key)
+        for secondary_key, other_primary_subset in other_primary_subsets.items():
+            primary_subset = primary_subsets_by_secondary_key.get(secondary_key)
+            primary_subsets_by_secondary_key[secondary_key] = (
+                other_primary_subset
+                if primary_subset is None
+                else primary_subset | other_primary_subset
+            )
+        return MultiPartitionsSubset(
+            self._partitions_def, primary_subsets_by_secondary_key=primary_subsets_by_secondary_key
+        )
+
+    def __and__(self, other: PartitionsSubset) -> "PartitionsSubset[MultiPartitionKey]":
+        other_primary_subsets = self._get_other_primary_subsets(other)
+        if other_primary_subsets is None:
+            return super().__and__(other)
+
+        return MultiPartitionsSubset(
+            self._partitions_def,
+            primary_subsets_by_secondary_key={
+                secondary_key: primary_subset & other_primary_subsets[secondary_key]
+                for secondary_key, primary_subset in self._primary_subsets_by_secondary_key.items()
+                if secondary_key in other_primary_subsets
+            },
+        )
+
+    def __sub__(self, other: PartitionsSubset) -> "PartitionsSubset[MultiPartitionKey]":
+        other_primary_subsets = self._get_other_primary_subsets(other)
+        if other_primary_subsets is None:
+            return super().__sub__(other)
+
+        return MultiPartitionsSubset(
+            self._partitions_def,
+            primary_subsets_by_secondary_key={
+                secondary_key: (
+                    primary_subset - other_primary_subsets[secondary_key]
+                    if secondary_key in other_primary_subsets
+                    else primary_subset
+                )
+                for secondary_key, primary_subset in self._primary_subsets_by_secondary_key.items()
+            },
+        )
+
+    def serialize(self) -> str:
+        # Serialize version number, so attempting to deserialize old versions can be handled gracefully.
+        # Any time the serialization format changes, we should increment the version number.
+        return json.dumps(
+            {
+                "version": self.SERIALIZATION_VERSION,
+                "primary_subsets_by_secondary_key": {
+                    secondary_key: primary_subset.serialize()
+                    for secondary_key, primary_subset in self._primary_subsets_by_secondary_key.items()
+                },
+            }
+        )
+
+    @classmethod
+    def from_serialized(
+        cls, partitions_def: PartitionsDefinition, serialized: str
+    ) -> "MultiPartitionsSubset":
+        partitions_def = check.inst_param(
+            partitions_def, "partitions_def", MultiPartitionsDefinition
+        )
+        # Check the version number, so only valid versions can be deserialized.
+        data = json.loads(serialized)
+
+        if isinstance(data, list):
+            # backwards compatibility
+            return cls(partitions_def, set(data))
+        elif data.get("version") in cls.KEY_LIST_SERIALIZATION_VERSIONS:
+            return cls(partitions_def, set(data["subset"]))
+        elif data.get("version") != cls.SERIALIZATION_VERSION:
+            raise DagsterInvalidDeserializationVersionError(
+                f"Attempted to deserialize partition subset with version {data.get('version')},"
+                f" but only version {cls.SERIALIZATION_VERSION} is supported."
+            )
+
+        primary_partitions_def = partitions_def.primary_dimension.partitions_def
+        return cls(
+            partitions_def,
+            primary_subsets_by_secondary_key={
+                secondary_key: primary_partitions_def.deserialize_subset(serialized_primary_subset)
+                for secondary_key, serialized_primary_subset in data[
+                    "primary_subsets_by_secondary_key"
+                ].items()
+            },
+        )
+
+    @classmethod
+    def can_deserialize(
+        cls,
+        partitions_def: PartitionsDefinition,
+        serialized: str,
+        serialized_partitions_def_unique_id: Optional[str],
+        serialized_partitions_def_class_name: Optional[str],
+    ) -> bool:
+        if (
+            serialized_partitions_def_class_name is not None
+            and serialized_partitions_def_class_name != partitions_def.__class__.__name__
+        ):
+            return False
+
+        data = json.loads(serialized)
+        if isinstance(data, list):
+            return True
+        elif data.get("version") in cls.KEY_LIST_SERIALIZATION_VERSIONS:
+            return data.get("subset") is not None
+        elif data.get("version") != cls.SERIALIZATION_VERSION:
+            return False
+
+        primary_partitions_def = cast(
+            MultiPartitionsDefinition, partitions_def
+        ).primary_dimension.partitions_def
+        return all(
+            primary_partitions_def.can_deserialize_subset(
+                serialized_primary_subset,
+                serialized_partitions_def_unique_id=None,
+                serialized_partitions_def_class_name=None,
+            )
+            for serialized_primary_subset in data["primary_subsets_by_secondary_key"].values()
+        )
+
+    @property
+    def partitions_def(self) -> MultiPartitionsDefinition:
+        return self._partitions_def
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, DefaultPartitionsSubset):
+            return (
+                self._partitions_def == other.partitions_def
+                and self.get_partition_keys() == set(other.get_partition_keys())
+            )
+        return (
+            isinstance(other, MultiPartitionsSubset)
+            and self._partitions_def == other.partitions_def
+            and self._primary_subsets_by_secondary_key == other.primary_subsets_by_secondary_key
+        )
+
+    def __len__(self) -> int:
+        return sum(
+            len(primary_subset)
+            for primary_subset in self._primary_subsets_by_secondary_key.values()
+        )
+
+    def __contains__(self, value) -> bool:
+        if not isinstance(value, str):
+            return False
+        keys = self._get_primary_and_secondary_key(value)
+        if keys is None:
+            return False
+        primary_subset = self._primary_subsets_by_secondary_key.get(keys[1])
+        return primary_subset is not None and keys[0] in primary_subset
+
+    def __repr__(self) -> str:
+        return (
+            "MultiPartitionsSubset(primary_subsets_by_secondary_key="
+            f"{self._primary_subsets_by_secondary_key}, partitions_def={self._partitions_def})"
+        )
+
+    @classmethod
+    def empty_subset(cls, partitions_def: PartitionsDefinition) -> "MultiPartitionsSubset":
+        return cls(check.inst_param(partitions_def, "partitions_def", MultiPartitionsDefinition))
+
 
 def get_tags_from_multi_partition_key(multi_partition_key: MultiPartitionKey) -> Mapping[str, str]:
     check.inst_param(multi_partition_key, "multi_partition_key", MultiPartitionKey)
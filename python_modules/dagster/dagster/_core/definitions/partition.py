@@ -1,6 +1,9 @@
+import base64
 import copy
 import hashlib
 import json
+import re
+import zlib
 from abc import ABC, abstractmethod
 from collections import defaultdict
 from datetime import (
@@ -385,6 +388,25 @@ def get_num_partitions(
         # This ensures that partition counts are correct in the Dagster UI.
         return len(set(self.get_partition_keys(current_time, dynamic_partitions_store)))
 
+    @property
+    def partitions_subset_class(self) -> Type["PartitionsSubset[str]"]:
+        return BitmapPartitionsSubset
+
+    @cached_method
+    def get_partition_key_index(self) -> Mapping[str, int]:
+        """Returns the position of each partition key in the ordered partition keys."""
+        return {partition_key: i for i, partition_key in enumerate(self._partition_keys)}
+
+    def get_serializable_unique_identifier(
+        self, dynamic_partitions_store: Optional[DynamicPartitionsStore] = None
+    ) -> str:
+        return self._get_serializable_unique_identifier()
+
+    @cached_method
+    def _get_serializable_unique_identifier(self) -> str:
+        # the partition keys of a static partitions definition do not change
+        return super().get_serializable_unique_identifier()
+
 
 class CachingDynamicPartitionsLoader(DynamicPartitionsStore):
     """A batch loader that caches the partition keys for a given dynamic partitions definition,
@@ -941,6 +963,20 @@ def __or__(self, other: "PartitionsSubset") -> "PartitionsSubset[T_str]":
             return self
         return self.with_partition_keys(other.get_partition_keys())
 
+    def __and__(self, other: "PartitionsSubset") -> "PartitionsSubset[T_str]":
+        if self is other:
+            return self
+        return self.partitions_def.empty_subset().with_partition_keys(
+            key for key in other.get_partition_keys() if key in self
+        )
+
+    def __sub__(self, other: "PartitionsSubset") -> "PartitionsSubset[T_str]":
+        if self is other:
+            return self.partitions_def.empty_subset()
+        return self.partitions_def.empty_subset().with_partition_keys(
+            key for key in self.get_partition_keys() if key not in other
+        )
+
     @abstractmethod
     def serialize(self) -> str:
         ...
@@ -1125,6 +1161,9 @@ def partitions_def(self) -> PartitionsDefinition[T_str]:
         return self._partitions_def
 
     def __eq__(self, other: object) -> bool:
+        if isinstance(other, PartitionsSubset) and not isinstance(other, DefaultPartitionsSubset):
+            # subsets that are stored in other ways compare their partition keys to this one's
+            return other == self
         return (
             isinstance(other, DefaultPartitionsSubset)
             and self._partitions_def == other._partitions_def
@@ -1145,3 +1184,215 @@ def __repr__(self) -> str:
     @classmethod
     def empty_subset(cls, partitions_def: PartitionsDefinition[T_str]) -> "PartitionsSubset[T_str]":
         return cls(partitions_def=partitions_def)
+
+
+class BitmapPartitionsSubset(PartitionsSubset[str]):
+    """A subset of the partitions of a StaticPartitionsDefinition, stored as a bitmap over the
+    positions of the definition's ordered partition keys.
+
+    Bit i of ``bits`` is set when the i-th partition key of the definition is in the subset, so
+    unions, intersections and differences of subsets of the same definition are single integer
+    operations, and the subset serializes to the compressed bitmap. Keys that are not partition keys
+    of the definition are ignored.
+    """
+
+    # Every time we change the serialization format, we should increment the version number.
+    # This will ensure that we can gracefully degrade when deserializing old data.
+    SERIALIZATION_VERSION = 2
+    # Versions of the DefaultPartitionsSubset format, which stored the partition keys
+    KEY_LIST_SERIALIZATION_VERSIONS = [1]
+
+    def __init__(self, partitions_def: StaticPartitionsDefinition, bits: int = 0):
+        self._partitions_def = check.inst_param(
+            partitions_def, "partitions_def", StaticPartitionsDefinition
+        )
+        self._bits = check.int_param(bits, "bits")
+
+    @property
+    def bits(self) -> int:
+        return self._bits
+
+    def _get_positions(self, bits: int) -> Iterable[int]:
+        # the binary string is read from its lowest bit
+        return (i for i, bit in enumerate(reversed(bin(bits)[2:])) if bit == "1")
+
+    def _get_keys(self, bits: int) -> Sequence[str]:
+        partition_keys = self._partitions_def.get_partition_keys()
+        return [partition_keys[i] for i in self._get_positions(bits)]
+
+    def _all_bits(self) -> int:
+        return (1 << len(self._partitions_def.get_partition_keys())) - 1
+
+    def get_partition_keys_not_in_subset(
+        self,
+        current_time: Optional[datetime] = None,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> Iterable[str]:
+        return set(self._get_keys(self._all_bits() & ~self._bits))
+
+    @public
+    def get_partition_keys(self, current_time: Optional[datetime] = None) -> Iterable[str]:
+        return set(self._get_keys(self._bits))
+
+    def get_partition_key_ranges(
+        self,
+        current_time: Optional[datetime] = None,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> Sequence[PartitionKeyRange]:
+        partition_keys = self._partitions_def.get_partition_keys()
+        return [
+            PartitionKeyRange(partition_keys[match.start()], partition_keys[match.end() - 1])
+            for match in re.finditer("1+", "".join(reversed(bin(self._bits)[2:])))
+        ]
+
+    def with_partition_keys(self, partition_keys: Iterable[str]) -> "BitmapPartitionsSubset":
+        key_index = self._partitions_def.get_partition_key_index()
+        bits = self._bits
+        for partition_key in partition_keys:
+            i = key_index.get(partition_key)
+            if i is not None:
+                bits |= 1 << i
+        return BitmapPartitionsSubset(self._partitions_def, bits)
+
+    def with_partition_key_range(
+        self,
+        partition_key_range: PartitionKeyRange,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> "BitmapPartitionsSubset":
+        key_index = self._partitions_def.get_partition_key_index()
+        start = key_index.get(partition_key_range.start)
+        end = key_index.get(partition_key_range.end)
+        if start is None or end is None:
+            # raises the error for nonexistent keys
+            return cast(
+                BitmapPartitionsSubset, super().with_partition_key_range(partition_key_range)
+            )
+
+        range_bits = ((1 << (end - start + 1)) - 1) << start if end >= start else 0
+        return BitmapPartitionsSubset(self._partitions_def, self._bits | range_bits)
+
+    def _get_other_bits(self, other: PartitionsSubset) -> Optional[int]:
+        if isinstance(other, BitmapPartitionsSubset) and (
+            other.partitions_def is self._partitions_def
+            or other.partitions_def == self._partitions_def
+        ):
+            return other.bits
+        return None
+
+    def __or__(self, other: PartitionsSubset) -> "PartitionsSubset[str]":
+        other_bits = self._get_other_bits(other)
+        if other_bits is None:
+            return super().__or__(other)
+        return BitmapPartitionsSubset(self._partitions_def, self._bits | other_bits)
+
+    def __and__(self, other: PartitionsSubset) -> "PartitionsSubset[str]":
+        other_bits = self._get_other_bits(other)
+        if other_bits is None:
+            return super().__and__(other)
+        return BitmapPartitionsSubset(self._partitions_def, self._bits & other_bits)
+
+    def __sub__(self, other: PartitionsSubset) -> "PartitionsSubset[str]":
+        other_bits = self._get_other_bits(other)
+        if other_bits is None:
+            return super().__sub__(other)
+        return BitmapPartitionsSubset(self._partitions_def, self._bits & ~other_bits)
+
+    def serialize(self) -> str:
+        # Serialize version number, so attempting to deserialize old versions can be handled gracefully.
+        # Any time the serialization format changes, we should increment the version number.
+        num_keys = len(self._partitions_def.get_partition_keys())
+        bitmap = self._bits.to_bytes((num_keys + 7) // 8, "little")
+        return json.dumps(
+            {
+                "version": self.SERIALIZATION_VERSION,
+                "num_keys": num_keys,
+                # the bitmap is only valid for the partition keys that it was created with
+                "partitions_def_id": self._partitions_def.get_serializable_unique_identifier(),
+                "bitmap": base64.b64encode(zlib.compress(bitmap)).decode("utf-8"),
+            }
+        )
+
+    @classmethod
+    def from_serialized(
+        cls, partitions_def: PartitionsDefinition[str], serialized: str
+    ) -> "BitmapPartitionsSubset":
+        partitions_def = check.inst_param(
+            partitions_def, "partitions_def", StaticPartitionsDefinition
+        )
+        # Check the version number, so only valid versions can be deserialized.
+        data = json.loads(serialized)
+
+        if isinstance(data, list):
+            # backwards compatibility
+            return cls.empty_subset(partitions_def).with_partition_keys(data)
+        elif data.get("version") in cls.KEY_LIST_SERIALIZATION_VERSIONS:
+            return cls.empty_subset(partitions_def).with_partition_keys(data["subset"])
+        elif data.get("version") != cls.SERIALIZATION_VERSION:
+            raise DagsterInvalidDeserializationVersionError(
+                f"Attempted to deserialize partition subset with version {data.get('version')},"
+                f" but only version {cls.SERIALIZATION_VERSION} is supported."
+            )
+
+        if data["partitions_def_id"] != partitions_def.get_serializable_unique_identifier():
+            raise DagsterInvalidDeserializationVersionError(
+                "Attempted to deserialize a partition subset of a static partitions definition"
+                " whose partition keys have changed."
+            )
+        bitmap = zlib.decompress(base64.b64decode(data["bitmap"]))
+        return cls(partitions_def, int.from_bytes(bitmap, "little"))
+
+    @classmethod
+    def can_deserialize(
+        cls,
+        partitions_def: PartitionsDefinition,
+        serialized: str,
+        serialized_partitions_def_unique_id: Optional[str],
+        serialized_partitions_def_class_name: Optional[str],
+    ) -> bool:
+        if (
+            serialized_partitions_def_class_name is not None
+            and serialized_partitions_def_class_name != partitions_def.__class__.__name__
+        ):
+            return False
+
+        data = json.loads(serialized)
+        if isinstance(data, list):
+            return True
+        elif data.get("version") in cls.KEY_LIST_SERIALIZATION_VERSIONS:
+            return data.get("subset") is not None
+        return (
+            data.get("version") == cls.SERIALIZATION_VERSION
+            and data.get("partitions_def_id") == partitions_def.get_serializable_unique_identifier()
+        )
+
+    @property
+    def partitions_def(self) -> StaticPartitionsDefinition:
+        return self._partitions_def
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, DefaultPartitionsSubset):
+            return self._partitions_def == other.partitions_def and set(
+                self.get_partition_keys()
+            ) == set(other.get_partition_keys())
+        return (
+            isinstance(other, BitmapPartitionsSubset)
+            and self._partitions_def == other.partitions_def
+            and self._bits == other.bits
+        )
+
+    def __len__(self) -> int:
+        return bin(self._bits).count("1")
+
+    def __contains__(self, value) -> bool:
+        i = self._partitions_def.get_partition_key_index().get(value)
+        return i is not None and bool(self._bits >> i & 1)
+
+    def __repr__(self) -> str:
+        return (
+            f"BitmapPartitionsSubset(subset={self._get_keys(self._bits)},"
+            f" partitions_def={self._partitions_def})"
+        )
+
+    @classmethod
+    def empty_subset(cls, partitions_def: PartitionsDefinition[str]) -> "BitmapPartitionsSubset":
+        return cls(check.inst_param(partitions_def, "partitions_def", StaticPartitionsDefinition))
@@ -1,5 +1,4 @@
 import collections.abc
-import itertools
 import warnings
 from abc import ABC, abstractmethod
 from collections import defaultdict
@@ -24,6 +23,7 @@
 from dagster._core.definitions.multi_dimensional_partitions import (
     MultiPartitionKey,
     MultiPartitionsDefinition,
+    MultiPartitionsSubset,
 )
 from dagster._core.definitions.partition import (
     PartitionsDefinition,
@@ -783,37 +783,55 @@ def _get_dependency_partitions_subset(
                             set(mapped_partitions_result.required_but_nonexistent_partition_keys)
                         )
 
-        b_partition_keys = set()
-
-        mapped_a_dim_names = a_dim_to_dependency_b_dim.keys()
+        mapped_a_dim_names = list(a_dim_to_dependency_b_dim.keys())
         mapped_b_dim_names = [mapping[0] for mapping in a_dim_to_dependency_b_dim.values()]
-        unmapped_b_dim_names = list(
-            set(b_dimension_partitions_def_by_name.keys()) - set(mapped_b_dim_names)
+
+        # The dependency partitions of a partition in a_partitions_def only depend on its keys in
+        # the mapped dimensions, and contain every partition of the unmapped dimensions of
+        # b_partitions_def. Build the subset of b_partitions_def directly from the per-dimension
+        # keys, so that the unmapped dimensions' partitions are not combined with each partition
+        # key of the mapped dimensions.
+        b_primary_dim = b_partitions_def.primary_dimension
+        b_secondary_dim = b_partitions_def.secondary_dimension
+        all_b_keys_by_dim_name = {
+            dim_name: b_dimension_partitions_def_by_name[dim_name].get_partition_keys(
+                current_time=current_time, dynamic_partitions_store=dynamic_partitions_store
+            )
+            for dim_name in b_dimension_partitions_def_by_name.keys()
+            if dim_name not in mapped_b_dim_names
+        }
+
+        all_b_primary_subset = (
+            b_primary_dim.partitions_def.empty_subset().with_partition_keys(
+                all_b_keys_by_dim_name[b_primary_dim.name]
+            )
+            if b_primary_dim.name in all_b_keys_by_dim_name
+            else None
         )
 
-        for key in a_partition_keys:
-            for b_key_values in itertools.product(
-                *(
-                    [
-                        dep_b_keys_by_a_dim_and_key[dim_name][key.keys_by_dimension[dim_name]]
-                        for dim_name in mapped_a_dim_names
-                    ]
-                ),
-                *[
-                    b_dimension_partitions_def_by_name[dim_name].get_partition_keys()
-                    for dim_name in unmapped_b_dim_names
-                ],
-            ):
-                b_partition_keys.add(
-                    MultiPartitionKey(
-                        {
-                            (mapped_b_dim_names + unmapped_b_dim_names)[i]: key
-                            for i, key in enumerate(b_key_values)
-                        }
+        mapped_subset = cast(MultiPartitionsSubset, b_partitions_def.empty_subset())
+        for a_keys in {
+            tuple(key.keys_by_dimension[dim_name] for dim_name in mapped_a_dim_names)
+            for key in a_partition_keys
+        }:
+            b_keys_by_dim_name = {
+                **all_b_keys_by_dim_name,
+                **{
+                    b_dim_name: dep_b_keys_by_a_dim_and_key[a_dim_name][a_key]
+                    for a_dim_name, b_dim_name, a_key in zip(
+                        mapped_a_dim_names, mapped_b_dim_names, a_keys
                     )
-                )
+                },
+            }
+            mapped_subset = mapped_subset.with_primary_subset(
+                b_keys_by_dim_name[b_secondary_dim.name],
+                all_b_primary_subset
+                if all_b_primary_subset is not None
+                else b_primary_dim.partitions_def.empty_subset().with_partition_keys(
+                    b_keys_by_dim_name[b_primary_dim.name]
+                ),
+            )
 
-        mapped_subset = b_partitions_def.empty_subset().with_partition_keys(b_partition_keys)
         if a_upstream_of_b:
             return mapped_subset
         else:
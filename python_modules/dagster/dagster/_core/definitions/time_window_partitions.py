@@ -1,20 +1,22 @@
+import bisect
 import functools
 import hashlib
 import json
+import math
 import re
-from datetime import datetime
+from datetime import datetime, timedelta
 from enum import Enum
 from typing import (
     AbstractSet,
     Any,
     Callable,
     Iterable,
+    Iterator,
     List,
     Mapping,
     NamedTuple,
     Optional,
     Sequence,
-    Tuple,
     Type,
     Union,
     cast,
@@ -25,6 +27,7 @@
 import dagster._check as check
 from dagster._annotations import PublicAttr, public
 from dagster._core.instance import DynamicPartitionsStore
+from dagster._utils.cached_method import cached_method
 from dagster._utils.partitions import DEFAULT_HOURLY_FORMAT_WITHOUT_TIMEZONE
 from dagster._utils.schedules import (
     cron_string_iterator,
@@ -59,6 +62,128 @@ class TimeWindow(NamedTuple):
     end: PublicAttr[datetime]
 
 
+class _FixedIntervalSchedule(
+    NamedTuple(
+        "_FixedIntervalSchedule",
+        [
+            ("unit", str),
+            ("step", int),
+            ("hour", int),
+            ("minute", int),
+            ("day", int),
+            ("first_tick", datetime),
+            ("timezone", str),
+        ],
+    )
+):
+    """The ticks of a cron schedule that ticks at a fixed interval, indexed from the first tick.
+
+    Hourly and sub-hourly ticks are a fixed number of seconds apart. Daily, weekly and monthly
+    ticks are a fixed number of days or months apart in wall-clock time, so DST transitions are
+    handled by localizing each tick: a tick that falls in a DST gap happens at the start of the
+    next hour, matching cron_string_iterator. This lets the index of the tick at or after a given
+    time, and the tick at a given index, be computed without iterating over the ticks in between.
+    """
+
+    @staticmethod
+    def for_cron_schedule(
+        cron_schedule: str, timezone: str, first_tick: datetime
+    ) -> Optional["_FixedIntervalSchedule"]:
+        parts = cron_schedule.split(" ")
+        if len(parts) != 5 or not all(re.fullmatch(r"\d+|\*(/\d+)?", part) for part in parts):
+            return None
+
+        minute, hour, day, month, day_of_week = parts
+        if month != "*":
+            return None
+
+        if minute.startswith("*") and hour == "*" and day == "*" and day_of_week == "*":
+            step = int(minute[2:]) if minute != "*" else 1
+            # croniter steps through the repeated hour of a DST transition in wall-clock time, so
+            # only timezones without DST can be handled with fixed-length ticks
+            if step == 0 or 60 % step != 0 or timezone != "UTC":
+                return None
+            return _FixedIntervalSchedule("minutes", step, 0, 0, 0, first_tick, timezone)
+
+        if not minute.isdigit():
+            return None
+        if hour == "*" and day == "*" and day_of_week == "*":
+            return _FixedIntervalSchedule("hours", 1, 0, int(minute), 0, first_tick, timezone)
+        if not hour.isdigit():
+            return None
+        if day == "*" and day_of_week == "*":
+            return _FixedIntervalSchedule(
+                "days", 1, int(hour), int(minute), 0, first_tick, timezone
+            )
+        if day == "*" and day_of_week.isdigit():
+            return _FixedIntervalSchedule(
+                "days", 7, int(hour), int(minute), 0, first_tick, timezone
+            )
+        # months without the given day are skipped by the schedule, so their ticks are not evenly
+        # spaced
+        if day.isdigit() and 1 <= int(day) <= 28 and day_of_week == "*":
+            return _FixedIntervalSchedule(
+                "months", 1, int(hour), int(minute), int(day), first_tick, timezone
+            )
+        return None
+
+    @property
+    def _seconds_per_tick(self) -> int:
+        return self.step * (60 if self.unit == "minutes" else 3600)
+
+    def tick(self, index: int) -> datetime:
+        if self.unit in ("minutes", "hours"):
+            return pendulum.from_timestamp(
+                self.first_tick.timestamp() + index * self._seconds_per_tick, tz=self.timezone
+            )
+
+        if self.unit == "days":
+            date = self.first_tick.date() + timedelta(days=index * self.step)
+            year, month, day = date.year, date.month, date.day
+        else:
+            year, month = divmod(self.first_tick.year * 12 + self.first_tick.month - 1 + index, 12)
+            month, day = month + 1, self.day
+
+        tick = pendulum.datetime(year, month, day, self.hour, self.minute, tz=self.timezone)
+        if tick.hour != self.hour:
+            # the tick falls in a DST gap, so it happens at the start of the next hour instead
+            tick = tick.replace(minute=0)
+        return tick
+
+    def time_window(self, index: int) -> TimeWindow:
+        return TimeWindow(self.tick(index), self.tick(index + 1))
+
+    def _estimate_index(self, timestamp: float) -> int:
+        if self.unit in ("minutes", "hours"):
+            return math.ceil((timestamp - self.first_tick.timestamp()) / self._seconds_per_tick)
+
+        local_time = pendulum.from_timestamp(timestamp, tz=self.timezone)
+        if self.unit == "days":
+            return (local_time.date() - self.first_tick.date()).days // self.step
+        else:
+            return (local_time.year - self.first_tick.year) * 12 + (
+                local_time.month - self.first_tick.month
+            )
+
+    def index_of_first_tick_after(self, timestamp: float, inclusive: bool = True) -> int:
+        """Returns the index of the first tick at (if inclusive) or after the given timestamp. The
+        index is negative if the tick is before the first tick.
+        """
+
+        def _is_after(index: int) -> bool:
+            tick_timestamp = self.tick(index).timestamp()
+            return tick_timestamp >= timestamp if inclusive else tick_timestamp > timestamp
+
+        # the estimate is at most a tick or two away, since it ignores UTC offsets and the time
+        # of day of the ticks
+        index = self._estimate_index(timestamp)
+        while not _is_after(index):
+            index += 1
+        while _is_after(index - 1):
+            index -= 1
+        return index
+
+
 class TimeWindowPartitionsDefinition(
     PartitionsDefinition,
     NamedTuple(
@@ -165,6 +290,49 @@ def get_current_timestamp(self, current_time: Optional[datetime] = None) -> floa
             else pendulum.now(self.timezone)
         ).timestamp()
 
+    @functools.lru_cache(maxsize=100)
+    def _get_fixed_interval_schedule(self) -> Optional[_FixedIntervalSchedule]:
+        """Returns the ticks of the cron schedule, starting at the start of the first partition, if
+        they are evenly spaced. Otherwise, the partitions can only be found by iterating over the
+        cron schedule.
+        """
+        first_tick = next(iter(self._iterate_time_windows(self.start))).start
+        return _FixedIntervalSchedule.for_cron_schedule(
+            self.cron_schedule, self.timezone, first_tick
+        )
+
+    def _get_num_partitions_for_fixed_interval_schedule(
+        self, fixed_interval_schedule: _FixedIntervalSchedule, current_timestamp: float
+    ) -> int:
+        # partition i ends at tick i + 1, so the partitions that end at or before a time are the
+        # ones before the index of the first tick after it, minus one
+        num_partitions = max(
+            fixed_interval_schedule.index_of_first_tick_after(current_timestamp, inclusive=False)
+            - 1,
+            0,
+        ) + max(self.end_offset, 0)
+        if self.end:
+            num_partitions = min(
+                num_partitions,
+                max(
+                    fixed_interval_schedule.index_of_first_tick_after(
+                        self.end.timestamp(), inclusive=False
+                    )
+                    - 1,
+                    0,
+                ),
+            )
+        if self.end_offset < 0:
+            num_partitions += self.end_offset
+
+        return num_partitions
+
+    def _iterate_partition_keys_between_indexes(
+        self, fixed_interval_schedule: _FixedIntervalSchedule, start_idx: int, end_idx: int
+    ) -> Iterator[str]:
+        for idx in range(start_idx, end_idx):
+            yield fixed_interval_schedule.tick(idx).strftime(self.fmt)
+
     def get_num_partitions(
         self,
         current_time: Optional[datetime] = None,
@@ -175,6 +343,12 @@ def get_num_partitions(
         # string format datetimes.
         current_timestamp = self.get_current_timestamp(current_time=current_time)
 
+        fixed_interval_schedule = self._get_fixed_interval_schedule()
+        if fixed_interval_schedule:
+            return self._get_num_partitions_for_fixed_interval_schedule(
+                fixed_interval_schedule, current_timestamp
+            )
+
         partitions_past_current_time = 0
 
         num_partitions = 0
@@ -206,6 +380,17 @@ def get_partition_keys_between_indexes(
         # partition keys included within the indices.
         current_timestamp = self.get_current_timestamp(current_time=current_time)
 
+        fixed_interval_schedule = self._get_fixed_interval_schedule()
+        if fixed_interval_schedule:
+            num_partitions = self._get_num_partitions_for_fixed_interval_schedule(
+                fixed_interval_schedule, current_timestamp
+            )
+            return list(
+                self._iterate_partition_keys_between_indexes(
+                    fixed_interval_schedule, max(start_idx, 0), min(end_idx, num_partitions)
+                )
+            )
+
         partitions_past_current_time = 0
         partition_keys = []
         reached_end = False
@@ -240,6 +425,17 @@ def get_partition_keys(
     ) -> Sequence[str]:
         current_timestamp = self.get_current_timestamp(current_time=current_time)
 
+        fixed_interval_schedule = self._get_fixed_interval_schedule()
+        if fixed_interval_schedule:
+            num_partitions = self._get_num_partitions_for_fixed_interval_schedule(
+                fixed_interval_schedule, current_timestamp
+            )
+            return list(
+                self._iterate_partition_keys_between_indexes(
+                    fixed_interval_schedule, 0, num_partitions
+                )
+            )
+
         partitions_past_current_time = 0
         partition_keys: List[str] = []
         for time_window in self._iterate_time_windows(self.start):
@@ -315,19 +511,19 @@ def _time_window_for_partition_key(self, *, partition_key: str) -> TimeWindow:
         partition_key_dt = pendulum.instance(
             datetime.strptime(partition_key, self.fmt), tz=self.timezone
         )
+        fixed_interval_schedule = self._get_fixed_interval_schedule()
+        if fixed_interval_schedule:
+            return fixed_interval_schedule.time_window(
+                fixed_interval_schedule.index_of_first_tick_after(partition_key_dt.timestamp())
+            )
         return next(iter(self._iterate_time_windows(partition_key_dt)))
 
     def time_window_for_partition_key(self, partition_key: str) -> TimeWindow:
         return self._time_window_for_partition_key(partition_key=partition_key)
 
-    def time_windows_for_partition_keys(
-        self,
-        partition_keys: Sequence[str],
-    ) -> Sequence[TimeWindow]:
-        if len(partition_keys) == 0:
-            return []
-
-        sorted_pks = sorted(partition_keys, key=lambda pk: datetime.strptime(pk, self.fmt))
+    def _iterate_time_windows_for_sorted_partition_keys(
+        self, sorted_pks: Sequence[str]
+    ) -> List[TimeWindow]:
         cur_windows_iterator = iter(
             self._iterate_time_windows(
                 pendulum.instance(datetime.strptime(sorted_pks[0], self.fmt), tz=self.timezone)
@@ -347,7 +543,49 @@ def time_windows_for_partition_keys(
                     )
                 )
                 partition_key_time_windows.append(next(cur_windows_iterator))
+        return partition_key_time_windows
+
+    def time_windows_for_partition_keys(
+        self,
+        partition_keys: Sequence[str],
+    ) -> Sequence[TimeWindow]:
+        if len(partition_keys) == 0:
+            return []
+
+        sorted_pks = sorted(partition_keys, key=lambda pk: datetime.strptime(pk, self.fmt))
+        fixed_interval_schedule = self._get_fixed_interval_schedule()
+        if fixed_interval_schedule:
+            # the windows of the partitions are the ones with indexes between 0 and the number of
+            # partitions, so they are filtered without finding the first and last partition windows
+            num_partitions = self._get_num_partitions_for_fixed_interval_schedule(
+                fixed_interval_schedule, pendulum.now(self.timezone).timestamp()
+            )
+            if num_partitions <= 0:
+                check.failed("No partitions in the PartitionsDefinition")
+
+            partition_key_time_windows = []
+            idx = None
+            for partition_key in sorted_pks:
+                # like iterating over the windows, the next window is used if it has the key, so
+                # that keys that repeat around a DST transition map to consecutive windows
+                if (
+                    idx is None
+                    or fixed_interval_schedule.tick(idx + 1).strftime(self.fmt) != partition_key
+                ):
+                    idx = fixed_interval_schedule.index_of_first_tick_after(
+                        pendulum.instance(
+                            datetime.strptime(partition_key, self.fmt), tz=self.timezone
+                        ).timestamp()
+                    )
+                else:
+                    idx += 1
+                if 0 <= idx < num_partitions:
+                    partition_key_time_windows.append(fixed_interval_schedule.time_window(idx))
+            return partition_key_time_windows
 
+        partition_key_time_windows = self._iterate_time_windows_for_sorted_partition_keys(
+            sorted_pks
+        )
         start_time_window = self.get_first_partition_window()
         end_time_window = self.get_last_partition_window()
 
@@ -370,6 +608,11 @@ def start_time_for_partition_key(self, partition_key: str) -> datetime:
         )
         # the datetime format might not include granular components, so we need to recover them
         # we make the assumption that the parsed partition key is <= the start datetime
+        fixed_interval_schedule = self._get_fixed_interval_schedule()
+        if fixed_interval_schedule:
+            return fixed_interval_schedule.tick(
+                fixed_interval_schedule.index_of_first_tick_after(partition_key_dt.timestamp())
+            )
         return next(iter(self._iterate_time_windows(partition_key_dt))).start
 
     def get_next_partition_key(
@@ -417,6 +660,27 @@ def get_prev_partition_window(self, start_dt: datetime) -> Optional[TimeWindow]:
     def _get_first_partition_window(self, *, current_time: datetime) -> Optional[TimeWindow]:
         current_timestamp = current_time.timestamp()
 
+        fixed_interval_schedule = self._get_fixed_interval_schedule()
+        if fixed_interval_schedule:
+            # the first window is window 0, which ends at tick 1. With a positive end offset, it
+            # must end by the start of the end_offset-th window after the current time, and
+            # otherwise by the end of the last window that ends at least -end_offset windows
+            # before the current time.
+            if self.end_offset > 0:
+                last_tick_idx = (
+                    fixed_interval_schedule.index_of_first_tick_after(current_timestamp)
+                    + self.end_offset
+                )
+            else:
+                last_tick_idx = (
+                    fixed_interval_schedule.index_of_first_tick_after(
+                        current_timestamp, inclusive=False
+                    )
+                    - 1
+                    + self.end_offset
+                )
+            return fixed_interval_schedule.time_window(0) if last_tick_idx >= 1 else None
+
         time_window = next(iter(self._iterate_time_windows(self.start)))
 
         if self.end_offset == 0:
@@ -471,8 +735,17 @@ def _get_last_partition_window(self, *, current_time: datetime) -> Optional[Time
         if self.end and self.end < current_time:
             current_time = self.end
 
-        if self.end_offset == 0:
+        fixed_interval_schedule = self._get_fixed_interval_schedule()
+        if self.end_offset == 0 and not fixed_interval_schedule:
             return next(iter(self._reverse_iterate_time_windows(current_time)))
+
+        if fixed_interval_schedule:
+            num_partitions = self._get_num_partitions_for_fixed_interval_schedule(
+                fixed_interval_schedule, current_time.timestamp()
+            )
+            if num_partitions <= 0:
+                return None
+            return fixed_interval_schedule.time_window(num_partitions - 1)
         else:
             # TODO: make this efficient
             last_partition_key = super().get_last_partition_key(current_time)
@@ -519,6 +792,18 @@ def end_time_for_partition_key(self, partition_key: str) -> datetime:
         return self.time_window_for_partition_key(partition_key).end
 
     def get_partition_keys_in_time_window(self, time_window: TimeWindow) -> Sequence[str]:
+        fixed_interval_schedule = self._get_fixed_interval_schedule()
+        if fixed_interval_schedule:
+            return list(
+                self._iterate_partition_keys_between_indexes(
+                    fixed_interval_schedule,
+                    fixed_interval_schedule.index_of_first_tick_after(
+                        time_window.start.timestamp()
+                    ),
+                    fixed_interval_schedule.index_of_first_tick_after(time_window.end.timestamp()),
+                )
+            )
+
         result: List[str] = []
         for partition_time_window in self._iterate_time_windows(time_window.start):
             if partition_time_window.start < time_window.end:
@@ -527,7 +812,36 @@ def get_partition_keys_in_time_window(self, time_window: TimeWindow) -> Sequence
                 break
         return result
 
+    def get_num_partitions_in_time_window(self, time_window: TimeWindow) -> int:
+        fixed_interval_schedule = self._get_fixed_interval_schedule()
+        if fixed_interval_schedule:
+            return max(
+                fixed_interval_schedule.index_of_first_tick_after(time_window.end.timestamp())
+                - fixed_interval_schedule.index_of_first_tick_after(time_window.start.timestamp()),
+                0,
+            )
+        return len(self.get_partition_keys_in_time_window(time_window))
+
     def get_partition_key_range_for_time_window(self, time_window: TimeWindow) -> PartitionKeyRange:
+        fixed_interval_schedule = self._get_fixed_interval_schedule()
+        if fixed_interval_schedule:
+            start_idx = (
+                fixed_interval_schedule.index_of_first_tick_after(
+                    time_window.start.timestamp(), inclusive=False
+                )
+                - 1
+            )
+            end_idx = (
+                fixed_interval_schedule.index_of_first_tick_after(
+                    time_window.end.timestamp(), inclusive=False
+                )
+                - 2
+            )
+            return PartitionKeyRange(
+                fixed_interval_schedule.tick(start_idx).strftime(self.fmt),
+                fixed_interval_schedule.tick(end_idx).strftime(self.fmt),
+            )
+
         start_partition_key = self.get_partition_key_for_timestamp(time_window.start.timestamp())
         end_partition_key = self.get_partition_key_for_timestamp(
             cast(TimeWindow, self.get_prev_partition_window(time_window.end)).start.timestamp()
@@ -1359,6 +1673,63 @@ def inner(
     return inner
 
 
+def _merge_time_windows(time_windows: Iterable[TimeWindow]) -> List[TimeWindow]:
+    """Sorts the given time windows and merges the ones that overlap or are adjacent."""
+    result: List[TimeWindow] = []
+    # sorting the concatenation of two sorted lists takes linear time
+    for window in sorted(time_windows):
+        if result and window.start <= result[-1].end:
+            if window.end > result[-1].end:
+                result[-1] = TimeWindow(result[-1].start, window.end)
+        else:
+            result.append(window)
+    return result
+
+
+def _intersect_time_windows(
+    time_windows: Sequence[TimeWindow], other_time_windows: Sequence[TimeWindow]
+) -> List[TimeWindow]:
+    """Intersects two sorted lists of disjoint time windows."""
+    result: List[TimeWindow] = []
+    i = j = 0
+    while i < len(time_windows) and j < len(other_time_windows):
+        start = max(time_windows[i].start, other_time_windows[j].start)
+        end = min(time_windows[i].end, other_time_windows[j].end)
+        if start < end:
+            result.append(TimeWindow(start, end))
+
+        if time_windows[i].end < other_time_windows[j].end:
+            i += 1
+        else:
+            j += 1
+    return result
+
+
+def _subtract_time_windows(
+    time_windows: Sequence[TimeWindow], other_time_windows: Sequence[TimeWindow]
+) -> List[TimeWindow]:
+    """Removes the second of two sorted lists of disjoint time windows from the first."""
+    result: List[TimeWindow] = []
+    j = 0
+    for window in time_windows:
+        start = window.start
+        while j < len(other_time_windows) and other_time_windows[j].end <= start:
+            j += 1
+
+        # windows to subtract can extend past the end of this window, so they're revisited for
+        # the next one
+        k = j
+        while k < len(other_time_windows) and other_time_windows[k].start < window.end:
+            if other_time_windows[k].start > start:
+                result.append(TimeWindow(start, other_time_windows[k].start))
+            start = max(start, other_time_windows[k].end)
+            k += 1
+
+        if start < window.end:
+            result.append(TimeWindow(start, window.end))
+    return result
+
+
 class TimeWindowPartitionsSubset(PartitionsSubset):
     # Every time we change the serialization format, we should increment the version number.
     # This will ensure that we can gracefully degrade when deserializing old data.
@@ -1392,13 +1763,33 @@ def __init__(
     @property
     def included_time_windows(self) -> Sequence[TimeWindow]:
         if self._included_time_windows is None:
-            result_time_windows, _ = self._add_partitions_to_time_windows(
-                initial_windows=[],
-                partition_keys=list(check.not_none(self._included_partition_keys)),
+            self._included_time_windows = _merge_time_windows(
+                self._partitions_def.time_windows_for_partition_keys(
+                    list(check.not_none(self._included_partition_keys))
+                )
             )
-            self._included_time_windows = result_time_windows
         return self._included_time_windows
 
+    @cached_method
+    def _get_included_window_start_timestamps(self) -> Sequence[float]:
+        return [window.start.timestamp() for window in self.included_time_windows]
+
+    def _contains_time_window(self, time_window: TimeWindow) -> bool:
+        # binary search for the last included window that starts at or before the given window
+        idx = (
+            bisect.bisect_right(
+                self._get_included_window_start_timestamps(), time_window.start.timestamp()
+            )
+            - 1
+        )
+        return idx >= 0 and time_window.start < self.included_time_windows[idx].end
+
+    def _get_num_partitions_in_time_windows(self, time_windows: Sequence[TimeWindow]) -> int:
+        return sum(
+            self._partitions_def.get_num_partitions_in_time_window(time_window)
+            for time_window in time_windows
+        )
+
     def _get_partition_time_windows_not_in_subset(
         self,
         current_time: Optional[datetime] = None,
@@ -1473,58 +1864,6 @@ def get_partition_key_ranges(
             for window in self.included_time_windows
         ]
 
-    def _add_partitions_to_time_windows(
-        self, initial_windows: Sequence[TimeWindow], partition_keys: Sequence[str]
-    ) -> Tuple[Sequence[TimeWindow], int]:
-        """Merges a set of partition keys into an existing set of time windows, returning the
-        minimized set of time windows and the number of partitions added.
-        """
-        result_windows = [*initial_windows]
-        time_windows = self._partitions_def.time_windows_for_partition_keys(
-            list(partition_keys),
-        )
-        num_added_partitions = 0
-        for window in sorted(time_windows):
-            # go in reverse order because it's more common to add partitions at the end than the
-            # beginning
-            for i in reversed(range(len(result_windows))):
-                included_window = result_windows[i]
-                lt_end_of_range = window.start < included_window.end
-                gte_start_of_range = window.start >= included_window.start
-
-                if lt_end_of_range and gte_start_of_range:
-                    break
-
-                if not lt_end_of_range:
-                    merge_with_range = included_window.end == window.start
-                    merge_with_later_range = i + 1 < len(result_windows) and (
-                        window.end == result_windows[i + 1].start
-                    )
-
-                    if merge_with_range and merge_with_later_range:
-                        result_windows[i] = TimeWindow(
-                            included_window.start, result_windows[i + 1].end
-                        )
-                        del result_windows[i + 1]
-                    elif merge_with_range:
-                        result_windows[i] = TimeWindow(included_window.start, window.end)
-                    elif merge_with_later_range:
-                        result_windows[i + 1] = TimeWindow(window.start, result_windows[i + 1].end)
-                    else:
-                        result_windows.insert(i + 1, window)
-
-                    num_added_partitions += 1
-                    break
-            else:
-                if result_windows and window.start == result_windows[0].start:
-                    result_windows[0] = TimeWindow(window.start, included_window.end)  # type: ignore
-                else:
-                    result_windows.insert(0, window)
-
-                num_added_partitions += 1
-
-        return result_windows, num_added_partitions
-
     def with_partition_keys(self, partition_keys: Iterable[str]) -> "TimeWindowPartitionsSubset":
         # if we are representing things as a static set of keys, continue doing so
         if self._included_partition_keys is not None:
@@ -1535,14 +1874,102 @@ def with_partition_keys(self, partition_keys: Iterable[str]) -> "TimeWindowParti
                 included_partition_keys=new_partitions,
             )
 
-        result_windows, added_partitions = self._add_partitions_to_time_windows(
-            self.included_time_windows, list(partition_keys)
+        time_windows = self._partitions_def.time_windows_for_partition_keys(list(partition_keys))
+        num_added_partitions = len(
+            {
+                time_window.start.timestamp()
+                for time_window in time_windows
+                if not self._contains_time_window(time_window)
+            }
         )
 
         return TimeWindowPartitionsSubset(
             self._partitions_def,
-            num_partitions=self._num_partitions + added_partitions,
-            included_time_windows=result_windows,
+            num_partitions=self._num_partitions + num_added_partitions,
+            included_time_windows=_merge_time_windows([*self.included_time_windows, *time_windows]),
+        )
+
+    def with_partition_key_range(
+        self,
+        partition_key_range: PartitionKeyRange,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> "PartitionsSubset":
+        first_window = self._partitions_def.get_first_partition_window()
+        last_window = self._partitions_def.get_last_partition_window()
+        if first_window is None or last_window is None:
+            check.failed("No partitions in the PartitionsDefinition")
+
+        # like with_partition_keys, only keep the partitions that exist
+        time_window = TimeWindow(
+            max(
+                self._partitions_def.start_time_for_partition_key(partition_key_range.start),
+                first_window.start,
+            ),
+            min(
+                self._partitions_def.end_time_for_partition_key(partition_key_range.end),
+                last_window.end,
+            ),
+        )
+        if time_window.start >= time_window.end:
+            return self
+
+        return self | TimeWindowPartitionsSubset(
+            self._partitions_def,
+            num_partitions=self._partitions_def.get_num_partitions_in_time_window(time_window),
+            included_time_windows=[time_window],
+        )
+
+    def _get_other_time_windows(self, other: PartitionsSubset) -> Optional[Sequence[TimeWindow]]:
+        if isinstance(other, TimeWindowPartitionsSubset) and (
+            other.partitions_def is self._partitions_def
+            or other.partitions_def == self._partitions_def
+        ):
+            return other.included_time_windows
+        return None
+
+    # The sizes of unions and differences are derived from the size of the intersection, so that
+    # only the partitions in the intersection need to be counted
+
+    def __or__(self, other: PartitionsSubset) -> "PartitionsSubset":
+        other_time_windows = self._get_other_time_windows(other)
+        if other_time_windows is None:
+            return super().__or__(other)
+        return TimeWindowPartitionsSubset(
+            self._partitions_def,
+            num_partitions=len(self)
+            + len(other)
+            - self._get_num_partitions_in_time_windows(
+                _intersect_time_windows(self.included_time_windows, other_time_windows)
+            ),
+            included_time_windows=_merge_time_windows(
+                [*self.included_time_windows, *other_time_windows]
+            ),
+        )
+
+    def __and__(self, other: PartitionsSubset) -> "PartitionsSubset":
+        other_time_windows = self._get_other_time_windows(other)
+        if other_time_windows is None:
+            return super().__and__(other)
+        time_windows = _intersect_time_windows(self.included_time_windows, other_time_windows)
+        return TimeWindowPartitionsSubset(
+            self._partitions_def,
+            num_partitions=self._get_num_partitions_in_time_windows(time_windows),
+            included_time_windows=time_windows,
+        )
+
+    def __sub__(self, other: PartitionsSubset) -> "PartitionsSubset":
+        other_time_windows = self._get_other_time_windows(other)
+        if other_time_windows is None:
+            return super().__sub__(other)
+        return TimeWindowPartitionsSubset(
+            self._partitions_def,
+            num_partitions=len(self)
+            - self._get_num_partitions_in_time_windows(
+                _intersect_time_windows(self.included_time_windows, other_time_windows)
+            ),
+            included_time_windows=_subtract_time_windows(
+                self.included_time_windows, other_time_windows
+            ),
         )
 
     @classmethod
@@ -1568,7 +1995,7 @@ def tuples_to_time_windows(tuples):
             # backwards compatibility
             time_windows = tuples_to_time_windows(loaded)
             num_partitions = sum(
-                len(partitions_def.get_partition_keys_in_time_window(time_window))
+                partitions_def.get_num_partitions_in_time_window(time_window)
                 for time_window in time_windows
             )
         elif isinstance(loaded, dict) and (
@@ -1658,12 +2085,8 @@ def __contains__(self, partition_key: str) -> bool:
         if self._included_partition_keys is not None:
             return partition_key in self._included_partition_keys
 
-        time_window = self._partitions_def.time_window_for_partition_key(partition_key)
-
-        return any(
-            time_window.start >= included_time_window.start
-            and time_window.start < included_time_window.end
-            for included_time_window in self.included_time_windows
+        return self._contains_time_window(
+            self._partitions_def.time_window_for_partition_key(partition_key)
         )
 
     def __repr__(self) -> str:
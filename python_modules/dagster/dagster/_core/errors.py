@@ -594,6 +594,12 @@ def __init__(self, run_id):
         )
 
 
+class DagsterEventLogWriterError(DagsterError):
+    """Raised when events logged during a run could not be written to the event log by the
+    background event log writer, or when the writer has fallen too far behind.
+    """
+
+
 class ScheduleExecutionError(DagsterUserCodeExecutionError):
     """Errors raised in a user process during the execution of schedule."""
 
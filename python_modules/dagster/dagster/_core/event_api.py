@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Callable, Mapping, NamedTuple, Optional, Sequence, Union
+from typing import Callable, Mapping, NamedTuple, Optional, Sequence, Union, cast
 
 from typing_extensions import TypeAlias
 
@@ -9,7 +9,7 @@
 from dagster._core.errors import DagsterInvalidInvocationError
 from dagster._core.events import DagsterEventType
 from dagster._core.events.log import EventLogEntry
-from dagster._serdes import whitelist_for_serdes
+from dagster._serdes import deserialize_value, whitelist_for_serdes
 
 EventHandlerFn: TypeAlias = Callable[[EventLogEntry, str], None]
 
@@ -68,6 +68,88 @@ def asset_observation(self) -> Optional[AssetObservation]:
         return self.event_log_entry.asset_observation
 
 
+class LazyEventLogRecord:
+    """Internal representation of an event record, which exposes the indexed columns of the stored
+    event directly and only deserializes the event body when `event_log_entry` is accessed.
+
+    Records fetched without their event body (see `EventLogStorage.get_lazy_records_for_run`)
+    raise when `event_log_entry` is accessed. Note that `timestamp` is read from the indexed
+    timestamp column, which may only have whole second precision (e.g. in MySQL databases created
+    by older versions), so `event_log_entry.timestamp` should be used where exact times matter.
+
+    Users should not instantiate this class directly.
+    """
+
+    __slots__ = (
+        "storage_id",
+        "run_id",
+        "dagster_event_type",
+        "step_key",
+        "timestamp",
+        "asset_key",
+        "partition_key",
+        "_serialized_event",
+        "_event_log_entry",
+    )
+
+    def __init__(
+        self,
+        storage_id: int,
+        run_id: str,
+        dagster_event_type: Optional[DagsterEventType],
+        step_key: Optional[str],
+        timestamp: float,
+        asset_key: Optional[AssetKey],
+        partition_key: Optional[str],
+        serialized_event: Optional[str] = None,
+        event_log_entry: Optional[EventLogEntry] = None,
+    ):
+        self.storage_id = storage_id
+        self.run_id = run_id
+        self.dagster_event_type = dagster_event_type
+        self.step_key = step_key
+        self.timestamp = timestamp
+        self.asset_key = asset_key
+        self.partition_key = partition_key
+        self._serialized_event = serialized_event
+        self._event_log_entry = event_log_entry
+
+    @property
+    def has_event_log_entry(self) -> bool:
+        return self._event_log_entry is not None or self._serialized_event is not None
+
+    @property
+    def event_log_entry(self) -> EventLogEntry:
+        if self._event_log_entry is None:
+            check.invariant(
+                self._serialized_event is not None,
+                "The event body was not fetched for this record",
+            )
+            self._event_log_entry = deserialize_value(
+                cast(str, self._serialized_event), EventLogEntry
+            )
+            self._serialized_event = None
+        return self._event_log_entry
+
+    def to_event_log_record(self) -> EventLogRecord:
+        return EventLogRecord(storage_id=self.storage_id, event_log_entry=self.event_log_entry)
+
+    @staticmethod
+    def from_event_log_record(record: EventLogRecord) -> "LazyEventLogRecord":
+        entry = record.event_log_entry
+        dagster_event = entry.dagster_event
+        return LazyEventLogRecord(
+            storage_id=record.storage_id,
+            run_id=entry.run_id,
+            dagster_event_type=dagster_event.event_type if dagster_event else None,
+            step_key=dagster_event.step_key if dagster_event else entry.step_key,
+            timestamp=entry.timestamp,
+            asset_key=record.asset_key,
+            partition_key=record.partition_key,
+            event_log_entry=entry,
+        )
+
+
 @whitelist_for_serdes
 class EventRecordsFilter(
     NamedTuple(
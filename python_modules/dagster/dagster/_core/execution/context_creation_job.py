@@ -239,6 +239,8 @@ def execution_context_event_generator(
 
     yield execution_context
     yield from resources_manager.generate_teardown_events()
+    # messages logged after the last dagster event of the process may still be buffered
+    log_manager.flush()
 
 
 class PlanOrchestrationContextManager(ExecutionContextManager[PlanOrchestrationContext]):
@@ -338,6 +340,10 @@ def orchestration_context_event_generator(
 
         if raise_on_error:
             raise dagster_error
+    finally:
+        # the last events of the run (e.g. its success or failure) may still be buffered, or
+        # being written in the background
+        log_manager.flush()
 
 
 class PlanExecutionContextManager(ExecutionContextManager[PlanExecutionContext]):
@@ -135,6 +135,10 @@ def inner_plan_execution_iterator(
                 for hook_event in _trigger_hook(step_context, step_event_list):
                     yield hook_event
 
+                # write out the events of the step before any downstream steps start, in case they
+                # are being buffered or written in the background
+                job_context.log.flush()
+
             try:
                 capture_stack.close()
             except Exception:
@@ -1,9 +1,10 @@
 from collections import defaultdict
 from enum import Enum
-from typing import Any, Dict, Iterable, NamedTuple, Optional, Sequence, cast
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple, Union, cast
 
 import dagster._check as check
 from dagster._core.definitions import ExpectationResult
+from dagster._core.event_api import LazyEventLogRecord
 from dagster._core.events import MARKER_EVENTS, DagsterEventType, StepExpectationResultData
 from dagster._core.events.log import EventLogEntry
 from dagster._core.storage.dagster_run import DagsterRunStatsSnapshot
@@ -20,8 +21,6 @@ def build_run_stats_from_events(
         raise check.ParameterCheckError(
             "Invariant violation for parameter 'records'. Description: Expected iterable."
         ) from exc
-    for i, record in enumerate(records):
-        check.inst_param(record, f"records[{i}]", EventLogEntry)
 
     steps_succeeded = 0
     steps_failed = 0
@@ -32,7 +31,9 @@ def build_run_stats_from_events(
     start_time = None
     end_time = None
 
-    for event in records:
+    # records may be a single-use iterator, so are type checked as they are consumed
+    for i, event in enumerate(records):
+        check.inst_param(event, f"records[{i}]", EventLogEntry)
         if not event.is_dagster_event:
             continue
         dagster_event = event.get_dagster_event()
@@ -88,79 +89,87 @@ class StepEventStatus(Enum):
 
 
 def build_run_step_stats_from_events(
-    run_id: str, records: Iterable[EventLogEntry]
+    run_id: str, records: Iterable[Union[EventLogEntry, LazyEventLogRecord]]
 ) -> Sequence["RunStepKeyStatsSnapshot"]:
+    """Builds per-step stats from the events of a run. Step times are read from the event bodies,
+    rather than the `timestamp` column of `LazyEventLogRecord`s, which may be truncated to whole
+    seconds.
+    """
     by_step_key: Dict[str, Dict[str, Any]] = defaultdict(dict)
     attempts = defaultdict(list)
-    attempt_events = defaultdict(list)
+    attempt_events: Dict[str, List[Tuple[DagsterEventType, float]]] = defaultdict(list)
     markers: Dict[str, Dict[str, Any]] = defaultdict(dict)
-    for event in records:
-        if not event.is_dagster_event:
-            continue
-        dagster_event = event.get_dagster_event()
+    for record in records:
+        if isinstance(record, LazyEventLogRecord):
+            event_type = record.dagster_event_type
+            step_key = record.step_key
+            timestamp = record.event_log_entry.timestamp
+        else:
+            if not record.is_dagster_event:
+                continue
+            event_type = record.get_dagster_event().event_type
+            step_key = record.get_dagster_event().step_key
+            timestamp = record.timestamp
 
-        step_key = dagster_event.step_key
-        if not step_key:
+        if not event_type or not step_key:
             continue
 
-        if dagster_event.event_type == DagsterEventType.STEP_START:
-            by_step_key[step_key]["start_time"] = event.timestamp
+        if event_type == DagsterEventType.STEP_START:
+            by_step_key[step_key]["start_time"] = timestamp
             by_step_key[step_key]["attempts"] = 1
-        if dagster_event.event_type == DagsterEventType.STEP_FAILURE:
-            by_step_key[step_key]["end_time"] = event.timestamp
+        if event_type == DagsterEventType.STEP_FAILURE:
+            by_step_key[step_key]["end_time"] = timestamp
             by_step_key[step_key]["status"] = StepEventStatus.FAILURE
-        if dagster_event.event_type == DagsterEventType.STEP_RESTARTED:
+        if event_type == DagsterEventType.STEP_RESTARTED:
             by_step_key[step_key]["attempts"] = int(by_step_key[step_key].get("attempts") or 0) + 1
-        if dagster_event.event_type == DagsterEventType.STEP_SUCCESS:
-            by_step_key[step_key]["end_time"] = event.timestamp
+        if event_type == DagsterEventType.STEP_SUCCESS:
+            by_step_key[step_key]["end_time"] = timestamp
             by_step_key[step_key]["status"] = StepEventStatus.SUCCESS
-        if dagster_event.event_type == DagsterEventType.STEP_SKIPPED:
-            by_step_key[step_key]["end_time"] = event.timestamp
+        if event_type == DagsterEventType.STEP_SKIPPED:
+            by_step_key[step_key]["end_time"] = timestamp
             by_step_key[step_key]["status"] = StepEventStatus.SKIPPED
-        if dagster_event.event_type == DagsterEventType.ASSET_MATERIALIZATION:
+        if event_type == DagsterEventType.ASSET_MATERIALIZATION:
             materialization_events = by_step_key[step_key].get("materialization_events", [])
-            materialization_events.append(event)
+            materialization_events.append(_get_event_log_entry(record))
             by_step_key[step_key]["materialization_events"] = materialization_events
-        if dagster_event.event_type == DagsterEventType.STEP_EXPECTATION_RESULT:
+        if event_type == DagsterEventType.STEP_EXPECTATION_RESULT:
+            dagster_event = _get_event_log_entry(record).get_dagster_event()
             expectation_data = cast(StepExpectationResultData, dagster_event.event_specific_data)
             expectation_result = expectation_data.expectation_result
             step_expectation_results = by_step_key[step_key].get("expectation_results", [])
             step_expectation_results.append(expectation_result)
             by_step_key[step_key]["expectation_results"] = step_expectation_results
-        if dagster_event.event_type in (
+        if event_type in (
             DagsterEventType.STEP_UP_FOR_RETRY,
             DagsterEventType.STEP_RESTARTED,
         ):
-            attempt_events[step_key].append(event)
-        if dagster_event.event_type in MARKER_EVENTS:
-            if dagster_event.engine_event_data.marker_start:
-                key = dagster_event.engine_event_data.marker_start
+            attempt_events[step_key].append((event_type, timestamp))
+        if event_type in MARKER_EVENTS:
+            engine_event_data = _get_event_log_entry(record).get_dagster_event().engine_event_data
+            if engine_event_data.marker_start:
+                key = engine_event_data.marker_start
                 if key not in markers[step_key]:
-                    markers[step_key][key] = {"key": key, "start": event.timestamp}
+                    markers[step_key][key] = {"key": key, "start": timestamp}
                 else:
-                    markers[step_key][key]["start"] = event.timestamp
+                    markers[step_key][key]["start"] = timestamp
 
-            if dagster_event.engine_event_data.marker_end:
-                key = dagster_event.engine_event_data.marker_end
+            if engine_event_data.marker_end:
+                key = engine_event_data.marker_end
                 if key not in markers[step_key]:
-                    markers[step_key][key] = {"key": key, "end": event.timestamp}
+                    markers[step_key][key] = {"key": key, "end": timestamp}
                 else:
-                    markers[step_key][key]["end"] = event.timestamp
+                    markers[step_key][key]["end"] = timestamp
 
     for step_key, step_stats in by_step_key.items():
         events = attempt_events[step_key]
         step_attempts = []
         attempt_start = step_stats.get("start_time")
 
-        for event in events:
-            if not event.dagster_event:
-                continue
-            if event.dagster_event.event_type == DagsterEventType.STEP_UP_FOR_RETRY:
-                step_attempts.append(
-                    RunStepMarker(start_time=attempt_start, end_time=event.timestamp)
-                )
-            elif event.dagster_event.event_type == DagsterEventType.STEP_RESTARTED:
-                attempt_start = event.timestamp
+        for event_type, timestamp in events:
+            if event_type == DagsterEventType.STEP_UP_FOR_RETRY:
+                step_attempts.append(RunStepMarker(start_time=attempt_start, end_time=timestamp))
+            elif event_type == DagsterEventType.STEP_RESTARTED:
+                attempt_start = timestamp
         if step_stats.get("end_time"):
             step_attempts.append(
                 RunStepMarker(start_time=attempt_start, end_time=step_stats["end_time"])
@@ -184,6 +193,10 @@ def build_run_step_stats_from_events(
     ]
 
 
+def _get_event_log_entry(record: Union[EventLogEntry, LazyEventLogRecord]) -> EventLogEntry:
+    return record.event_log_entry if isinstance(record, LazyEventLogRecord) else record
+
+
 @whitelist_for_serdes
 class RunStepMarker(
     NamedTuple(
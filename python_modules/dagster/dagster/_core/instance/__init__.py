@@ -1,7 +1,9 @@
 import logging
 import logging.config
 import os
+import queue
 import sys
+import threading
 import time
 import weakref
 from abc import abstractmethod
@@ -17,6 +19,7 @@
     Dict,
     Generic,
     Iterable,
+    Iterator,
     List,
     Mapping,
     Optional,
@@ -36,6 +39,7 @@
 from dagster._core.definitions.data_version import extract_data_provenance_from_entry
 from dagster._core.definitions.events import AssetKey
 from dagster._core.errors import (
+    DagsterEventLogWriterError,
     DagsterHomeNotSetError,
     DagsterInvalidInvocationError,
     DagsterInvariantViolationError,
@@ -63,7 +67,7 @@
     RESUME_RETRY_TAG,
     ROOT_RUN_ID_TAG,
 )
-from dagster._serdes import ConfigurableClass
+from dagster._serdes import ConfigurableClass, SerdesCodec, get_serdes_codec
 from dagster._seven import get_current_datetime_in_utc
 from dagster._utils import PrintFn, traced
 from dagster._utils.backcompat import deprecation_warning, experimental_functionality_warning
@@ -96,7 +100,7 @@
         RepositoryLoadData,
     )
     from dagster._core.definitions.run_request import InstigatorType
-    from dagster._core.event_api import EventHandlerFn
+    from dagster._core.event_api import EventHandlerFn, LazyEventLogRecord
     from dagster._core.events import DagsterEvent, DagsterEventType, EngineEventData
     from dagster._core.events.log import EventLogEntry
     from dagster._core.execution.backfill import BulkActionStatus, PartitionBackfill
@@ -140,7 +144,7 @@
     from dagster._core.storage.runs import RunStorage
     from dagster._core.storage.runs.base import RunGroupInfo
     from dagster._core.storage.schedules import ScheduleStorage
-    from dagster._core.storage.sql import AlembicVersion
+    from dagster._core.storage.sql import AlembicVersion, SqlPoolStats
     from dagster._core.workspace.workspace import IWorkspace
     from dagster._daemon.types import DaemonHeartbeat, DaemonStatus
 
@@ -181,12 +185,38 @@ def _format_field_diff(field_diff: Mapping[str, Tuple[Any, Any]]) -> str:
 
 
 class _EventListenerLogHandler(logging.Handler):
-    def __init__(self, instance: "DagsterInstance"):
+    """Writes the events logged during a run to the instance.
+
+    By default every event is written as soon as it is logged.  When buffering is enabled, plain
+    log messages are held in memory and written to the event log in batches, once
+    ``max_buffered_events`` messages have accumulated or ``flush_interval_seconds`` after the first
+    message was buffered, whichever comes first.  The interval is enforced by a timer, so buffered
+    messages are written even if nothing else is logged.  Dagster events are the source of truth for run and step state and are
+    never held back: logging one writes any buffered messages ahead of it in the same batch, which
+    preserves the order (and so the storage ids) in which events were logged.
+    """
+
+    def __init__(
+        self,
+        instance: "DagsterInstance",
+        max_buffered_events: int = 0,
+        flush_interval_seconds: float = 0,
+    ):
         self._instance = instance
+        self._max_buffered_events = check.int_param(max_buffered_events, "max_buffered_events")
+        self._flush_interval_seconds = check.numeric_param(
+            flush_interval_seconds, "flush_interval_seconds"
+        )
+        self._buffer: List["EventLogEntry"] = []
+        self._last_flush_time = time.monotonic()
+        self._flush_timer: Optional[threading.Timer] = None
         super(_EventListenerLogHandler, self).__init__()
 
+    @property
+    def is_buffered(self) -> bool:
+        return self._max_buffered_events > 1
+
     def emit(self, record: DagsterLogRecord) -> None:
-        from dagster._core.events import EngineEventData
         from dagster._core.events.log import StructuredLoggerMessage, construct_event_record
 
         event = construct_event_record(
@@ -199,16 +229,55 @@ def emit(self, record: DagsterLogRecord) -> None:
             )
         )
 
+        if not self.is_buffered:
+            self._write_events([event])
+            return
+
+        self._buffer.append(event)
+        if (
+            event.is_dagster_event
+            or len(self._buffer) >= self._max_buffered_events
+            or time.monotonic() - self._last_flush_time >= self._flush_interval_seconds
+        ):
+            self._flush_buffer()
+        elif self._flush_timer is None:
+            self._flush_timer = threading.Timer(self._flush_interval_seconds, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def flush(self) -> None:
+        self.acquire()
         try:
-            self._instance.handle_new_event(event)
+            self._flush_buffer()
+        finally:
+            self.release()
+
+    def _flush_buffer(self) -> None:
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        events, self._buffer = self._buffer, []
+        self._last_flush_time = time.monotonic()
+        if events:
+            self._write_events(events)
+
+    def _write_events(self, events: Sequence["EventLogEntry"]) -> None:
+        from dagster._core.events import EngineEventData
+
+        try:
+            if len(events) == 1:
+                self._instance.handle_new_event(events[0])
+            else:
+                self._instance.handle_new_events(events)
         except Exception as e:
             sys.stderr.write(f"Exception while writing logger call to event log: {e}\n")
-            if event.dagster_event:
+            if any(event.dagster_event for event in events):
                 # Swallow user-generated log failures so that the entire step/run doesn't fail, but
                 # raise failures writing system-generated log events since they are the source of
                 # truth for the state of the run
                 raise
-            elif event.run_id:
+            elif events[-1].run_id:
+                event = events[-1]
                 self._instance.report_engine_event(
                     "Exception while writing logger call to event log",
                     job_name=event.job_name,
@@ -220,6 +289,121 @@ def emit(self, record: DagsterLogRecord) -> None:
                 )
 
 
+class _BackgroundEventListenerLogHandler(_EventListenerLogHandler):
+    """Hands the events logged during a run off to a background writer thread, so that steps do
+    not wait on the event log storage.
+
+    Logged events (including dagster events) are put on a queue of at most ``max_queued_events``
+    events, which the writer thread drains in order, writing up to ``max_buffered_events`` events
+    in each batch.  When the queue is full, logging blocks until the writer catches up, and fails
+    with a ``DagsterEventLogWriterError`` if it has not after ``max_queue_wait_seconds``.  Failures
+    to write dagster events are raised from the next call that logs an event or flushes events.
+
+    ``flush_events`` waits until every queued event has been written.  The executors flush at the
+    end of each step and at the end of the run, so that the events of a step are in the event log
+    before the steps downstream of it start, and before the run is reported as finished.
+    ``flush``, the standard ``logging.Handler`` method, does not wait for queued events (see
+    ``flush``), so callers that need queued events to be written must use ``flush_events`` or
+    ``DagsterLogManager.flush``.
+    """
+
+    def __init__(
+        self,
+        instance: "DagsterInstance",
+        max_buffered_events: int,
+        max_queued_events: int,
+        max_queue_wait_seconds: float,
+    ):
+        super(_BackgroundEventListenerLogHandler, self).__init__(
+            instance, max_buffered_events=max_buffered_events
+        )
+        self._queue: "queue.Queue[EventLogEntry]" = queue.Queue(
+            maxsize=check.int_param(max_queued_events, "max_queued_events")
+        )
+        self._max_queue_wait_seconds = check.numeric_param(
+            max_queue_wait_seconds, "max_queue_wait_seconds"
+        )
+        # INVARIANT: _writer_lock protects _writer_thread, which is running whenever there are
+        # events on the queue
+        self._writer_lock = threading.Lock()
+        self._writer_thread: Optional[threading.Thread] = None
+        self._writer_error: Optional[BaseException] = None
+
+    def emit(self, record: DagsterLogRecord) -> None:
+        from dagster._core.events.log import StructuredLoggerMessage, construct_event_record
+
+        self._raise_writer_error()
+        event = construct_event_record(
+            StructuredLoggerMessage(
+                name=record.name,
+                message=record.msg,
+                level=record.levelno,
+                meta=record.dagster_meta,  # type: ignore
+                record=record,
+            )
+        )
+
+        try:
+            self._queue.put(event, timeout=self._max_queue_wait_seconds)
+        except queue.Full:
+            raise DagsterEventLogWriterError(
+                f"Timed out after {self._max_queue_wait_seconds} seconds waiting for the background"
+                f" event log writer, which is {self._queue.maxsize} events behind. Increase"
+                " max_queue_wait_seconds in the event_log_buffer settings of the instance, or"
+                " disable write_in_background."
+            )
+
+        with self._writer_lock:
+            if self._writer_thread is None:
+                self._writer_thread = threading.Thread(
+                    target=self._write_queued_events, name="event-log-writer", daemon=True
+                )
+                self._writer_thread.start()
+
+    def flush(self) -> None:
+        # The logging module flushes handlers while holding its module lock (e.g. in
+        # logging.shutdown), which the writer thread may be waiting on, so this must not wait for
+        # the queue to be drained. Dagster waits for the queued events with flush_events instead.
+        pass
+
+    def flush_events(self) -> None:
+        self.acquire()
+        try:
+            self._queue.join()
+            self._raise_writer_error()
+        finally:
+            self.release()
+
+    def _raise_writer_error(self) -> None:
+        error, self._writer_error = self._writer_error, None
+        if error:
+            raise DagsterEventLogWriterError(
+                "Exception while writing events to the event log in the background"
+            ) from error
+
+    def _write_queued_events(self) -> None:
+        while True:
+            with self._writer_lock:
+                if self._queue.empty():
+                    self._writer_thread = None
+                    return
+
+            events = [self._queue.get()]
+            while len(events) < self._max_buffered_events:
+                try:
+                    events.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            try:
+                self._write_events(events)
+            except Exception as e:
+                self._writer_error = e
+            finally:
+                for _ in events:
+                    self._queue.task_done()
+
+
 class InstanceType(Enum):
     PERSISTENT = "PERSISTENT"
     EPHEMERAL = "EPHEMERAL"
@@ -883,6 +1067,14 @@ def auto_materialize_minimum_interval_seconds(self) -> int:
     def auto_materialize_run_tags(self) -> Dict[str, str]:
         return self.get_settings("auto_materialize").get("run_tags", {})
 
+    @property
+    def event_log_buffer_settings(self) -> Any:
+        return self.get_settings("event_log_buffer")
+
+    @property
+    def serdes_codec(self) -> SerdesCodec:
+        return get_serdes_codec(self._settings.get("serdes_codec") if self._settings else None)
+
     # python logs
 
     @property
@@ -927,6 +1119,22 @@ def optimize_for_webserver(self, statement_timeout: int, pool_recycle: int) -> N
             statement_timeout=statement_timeout, pool_recycle=pool_recycle
         )
 
+    def get_storage_pool_stats(self) -> Mapping[str, "SqlPoolStats"]:
+        """Connection pool statistics of the instance's storages, keyed by storage type, for the
+        storages that connect to a database server.
+        """
+        storages = {
+            "run_storage": self._run_storage,
+            "event_log_storage": self._event_storage,
+            "schedule_storage": self._schedule_storage,
+        }
+        pool_stats = {}
+        for name, storage in storages.items():
+            stats = storage.get_pool_stats() if storage else None
+            if stats:
+                pool_stats[name] = stats
+        return pool_stats
+
     def reindex(self, print_fn: PrintFn = lambda _: None) -> None:
         print_fn("Checking for reindexing...")
         self._event_storage.reindex_events(print_fn)
@@ -1753,6 +1961,41 @@ def get_records_for_run(
     ) -> "EventLogConnection":
         return self._event_storage.get_records_for_run(run_id, cursor, of_type, limit, ascending)
 
+    def iterate_records_for_run(
+        self,
+        run_id: str,
+        cursor: Optional[str] = None,
+        of_type: Optional[Union["DagsterEventType", Set["DagsterEventType"]]] = None,
+        page_size: Optional[int] = None,
+    ) -> Iterator["EventLogRecord"]:
+        """Iterate over the event log records of a run in storage id order, fetching them from
+        storage in pages of `page_size` records.
+        """
+        if page_size is None:
+            return self._event_storage.iterate_records_for_run(run_id, cursor, of_type)
+        return self._event_storage.iterate_records_for_run(run_id, cursor, of_type, page_size)
+
+    @traced
+    def get_lazy_records_for_run(
+        self,
+        run_id: str,
+        cursor: Optional[str] = None,
+        of_type: Optional[Union["DagsterEventType", Set["DagsterEventType"]]] = None,
+        limit: Optional[int] = None,
+        ascending: bool = True,
+        step_keys: Optional[Sequence[str]] = None,
+        include_event_body: bool = True,
+    ) -> Sequence["LazyEventLogRecord"]:
+        return self._event_storage.get_lazy_records_for_run(
+            run_id,
+            cursor,
+            of_type,
+            limit,
+            ascending,
+            step_keys=step_keys,
+            include_event_body=include_event_body,
+        )
+
     def watch_event_logs(self, run_id: str, cursor: Optional[str], cb: "EventHandlerFn") -> None:
         return self._event_storage.watch(run_id, cursor, cb)
 
@@ -2065,7 +2308,24 @@ def _get_yaml_python_handlers(self) -> Sequence[logging.Handler]:
         return []
 
     def _get_event_log_handler(self) -> _EventListenerLogHandler:
-        event_log_handler = _EventListenerLogHandler(self)
+        buffer_settings = self.event_log_buffer_settings
+        if buffer_settings.get("enabled", False) and buffer_settings.get(
+            "write_in_background", False
+        ):
+            event_log_handler = _BackgroundEventListenerLogHandler(
+                self,
+                max_buffered_events=buffer_settings.get("max_buffered_events", 100),
+                max_queued_events=buffer_settings.get("max_queued_events", 10000),
+                max_queue_wait_seconds=buffer_settings.get("max_queue_wait_seconds", 60.0),
+            )
+        elif buffer_settings.get("enabled", False):
+            event_log_handler = _EventListenerLogHandler(
+                self,
+                max_buffered_events=buffer_settings.get("max_buffered_events", 100),
+                flush_interval_seconds=buffer_settings.get("flush_interval_seconds", 1.0),
+            )
+        else:
+            event_log_handler = _EventListenerLogHandler(self)
         event_log_handler.setLevel(10)
         return event_log_handler
 
@@ -2088,6 +2348,18 @@ def handle_new_event(self, event: "EventLogEntry") -> None:
         for sub in self._subscribers[run_id]:
             sub(event)
 
+    def handle_new_events(self, events: Sequence["EventLogEntry"]) -> None:
+        """Handle a batch of new events, storing them with a single call to the event log storage.
+        """
+        self._event_storage.store_events(events)
+
+        for event in events:
+            if event.is_dagster_event and event.get_dagster_event().is_job_event:
+                self._run_storage.handle_run_event(event.run_id, event.get_dagster_event())
+
+            for sub in self._subscribers[event.run_id]:
+                sub(event)
+
     def add_event_listener(self, run_id: str, cb) -> None:
         self._subscribers[run_id].append(cb)
 
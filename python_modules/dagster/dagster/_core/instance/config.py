@@ -7,7 +7,16 @@
     Bool,
     _check as check,
 )
-from dagster._config import Field, Permissive, ScalarUnion, Selector, StringSource, validate_config
+from dagster._config import (
+    Enum,
+    EnumValue,
+    Field,
+    Permissive,
+    ScalarUnion,
+    Selector,
+    StringSource,
+    validate_config,
+)
 from dagster._core.errors import DagsterInvalidConfigError
 from dagster._core.storage.config import mysql_config, pg_config
 from dagster._serdes import class_from_code_pointer
@@ -365,4 +374,38 @@ def dagster_instance_config_schema() -> Mapping[str, Field]:
                 "run_tags": Field(dict, is_required=False),
             }
         ),
+        "event_log_buffer": Field(
+            {
+                "enabled": Field(Bool, is_required=False),
+                "max_buffered_events": Field(int, is_required=False),
+                "flush_interval_seconds": Field(
+                    float,
+                    is_required=False,
+                    description=(
+                        "The longest time that a buffered log message is held before it is written"
+                        " to the event log."
+                    ),
+                ),
+                "write_in_background": Field(
+                    Bool,
+                    is_required=False,
+                    description=(
+                        "Write events to the event log from a background thread. Logging handler"
+                        " flushes (logging.Handler.flush) do not wait for queued events to be"
+                        " written; the run's log manager flushes them at the end of each step and"
+                        " at the end of the run."
+                    ),
+                ),
+                "max_queued_events": Field(int, is_required=False),
+                "max_queue_wait_seconds": Field(float, is_required=False),
+            },
+            is_required=False,
+        ),
+        "serdes_codec": Field(
+            Enum(
+                "SerdesCodec",
+                [EnumValue("json"), EnumValue("orjson"), EnumValue("msgpack")],
+            ),
+            is_required=False,
+        ),
     }
@@ -454,6 +454,8 @@ def from_dir(
             "schedules",
             "nux",
             "auto_materialize",
+            "event_log_buffer",
+            "serdes_codec",
         }
         settings = {key: config_value.get(key) for key in settings_keys if config_value.get(key)}
 
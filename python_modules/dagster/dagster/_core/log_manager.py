@@ -297,6 +297,22 @@ def emit(self, record: logging.LogRecord) -> None:
         finally:
             self._should_capture = True
 
+    def flush(self) -> None:
+        """Flush the built-in handlers, writing out any events that they have buffered."""
+        for handler in self._handlers:
+            handler.flush()
+
+    def flush_events(self) -> None:
+        """Flush the built-in handlers, and wait for the events of any handlers that write them in
+        the background to be written.
+        """
+        for handler in self._handlers:
+            flush_events = getattr(handler, "flush_events", None)
+            if flush_events:
+                flush_events()
+            else:
+                handler.flush()
+
 
 class DagsterLogManager(logging.Logger):
     """Centralized dispatch for logging from user code.
@@ -392,6 +408,12 @@ def end_python_log_capture(self) -> None:
         for logger in self._managed_loggers:
             logger.removeHandler(self._dagster_handler)
 
+    def flush(self) -> None:
+        """Write out any log messages that have been buffered by the handlers of this log manager,
+        e.g. when event log buffering is enabled on the instance.
+        """
+        self._dagster_handler.flush_events()
+
     def log_dagster_event(
         self, level: Union[str, int], msg: str, dagster_event: "DagsterEvent"
     ) -> None:
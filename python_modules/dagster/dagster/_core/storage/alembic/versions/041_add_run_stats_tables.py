@@ -0,0 +1,81 @@
+"""add run stats tables
+
+Revision ID: 9c6f1ee8f2a4
+Revises: 5771160a95ad
+Create Date: 2023-06-12 14:03:51.412877
+
+"""
+import sqlalchemy as db
+from alembic import op
+from dagster._core.storage.migration.utils import has_index, has_table
+from sqlalchemy.dialects import sqlite
+
+# revision identifiers, used by Alembic.
+revision = "9c6f1ee8f2a4"
+down_revision = "5771160a95ad"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if not has_table("run_stats"):
+        op.create_table(
+            "run_stats",
+            db.Column(
+                "id",
+                db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+                primary_key=True,
+                autoincrement=True,
+            ),
+            db.Column("run_id", db.String(255), nullable=False, unique=True),
+            db.Column("steps_succeeded", db.Integer, nullable=False, default=0),
+            db.Column("steps_failed", db.Integer, nullable=False, default=0),
+            db.Column("materializations", db.Integer, nullable=False, default=0),
+            db.Column("expectations", db.Integer, nullable=False, default=0),
+            db.Column("enqueued_time", db.Float),
+            db.Column("launch_time", db.Float),
+            db.Column("start_time", db.Float),
+            db.Column("end_time", db.Float),
+        )
+
+        if has_table("secondary_indexes"):
+            # the tables are backfilled by the run_stats data migration, which must be applied
+            # after the tables have been created
+            op.execute(db.text("DELETE FROM secondary_indexes WHERE name = 'run_stats'"))
+
+    if not has_table("run_step_stats"):
+        op.create_table(
+            "run_step_stats",
+            db.Column(
+                "id",
+                db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+                primary_key=True,
+                autoincrement=True,
+            ),
+            db.Column("run_id", db.String(255), nullable=False),
+            db.Column("step_key", db.Text, nullable=False),
+            db.Column("status", db.String(63)),
+            db.Column("start_time", db.Float),
+            db.Column("end_time", db.Float),
+            db.Column("attempts", db.Integer),
+            db.Column("attempt_start_time", db.Float),
+            db.Column("attempts_list", db.Text),
+            db.Column("markers", db.Text),
+        )
+        op.create_index(
+            "idx_run_step_stats",
+            "run_step_stats",
+            ["run_id", "step_key"],
+            mysql_length={"step_key": 255},
+            unique=True,
+        )
+
+
+def downgrade():
+    if has_table("run_stats"):
+        op.drop_table("run_stats")
+
+    if has_table("run_step_stats"):
+        if has_index("run_step_stats", "idx_run_step_stats"):
+            op.drop_index("idx_run_step_stats", "run_step_stats")
+        op.drop_table("run_step_stats")
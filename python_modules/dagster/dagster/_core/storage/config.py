@@ -2,13 +2,67 @@
 
 from typing_extensions import TypedDict
 
-from dagster._config import Field, IntSource, Permissive, Selector, StringSource
+from dagster._config import Field, IntSource, Permissive, StringSource
 from dagster._config.config_schema import UserConfigSchema
 
 
+class SqlPoolConfig(TypedDict, total=False):
+    pool_size: int
+    max_overflow: int
+    pool_timeout: float
+    pool_recycle: int
+    pool_pre_ping: bool
+
+
+def sql_pool_config() -> Field:
+    return Field(
+        {
+            "pool_size": Field(
+                IntSource,
+                is_required=False,
+                description="The number of connections to keep open.",
+            ),
+            "max_overflow": Field(
+                IntSource,
+                is_required=False,
+                description=(
+                    "The number of connections that can be opened beyond pool_size when all of"
+                    " the pooled connections are in use."
+                ),
+            ),
+            "pool_timeout": Field(
+                float,
+                is_required=False,
+                description=(
+                    "How many seconds to wait for a connection when the pool is exhausted before"
+                    " failing."
+                ),
+            ),
+            "pool_recycle": Field(
+                IntSource,
+                is_required=False,
+                description=(
+                    "Replace pooled connections after they have been open this many seconds."
+                ),
+            ),
+            "pool_pre_ping": Field(
+                bool,
+                is_required=False,
+                description="Test pooled connections for liveness before each use.",
+            ),
+        },
+        is_required=False,
+        description=(
+            "Connection pool settings. By default, the storage does not hold any connections open"
+            " and opens a new connection for every use."
+        ),
+    )
+
+
 class MySqlStorageConfig(TypedDict):
     mysql_url: str
     mysql_db: "MySqlStorageConfigDb"
+    pool: SqlPoolConfig
 
 
 class MySqlStorageConfigDb(TypedDict):
@@ -20,23 +74,26 @@ class MySqlStorageConfigDb(TypedDict):
 
 
 def mysql_config() -> UserConfigSchema:
-    return Selector(
-        {
-            "mysql_url": StringSource,
-            "mysql_db": {
+    return {
+        "mysql_url": Field(StringSource, is_required=False),
+        "mysql_db": Field(
+            {
                 "username": StringSource,
                 "password": StringSource,
                 "hostname": StringSource,
                 "db_name": StringSource,
                 "port": Field(IntSource, is_required=False, default_value=3306),
             },
-        }
-    )
+            is_required=False,
+        ),
+        "pool": sql_pool_config(),
+    }
 
 
 class PostgresStorageConfig(TypedDict):
     postgres_url: str
     postgres_db: "PostgresStorageConfigDb"
+    pool: SqlPoolConfig
 
 
 class PostgresStorageConfigDb(TypedDict):
@@ -65,4 +122,5 @@ def pg_config() -> UserConfigSchema:
             is_required=False,
         ),
         "should_autocreate_tables": Field(bool, is_required=False, default_value=True),
+        "pool": sql_pool_config(),
     }
@@ -4,6 +4,7 @@
 from typing import (
     TYPE_CHECKING,
     Iterable,
+    Iterator,
     Mapping,
     NamedTuple,
     Optional,
@@ -16,7 +17,12 @@
 import dagster._check as check
 from dagster._core.assets import AssetDetails
 from dagster._core.definitions.events import AssetKey
-from dagster._core.event_api import EventHandlerFn, EventLogRecord, EventRecordsFilter
+from dagster._core.event_api import (
+    EventHandlerFn,
+    EventLogRecord,
+    EventRecordsFilter,
+    LazyEventLogRecord,
+)
 from dagster._core.events import DagsterEventType
 from dagster._core.execution.stats import (
     RunStepKeyStatsSnapshot,
@@ -25,11 +31,13 @@
 )
 from dagster._core.instance import MayHaveInstanceWeakref, T_DagsterInstance
 from dagster._core.storage.dagster_run import DagsterRunStatsSnapshot
-from dagster._core.storage.sql import AlembicVersion
+from dagster._core.storage.sql import AlembicVersion, SqlPoolStats
 from dagster._seven import json
 from dagster._utils import PrintFn
 from dagster._utils.concurrency import ConcurrencyClaimStatus, ConcurrencyKeyInfo
 
+DEFAULT_RECORDS_PAGE_SIZE = 1000
+
 if TYPE_CHECKING:
     from dagster._core.events.log import EventLogEntry
     from dagster._core.storage.partition_status_cache import AssetStatusCacheValue
@@ -199,21 +207,82 @@ def get_records_for_run(
             limit (Optional[int]): Max number of records to return.
         """
 
+    def iterate_records_for_run(
+        self,
+        run_id: str,
+        cursor: Optional[str] = None,
+        of_type: Optional[Union[DagsterEventType, Set[DagsterEventType]]] = None,
+        page_size: int = DEFAULT_RECORDS_PAGE_SIZE,
+    ) -> Iterator[EventLogRecord]:
+        """Iterate over all of the event log records corresponding to a run, in storage id order.
+
+        Records are fetched in pages of `page_size`, keyed by storage id, so that the full event log
+        of a run is never held in memory at once.
+
+        Args:
+            run_id (str): The id of the run for which to fetch logs.
+            cursor (Optional[str]): Cursor value to start iterating after.
+            of_type (Optional[DagsterEventType]): the dagster event type to filter the logs.
+            page_size (int): The number of records to fetch per query.
+        """
+        check.invariant(page_size > 0, "page_size must be positive")
+        while True:
+            connection = self.get_records_for_run(run_id, cursor, of_type, limit=page_size)
+            yield from connection.records
+            if not connection.has_more:
+                return
+            cursor = connection.cursor
+
+    def get_lazy_records_for_run(
+        self,
+        run_id: str,
+        cursor: Optional[str] = None,
+        of_type: Optional[Union[DagsterEventType, Set[DagsterEventType]]] = None,
+        limit: Optional[int] = None,
+        ascending: bool = True,
+        step_keys: Optional[Sequence[str]] = None,
+        include_event_body: bool = True,
+    ) -> Sequence[LazyEventLogRecord]:
+        """Get the event log records corresponding to a run, deferring deserialization of each event
+        until its `event_log_entry` is accessed.
+
+        Args:
+            run_id (str): The id of the run for which to fetch logs.
+            cursor (Optional[str]): Cursor value to track paginated queries.
+            of_type (Optional[DagsterEventType]): the dagster event type to filter the logs.
+            limit (Optional[int]): Max number of records to return.
+            step_keys (Optional[Sequence[str]]): Only return events for the given step keys.
+            include_event_body (bool): Whether to fetch the event body. If False, only the indexed
+                fields (`dagster_event_type`, `step_key`, `timestamp`, `asset_key`,
+                `partition_key`) of each record are available.
+        """
+        records = [
+            LazyEventLogRecord.from_event_log_record(record)
+            for record in self.get_records_for_run(
+                run_id, cursor, of_type, limit, ascending=ascending
+            ).records
+        ]
+        if step_keys:
+            records = [record for record in records if record.step_key in step_keys]
+        return records
+
     def get_stats_for_run(self, run_id: str) -> DagsterRunStatsSnapshot:
         """Get a summary of events that have ocurred in a run."""
-        return build_run_stats_from_events(run_id, self.get_logs_for_run(run_id))
+        return build_run_stats_from_events(
+            run_id, (record.event_log_entry for record in self.iterate_records_for_run(run_id))
+        )
 
     def get_step_stats_for_run(
         self, run_id: str, step_keys: Optional[Sequence[str]] = None
     ) -> Sequence[RunStepKeyStatsSnapshot]:
         """Get per-step stats for a pipeline run."""
-        logs = self.get_logs_for_run(run_id)
+        logs = (record.event_log_entry for record in self.iterate_records_for_run(run_id))
         if step_keys:
-            logs = [
+            logs = (
                 event
                 for event in logs
                 if event.is_dagster_event and event.get_dagster_event().step_key in step_keys
-            ]
+            )
 
         return build_run_step_stats_from_events(run_id, logs)
 
@@ -225,6 +294,17 @@ def store_event(self, event: "EventLogEntry") -> None:
             event (EventLogEntry): The event to store.
         """
 
+    def store_events(self, events: Sequence["EventLogEntry"]) -> None:
+        """Store a batch of events, preserving the order in which they were supplied.
+
+        Storages that can write several events in a single round trip should override this method.
+
+        Args:
+            events (Sequence[EventLogEntry]): The events to store.
+        """
+        for event in events:
+            self.store_event(event)
+
     @abstractmethod
     def delete_events(self, run_id: str) -> None:
         """Remove events for a given run id."""
@@ -267,6 +347,10 @@ def optimize_for_webserver(self, statement_timeout: int, pool_recycle: int) -> N
         """Allows for optimizing database connection / use in the context of a long lived webserver process.
         """
 
+    def get_pool_stats(self) -> Optional[SqlPoolStats]:
+        """Connection pool statistics, for storages that connect to a database server."""
+        return None
+
     @abstractmethod
     def get_event_records(
         self,
@@ -293,6 +377,20 @@ def get_maximum_record_id(self) -> Optional[int]:
         """
         raise NotImplementedError()
 
+    def get_lazy_records_for_runs(
+        self,
+        run_ids: Sequence[str],
+        after_cursor: int = -1,
+        before_cursor: Optional[int] = None,
+        limit: Optional[int] = None,
+        include_event_body: bool = True,
+    ) -> Sequence[LazyEventLogRecord]:
+        """Get the event log records of the given runs with storage ids in the range
+        (after_cursor, before_cursor], in storage id order. Only supported for non sharded sql
+        storage.
+        """
+        raise NotImplementedError()
+
     @abstractmethod
     def can_cache_asset_status_data(self) -> bool:
         pass
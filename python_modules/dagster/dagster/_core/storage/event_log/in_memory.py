@@ -2,11 +2,12 @@
 import uuid
 from collections import defaultdict
 from contextlib import contextmanager
-from typing import Callable, Optional
+from typing import Callable, Optional, Sequence
 
 import sqlalchemy as db
 from sqlalchemy.pool import NullPool
 
+from dagster._core.events.log import EventLogEntry
 from dagster._core.storage.event_log.base import EventLogCursor
 from dagster._core.storage.sql import create_engine, get_alembic_config, stamp_alembic_rev
 from dagster._core.storage.sqlite import create_in_memory_conn_string
@@ -24,6 +25,7 @@ class InMemoryEventLogStorage(SqlEventLogStorage, ConfigurableClass):
     """
 
     def __init__(self, inst_data: Optional[ConfigurableClassData] = None, preload=None):
+        super().__init__()
         self._inst_data = inst_data
         self._engine = create_engine(
             create_in_memory_conn_string(f"events-{uuid.uuid4()}"),
@@ -82,6 +84,14 @@ def upgrade(self):
 
     def store_event(self, event):
         super(InMemoryEventLogStorage, self).store_event(event)
+        self._notify_handlers(event)
+
+    def store_events(self, events: Sequence[EventLogEntry]) -> None:
+        super(InMemoryEventLogStorage, self).store_events(events)
+        for event in events:
+            self._notify_handlers(event)
+
+    def _notify_handlers(self, event: EventLogEntry) -> None:
         self._storage_id += 1
 
         handlers = list(self._handlers[event.run_id])
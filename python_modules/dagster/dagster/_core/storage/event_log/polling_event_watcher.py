@@ -1,12 +1,21 @@
+import logging
 import threading
-from typing import Callable, List, MutableMapping, NamedTuple, Optional
+import time
+from collections import defaultdict, deque
+from typing import Callable, Deque, Dict, List, Mapping, NamedTuple, Optional, Sequence, Set, Tuple
 
 import dagster._check as check
+import dagster._seven as seven
+from dagster._core.event_api import LazyEventLogRecord
 from dagster._core.events.log import EventLogEntry
 from dagster._core.storage.event_log.base import EventLogCursor, EventLogStorage
+from dagster._serdes.errors import DeserializationError
 
 INIT_POLL_PERIOD = 0.250  # 250ms
-MAX_POLL_PERIOD = 16.0  # 16s
+MAX_POLL_PERIOD = 2.0  # 2s
+MAX_EVENTS_PER_POLL = 1000
+# how long storage ids behind the cursor are checked again for events that were committed late
+RESCAN_WINDOW_SECONDS = 10.0
 
 
 class CallbackAfterCursor(NamedTuple):
@@ -20,15 +29,24 @@ class CallbackAfterCursor(NamedTuple):
     cursor: Optional[str]
     callback: Callable[[EventLogEntry, str], None]
 
+    @property
+    def after_storage_id(self) -> int:
+        if self.cursor is None:
+            return -1
+        return EventLogCursor.parse(self.cursor).storage_id()
+
 
 class SqlPollingEventWatcher:
-    """Event Log Watcher that uses a multithreaded polling approach to retrieving new events for run_ids
-    This class' job is to manage a collection of threads that each poll the event log for a given run_id
-    Uses one thread (SqlPollingRunIdEventWatcherThread) per watched run_id.
+    """Event Log Watcher that uses a polling approach to retrieving new events for run_ids.
+
+    All of the watched run_ids are served by a single polling thread
+    (SqlPollingEventWatcherThread), which is started when the first run is watched and exits once
+    no runs are being watched. For storages that are not sharded by run, each poll issues a single
+    query for new events across all runs, no matter how many runs are being watched.
 
     LOCKING INFO:
-        ORDER: _dict_lock -> run_id_thread.callback_fn_list_lock
-        INVARIANTS: _dict_lock protects _run_id_to_watcher_dict
+        ORDER: _thread_lock -> watcher_thread.callbacks_lock
+        INVARIANTS: _thread_lock protects _watcher_thread
     """
 
     def __init__(self, event_log_storage: EventLogStorage):
@@ -36,16 +54,15 @@ def __init__(self, event_log_storage: EventLogStorage):
             event_log_storage, "event_log_storage", EventLogStorage
         )
 
-        # INVARIANT: dict_lock protects _run_id_to_watcher_dict
-        self._dict_lock: threading.Lock = threading.Lock()
-        self._run_id_to_watcher_dict: MutableMapping[str, SqlPollingRunIdEventWatcherThread] = {}
+        # INVARIANT: _thread_lock protects _watcher_thread
+        self._thread_lock: threading.Lock = threading.Lock()
+        self._watcher_thread: Optional[SqlPollingEventWatcherThread] = None
         self._disposed = False
 
     def has_run_id(self, run_id: str) -> bool:
         run_id = check.str_param(run_id, "run_id")
-        with self._dict_lock:
-            _has_run_id = run_id in self._run_id_to_watcher_dict
-        return _has_run_id
+        with self._thread_lock:
+            return self._watcher_thread is not None and self._watcher_thread.has_run_id(run_id)
 
     def watch_run(
         self, run_id: str, cursor: Optional[str], callback: Callable[[EventLogEntry, str], None]
@@ -53,23 +70,24 @@ def watch_run(
         run_id = check.str_param(run_id, "run_id")
         cursor = check.opt_str_param(cursor, "cursor")
         callback = check.callable_param(callback, "callback")
-        with self._dict_lock:
-            if run_id not in self._run_id_to_watcher_dict:
-                self._run_id_to_watcher_dict[run_id] = SqlPollingRunIdEventWatcherThread(
-                    self._event_log_storage, run_id
-                )
-                self._run_id_to_watcher_dict[run_id].daemon = True
-                self._run_id_to_watcher_dict[run_id].start()
-            self._run_id_to_watcher_dict[run_id].add_callback(cursor, callback)
+        with self._thread_lock:
+            if self._watcher_thread is None:
+                self._watcher_thread = self._create_watcher_thread()
+                self._watcher_thread.daemon = True
+                self._watcher_thread.start()
+            self._watcher_thread.add_callback(run_id, cursor, callback)
+
+    def _create_watcher_thread(self) -> "SqlPollingEventWatcherThread":
+        return SqlPollingEventWatcherThread(self._event_log_storage)
 
     def unwatch_run(self, run_id: str, handler: Callable[[EventLogEntry, str], None]):
         run_id = check.str_param(run_id, "run_id")
         handler = check.callable_param(handler, "handler")
-        with self._dict_lock:
-            if run_id in self._run_id_to_watcher_dict:
-                self._run_id_to_watcher_dict[run_id].remove_callback(handler)
-                if self._run_id_to_watcher_dict[run_id].should_thread_exit.is_set():
-                    del self._run_id_to_watcher_dict[run_id]
+        with self._thread_lock:
+            if self._watcher_thread is not None:
+                self._watcher_thread.remove_callback(run_id, handler)
+                if self._watcher_thread.should_thread_exit.is_set():
+                    self._watcher_thread = None
 
     def __del__(self):
         self.close()
@@ -77,97 +95,355 @@ def __del__(self):
     def close(self):
         if not self._disposed:
             self._disposed = True
-            with self._dict_lock:
-                for watcher_thread in self._run_id_to_watcher_dict.values():
-                    if not watcher_thread.should_thread_exit.is_set():
-                        watcher_thread.should_thread_exit.set()
-                for run_id in self._run_id_to_watcher_dict:
-                    self._run_id_to_watcher_dict[run_id].join()
-                self._run_id_to_watcher_dict = {}
+            with self._thread_lock:
+                if self._watcher_thread is not None:
+                    self._watcher_thread.stop()
+                    self._watcher_thread.join()
+                    self._watcher_thread = None
+
+
+class SqlPollingEventWatcherThread(threading.Thread):
+    """subclass of Thread that watches a set of run_ids for new Events by polling every
+    POLLING_CADENCE.
+
+    Holds the callbacks passed in by each `Observer`, keyed by run_id. Note that the callbacks have
+        a cursor associated; this means that the callbacks should be only executed on
+        EventLogEntrys with an associated id > callback.cursor
 
+    Callbacks are first brought up to date with a query for their own run (from their cursor up to
+    the storage id that the thread has already polled to), and from then on are served by the
+    thread's shared poll, which fetches the new events of all of the watched runs after a single
+    global storage id. Storages that are sharded by run cannot be queried across runs, and are
+    instead polled with one query per watched run_id.
 
-class SqlPollingRunIdEventWatcherThread(threading.Thread):
-    """subclass of Thread that watches a given run_id for new Events by polling every POLLING_CADENCE.
+    Storage ids are allocated when an event is inserted, but become visible when the inserting
+    transaction commits, so with concurrent writers an event may become visible after events with
+    greater storage ids have already been dispatched. Rather than keeping a cursor per run (which
+    would not help with the concurrent steps of a single run), the shared poll also checks the
+    storage ids that were behind the cursor within the last `rescan_window_seconds` for events
+    that have not been dispatched yet, with a query that does not fetch the event bodies. Events
+    that are committed more than `rescan_window_seconds` after a greater storage id was dispatched
+    are not dispatched.
 
-    Holds a list of callbacks (_callback_fn_list) each passed in by an `Observer`. Note that
-        the callbacks have a cursor associated; this means that the callbacks should be
-        only executed on EventLogEntrys with an associated id >= callback.cursor
     Exits when `self.should_thread_exit` is set.
 
     LOCKING INFO:
-        INVARIANTS: _callback_fn_list_lock protects _callback_fn_list
-
+        INVARIANTS: _callbacks_lock protects _callbacks_by_run_id and _pending_callbacks
     """
 
-    def __init__(self, event_log_storage: EventLogStorage, run_id: str):
-        super(SqlPollingRunIdEventWatcherThread, self).__init__()
+    rescan_window_seconds: float = RESCAN_WINDOW_SECONDS
+
+    def __init__(self, event_log_storage: EventLogStorage):
+        super(SqlPollingEventWatcherThread, self).__init__()
         self._event_log_storage = check.inst_param(
             event_log_storage, "event_log_storage", EventLogStorage
         )
-        self._run_id = check.str_param(run_id, "run_id")
-        self._callback_fn_list_lock: threading.Lock = threading.Lock()
-        self._callback_fn_list: List[CallbackAfterCursor] = []
+        self._callbacks_lock: threading.Lock = threading.Lock()
+        self._callbacks_by_run_id: Dict[str, List[CallbackAfterCursor]] = defaultdict(list)
+        # callbacks that still need to be brought up to date before joining the shared poll
+        self._pending_callbacks: List[Tuple[str, CallbackAfterCursor]] = []
         self._should_thread_exit = threading.Event()
-        self.name = f"sql-event-watch-run-id-{self._run_id}"
+        self._wake = threading.Event()
+
+        # the storage id up to which events have been dispatched, either globally or per run_id
+        # for run-sharded storages
+        self._storage_id_cursor: Optional[int] = None
+        self._run_storage_id_cursors: Dict[str, int] = {}
+
+        # (time, storage id cursor) as of each poll that advanced the cursor within the rescan
+        # window, and the storage ids that were dispatched after the oldest of those cursors
+        self._storage_id_cursor_history: Deque[Tuple[float, int]] = deque()
+        self._recent_storage_ids: Set[int] = set()
+        self.name = "sql-event-watch"
 
     @property
     def should_thread_exit(self) -> threading.Event:
         return self._should_thread_exit
 
-    def add_callback(self, cursor: Optional[str], callback: Callable[[EventLogEntry, str], None]):
+    def has_run_id(self, run_id: str) -> bool:
+        with self._callbacks_lock:
+            return bool(self._callbacks_by_run_id.get(run_id)) or any(
+                pending_run_id == run_id for pending_run_id, _ in self._pending_callbacks
+            )
+
+    def add_callback(
+        self, run_id: str, cursor: Optional[str], callback: Callable[[EventLogEntry, str], None]
+    ):
         """Observer has started watching this run.
             Add a callback to execute on new EventLogEntrys after the given cursor.
 
         Args:
+            run_id (str): the run to watch
             cursor (Optional[str]): event log cursor for the callback to execute
             callback (Callable[[EventLogEntry, str], None]): callback to update the Dagster UI
         """
+        run_id = check.str_param(run_id, "run_id")
         cursor = check.opt_str_param(cursor, "cursor")
         callback = check.callable_param(callback, "callback")
-        with self._callback_fn_list_lock:
-            self._callback_fn_list.append(CallbackAfterCursor(cursor, callback))
+        with self._callbacks_lock:
+            self._pending_callbacks.append((run_id, CallbackAfterCursor(cursor, callback)))
+        # serve the new callback without waiting out the current poll interval
+        self._wake.set()
 
-    def remove_callback(self, callback: Callable[[EventLogEntry, str], None]):
+    def remove_callback(self, run_id: str, callback: Callable[[EventLogEntry, str], None]):
         """Observer has stopped watching this run;
             Remove a callback from the list of callbacks to execute on new EventLogEntrys.
 
-            Also kill thread if no callbacks remaining (i.e. no Observers are watching this run_id)
+            Also kill thread if no callbacks remaining (i.e. no Observers are watching any run_id)
 
         Args:
+            run_id (str): the run that was being watched
             callback (Callable[[EventLogEntry, str], None]): callback to remove from list of callbacks
         """
+        run_id = check.str_param(run_id, "run_id")
         callback = check.callable_param(callback, "callback")
-        with self._callback_fn_list_lock:
-            self._callback_fn_list = [
-                callback_with_cursor
-                for callback_with_cursor in self._callback_fn_list
-                if callback_with_cursor.callback != callback
+        with self._callbacks_lock:
+            self._pending_callbacks = [
+                (pending_run_id, callback_with_cursor)
+                for pending_run_id, callback_with_cursor in self._pending_callbacks
+                if not (pending_run_id == run_id and callback_with_cursor.callback == callback)
             ]
-            if not self._callback_fn_list:
-                self._should_thread_exit.set()
+            if run_id in self._callbacks_by_run_id:
+                remaining = [
+                    callback_with_cursor
+                    for callback_with_cursor in self._callbacks_by_run_id[run_id]
+                    if callback_with_cursor.callback != callback
+                ]
+                if remaining:
+                    self._callbacks_by_run_id[run_id] = remaining
+                else:
+                    del self._callbacks_by_run_id[run_id]
+                    self._run_storage_id_cursors.pop(run_id, None)
+
+            if not self._callbacks_by_run_id and not self._pending_callbacks:
+                self.stop()
+
+    def stop(self):
+        self._should_thread_exit.set()
+        self._wake.set()
 
     def run(self):
         """Polling function to update Observers with EventLogEntrys from Event Log DB.
-        Wakes every POLLING_CADENCE &
-            1. executes a SELECT query to get new EventLogEntrys
-            2. fires each callback (taking into account the callback.cursor) on the new EventLogEntrys
-        Uses max_index_so_far as a cursor in the DB to make sure that only new records are retrieved.
+        Wakes every POLLING_CADENCE (or as soon as a new callback is added) &
+            1. brings newly added callbacks up to date with the events of their run
+            2. executes a SELECT query to get new EventLogEntrys
+            3. fires each callback (taking into account the callback.cursor) on the new EventLogEntrys
+        Uses the greatest storage id seen so far as a cursor in the DB to make sure that only new
+        records are retrieved.
         """
-        cursor = None
         wait_time = INIT_POLL_PERIOD
-        while not self._should_thread_exit.wait(wait_time):
-            conn = self._event_log_storage.get_records_for_run(self._run_id, cursor=cursor)
-            cursor = conn.cursor
-            for event_record in conn.records:
-                with self._callback_fn_list_lock:
-                    for callback_with_cursor in self._callback_fn_list:
-                        if (
-                            callback_with_cursor.cursor is None
-                            or EventLogCursor.parse(callback_with_cursor.cursor).storage_id()
-                            < event_record.storage_id
-                        ):
-                            callback_with_cursor.callback(
-                                event_record.event_log_entry,
-                                str(EventLogCursor.from_storage_id(event_record.storage_id)),
-                            )
-            wait_time = INIT_POLL_PERIOD if conn.records else min(wait_time * 2, MAX_POLL_PERIOD)
+        while True:
+            self._wake.wait(wait_time)
+            self._wake.clear()
+            if self._should_thread_exit.is_set():
+                break
+
+            try:
+                num_new_events = self._poll()
+            except Exception:
+                logging.exception("Exception while polling the event log for watched runs.")
+                num_new_events = 0
+
+            if num_new_events >= MAX_EVENTS_PER_POLL:
+                # there are likely more events waiting, poll again right away
+                wait_time = 0
+            elif num_new_events:
+                wait_time = INIT_POLL_PERIOD
+            else:
+                wait_time = min(max(wait_time, INIT_POLL_PERIOD) * 2, MAX_POLL_PERIOD)
+
+    def _poll(self) -> int:
+        if self._event_log_storage.is_run_sharded:
+            return self._poll_each_run()
+        return self._poll_all_runs()
+
+    def _poll_all_runs(self) -> int:
+        if self._storage_id_cursor is None:
+            max_storage_id = self._event_log_storage.get_maximum_record_id()
+            self._storage_id_cursor = max_storage_id if max_storage_id is not None else -1
+            self._storage_id_cursor_history.append((time.monotonic(), self._storage_id_cursor))
+
+        storage_id_cursor = self._storage_id_cursor
+        with self._callbacks_lock:
+            pending_callbacks = list(self._pending_callbacks)
+            run_ids = list(
+                {
+                    *self._callbacks_by_run_id.keys(),
+                    *[run_id for run_id, _ in pending_callbacks],
+                }
+            )
+
+        catch_up_records = {
+            id(callback_with_cursor): self._get_records_for_run(
+                run_id, callback_with_cursor.cursor, storage_id_cursor
+            )
+            for run_id, callback_with_cursor in pending_callbacks
+        }
+
+        # the caught up events have been dispatched to the runs that were just added, and must not
+        # be dispatched again as late events
+        self._recent_storage_ids.update(
+            storage_id
+            for records in catch_up_records.values()
+            for storage_id, _ in records
+            if storage_id > self._storage_id_cursor_history[0][1]
+        )
+        late_records = self._get_late_records(run_ids, storage_id_cursor)
+        new_records = self._event_log_storage.get_lazy_records_for_runs(
+            run_ids, after_cursor=storage_id_cursor, limit=MAX_EVENTS_PER_POLL
+        )
+
+        with self._callbacks_lock:
+            self._activate_pending_callbacks(catch_up_records)
+            for record in [*late_records, *new_records]:
+                event = _get_event_log_entry(record)
+                if event:
+                    self._dispatch(record.run_id, record.storage_id, event)
+
+        self._recent_storage_ids.update(record.storage_id for record in late_records)
+        self._recent_storage_ids.update(record.storage_id for record in new_records)
+        if new_records:
+            self._storage_id_cursor = new_records[-1].storage_id
+            self._storage_id_cursor_history.append((time.monotonic(), self._storage_id_cursor))
+        return len(new_records)
+
+    def _get_late_records(
+        self, run_ids: Sequence[str], storage_id_cursor: int
+    ) -> Sequence[LazyEventLogRecord]:
+        """Returns the records of the given runs that became visible behind the cursor since they
+        were last polled, within the rescan window.
+        """
+        # drop the cursors that fell out of the window, keeping the one that was current at its start
+        window_start = time.monotonic() - self.rescan_window_seconds
+        history = self._storage_id_cursor_history
+        while len(history) > 1 and history[1][0] <= window_start:
+            history.popleft()
+        rescan_after_cursor = history[0][1]
+        self._recent_storage_ids = {
+            storage_id
+            for storage_id in self._recent_storage_ids
+            if storage_id > rescan_after_cursor
+        }
+        if self.rescan_window_seconds <= 0 or rescan_after_cursor >= storage_id_cursor:
+            return []
+
+        late_storage_ids = [
+            record.storage_id
+            for record in self._event_log_storage.get_lazy_records_for_runs(
+                run_ids,
+                after_cursor=rescan_after_cursor,
+                before_cursor=storage_id_cursor,
+                include_event_body=False,
+            )
+            if record.storage_id not in self._recent_storage_ids
+        ]
+        if not late_storage_ids:
+            return []
+
+        return [
+            record
+            for record in self._event_log_storage.get_lazy_records_for_runs(
+                run_ids,
+                after_cursor=min(late_storage_ids) - 1,
+                before_cursor=max(late_storage_ids),
+            )
+            if record.storage_id in late_storage_ids
+        ]
+
+    def _poll_each_run(self) -> int:
+        with self._callbacks_lock:
+            pending_callbacks = list(self._pending_callbacks)
+            run_storage_id_cursors = {
+                run_id: self._run_storage_id_cursors.get(run_id, -1)
+                for run_id in [
+                    *self._callbacks_by_run_id.keys(),
+                    *[run_id for run_id, _ in pending_callbacks],
+                ]
+            }
+
+        catch_up_records = {
+            id(callback_with_cursor): self._get_records_for_run(
+                run_id, callback_with_cursor.cursor, run_storage_id_cursors[run_id]
+            )
+            for run_id, callback_with_cursor in pending_callbacks
+        }
+
+        new_records_by_run_id = {
+            run_id: self._get_records_for_run(
+                run_id, str(EventLogCursor.from_storage_id(storage_id_cursor))
+            )
+            for run_id, storage_id_cursor in run_storage_id_cursors.items()
+            if self._should_poll_run(run_id)
+        }
+
+        with self._callbacks_lock:
+            self._activate_pending_callbacks(catch_up_records)
+            for run_id, records in new_records_by_run_id.items():
+                for storage_id, event in records:
+                    self._dispatch(run_id, storage_id, event)
+
+                if run_id in self._callbacks_by_run_id:
+                    self._run_storage_id_cursors[run_id] = (
+                        records[-1][0] if records else run_storage_id_cursors[run_id]
+                    )
+
+        return max([len(records) for records in new_records_by_run_id.values()], default=0)
+
+    def _should_poll_run(self, run_id: str) -> bool:
+        # run-sharded storages that can tell which shards have changed can skip the others
+        return True
+
+    def _get_records_for_run(
+        self, run_id: str, cursor: Optional[str], before_storage_id: Optional[int] = None
+    ) -> Sequence[Tuple[int, EventLogEntry]]:
+        if before_storage_id is not None and before_storage_id < 0:
+            # nothing has been dispatched for this run yet, so there is nothing to catch up on
+            return []
+
+        records = self._event_log_storage.get_records_for_run(run_id, cursor=cursor).records
+        return [
+            (record.storage_id, record.event_log_entry)
+            for record in records
+            if before_storage_id is None or record.storage_id <= before_storage_id
+        ]
+
+    def _activate_pending_callbacks(
+        self, catch_up_records: Mapping[int, Sequence[Tuple[int, EventLogEntry]]]
+    ) -> None:
+        # Must be called while holding _callbacks_lock. Callbacks that were removed while their
+        # catch-up query was running are no longer pending and are skipped, and callbacks that
+        # were added after the poll started are picked up on the next one.
+        still_pending = []
+        for run_id, callback_with_cursor in self._pending_callbacks:
+            if id(callback_with_cursor) not in catch_up_records:
+                still_pending.append((run_id, callback_with_cursor))
+                continue
+
+            for storage_id, event in catch_up_records[id(callback_with_cursor)]:
+                _fire_callback(callback_with_cursor, storage_id, event)
+            self._callbacks_by_run_id[run_id].append(callback_with_cursor)
+        self._pending_callbacks = still_pending
+
+    def _dispatch(self, run_id: str, storage_id: int, event: EventLogEntry) -> None:
+        # must be called while holding _callbacks_lock
+        for callback_with_cursor in self._callbacks_by_run_id.get(run_id, []):
+            _fire_callback(callback_with_cursor, storage_id, event)
+
+
+def _get_event_log_entry(record: LazyEventLogRecord) -> Optional[EventLogEntry]:
+    try:
+        return record.event_log_entry
+    except (seven.JSONDecodeError, DeserializationError):
+        logging.warning("Could not parse event record id `%s`.", record.storage_id)
+        return None
+
+
+def _fire_callback(
+    callback_with_cursor: CallbackAfterCursor, storage_id: int, event: EventLogEntry
+) -> None:
+    if callback_with_cursor.after_storage_id >= storage_id:
+        return
+    try:
+        callback_with_cursor.callback(event, str(EventLogCursor.from_storage_id(storage_id)))
+    except Exception:
+        logging.exception("Exception in callback for event watch on run %s.", event.run_id)
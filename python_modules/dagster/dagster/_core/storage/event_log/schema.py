@@ -118,6 +118,51 @@
     db.Column("create_timestamp", db.DateTime, server_default=get_current_timestamp()),
 )
 
+# Summary of the stats of each run, maintained as the run's events are stored so that run stats can
+# be read without scanning the run's event log.  Guarded by the `run_stats` secondary index check.
+RunStatsTable = db.Table(
+    "run_stats",
+    SqlEventLogStorageMetadata,
+    db.Column(
+        "id",
+        db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+        primary_key=True,
+        autoincrement=True,
+    ),
+    db.Column("run_id", db.String(255), nullable=False, unique=True),
+    db.Column("steps_succeeded", db.Integer, nullable=False, default=0),
+    db.Column("steps_failed", db.Integer, nullable=False, default=0),
+    db.Column("materializations", db.Integer, nullable=False, default=0),
+    db.Column("expectations", db.Integer, nullable=False, default=0),
+    db.Column("enqueued_time", db.Float),
+    db.Column("launch_time", db.Float),
+    db.Column("start_time", db.Float),
+    db.Column("end_time", db.Float),
+)
+
+# Per-step counterpart of the run_stats table.  Materializations and expectation results are not
+# copied here, and are instead read from the event log by event type.
+RunStepStatsTable = db.Table(
+    "run_step_stats",
+    SqlEventLogStorageMetadata,
+    db.Column(
+        "id",
+        db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+        primary_key=True,
+        autoincrement=True,
+    ),
+    db.Column("run_id", db.String(255), nullable=False),
+    db.Column("step_key", db.Text, nullable=False),
+    db.Column("status", db.String(63)),
+    db.Column("start_time", db.Float),
+    db.Column("end_time", db.Float),
+    db.Column("attempts", db.Integer),
+    # start time of the current attempt, and the serialized list of completed attempts and markers
+    db.Column("attempt_start_time", db.Float),
+    db.Column("attempts_list", db.Text),
+    db.Column("markers", db.Text),
+)
+
 db.Index(
     "idx_step_key",
     SqlEventLogStorageTable.c.step_key,
@@ -183,3 +228,10 @@
     mysql_length={"concurrency_key": 255, "run_id": 255, "step_key": 32},
     unique=True,
 )
+db.Index(
+    "idx_run_step_stats",
+    RunStepStatsTable.c.run_id,
+    RunStepStatsTable.c.step_key,
+    mysql_length={"step_key": 255},
+    unique=True,
+)
@@ -1,6 +1,7 @@
 import logging
 from abc import abstractmethod
 from collections import OrderedDict, defaultdict
+from contextlib import contextmanager
 from datetime import datetime
 from typing import (
     TYPE_CHECKING,
@@ -8,6 +9,7 @@
     ContextManager,
     Dict,
     Iterable,
+    Iterator,
     List,
     Mapping,
     NamedTuple,
@@ -28,16 +30,26 @@
 import dagster._check as check
 import dagster._seven as seven
 from dagster._core.assets import AssetDetails
-from dagster._core.definitions.events import AssetKey, AssetMaterialization
+from dagster._core.definitions.events import AssetKey, AssetMaterialization, ExpectationResult
 from dagster._core.errors import (
     DagsterEventLogInvalidForRun,
     DagsterInvalidInvocationError,
     DagsterInvariantViolationError,
 )
-from dagster._core.event_api import RunShardedEventsCursor
-from dagster._core.events import ASSET_EVENTS, MARKER_EVENTS, DagsterEventType
+from dagster._core.event_api import LazyEventLogRecord, RunShardedEventsCursor
+from dagster._core.events import (
+    ASSET_EVENTS,
+    MARKER_EVENTS,
+    DagsterEventType,
+    StepExpectationResultData,
+)
 from dagster._core.events.log import EventLogEntry
-from dagster._core.execution.stats import RunStepKeyStatsSnapshot, build_run_step_stats_from_events
+from dagster._core.execution.stats import (
+    RunStepKeyStatsSnapshot,
+    RunStepMarker,
+    StepEventStatus,
+    build_run_step_stats_from_events,
+)
 from dagster._core.storage.sql import SqlAlchemyQuery, SqlAlchemyRow
 from dagster._core.storage.sqlalchemy_compat import (
     db_case,
@@ -46,6 +58,7 @@
     db_subquery,
 )
 from dagster._serdes import (
+    SerdesCodec,
     deserialize_value,
     serialize_value,
 )
@@ -64,6 +77,7 @@
 
 from ..dagster_run import DagsterRunStatsSnapshot
 from .base import (
+    DEFAULT_RECORDS_PAGE_SIZE,
     AssetEntry,
     AssetRecord,
     EventLogConnection,
@@ -72,13 +86,20 @@
     EventLogStorage,
     EventRecordsFilter,
 )
-from .migration import ASSET_DATA_MIGRATIONS, ASSET_KEY_INDEX_COLS, EVENT_LOG_DATA_MIGRATIONS
+from .migration import (
+    ASSET_DATA_MIGRATIONS,
+    ASSET_KEY_INDEX_COLS,
+    EVENT_LOG_DATA_MIGRATIONS,
+    RUN_STATS_INDEX,
+)
 from .schema import (
     AssetEventTagsTable,
     AssetKeyTable,
     ConcurrencySlotsTable,
     DynamicPartitionsTable,
     PendingStepsTable,
+    RunStatsTable,
+    RunStepStatsTable,
     SecondaryIndexMigrationTable,
     SqlEventLogStorageTable,
 )
@@ -89,6 +110,36 @@
 MAX_CONCURRENCY_SLOTS = 1000
 MIN_ASSET_ROWS = 25
 
+# event types that contribute to the run_stats summary table, mapped to the counter they increment or
+# the time they set
+RUN_STATS_COUNTERS = {
+    DagsterEventType.STEP_SUCCESS: "steps_succeeded",
+    DagsterEventType.STEP_FAILURE: "steps_failed",
+    DagsterEventType.ASSET_MATERIALIZATION: "materializations",
+    DagsterEventType.STEP_EXPECTATION_RESULT: "expectations",
+}
+RUN_STATS_TIMES = {
+    DagsterEventType.PIPELINE_ENQUEUED: "enqueued_time",
+    DagsterEventType.PIPELINE_STARTING: "launch_time",
+    DagsterEventType.PIPELINE_START: "start_time",
+    DagsterEventType.PIPELINE_SUCCESS: "end_time",
+    DagsterEventType.PIPELINE_FAILURE: "end_time",
+    DagsterEventType.PIPELINE_CANCELED: "end_time",
+}
+
+# event types that contribute to per-step stats
+STEP_STATS_EVENT_TYPES = {
+    DagsterEventType.STEP_START,
+    DagsterEventType.STEP_SUCCESS,
+    DagsterEventType.STEP_SKIPPED,
+    DagsterEventType.STEP_FAILURE,
+    DagsterEventType.STEP_RESTARTED,
+    DagsterEventType.ASSET_MATERIALIZATION,
+    DagsterEventType.STEP_EXPECTATION_RESULT,
+    DagsterEventType.STEP_UP_FOR_RETRY,
+    *MARKER_EVENTS,
+}
+
 # We are using third-party library objects for DB connections-- at this time, these libraries are
 # untyped. When/if we upgrade to typed variants, the `Any` here can be replaced or the alias as a
 # whole can be dropped.
@@ -102,6 +153,12 @@ class SqlEventLogStorage(EventLogStorage):
     sharding, while maintaining the ability to do cross-run queries
     """
 
+    def __init__(self):
+        super().__init__()
+        # only a positive result is cached, since the check is made for every stored step event and
+        # the tables may be added by a schema migration while the storage is in use
+        self._run_stats_tables_exist = False
+
     @abstractmethod
     def run_connection(self, run_id: Optional[str]) -> ContextManager[Connection]:
         """Context manager yielding a connection to access the event logs for a specific run.
@@ -125,6 +182,11 @@ def upgrade(self) -> None:
     def has_table(self, table_name: str) -> bool:
         """This method checks if a table exists in the database."""
 
+    @property
+    def _serdes_codec(self) -> Optional[SerdesCodec]:
+        # the codec for stored event bodies, configured with the `serdes_codec` instance setting
+        return self._instance.serdes_codec if self.has_instance else None
+
     def prepare_insert_event(self, event):
         """Helper method for preparing the event log SQL insertion statement.  Abstracted away to
         have a single place for the logical table representation of the event, while having a way
@@ -132,6 +194,10 @@ def prepare_insert_event(self, event):
         the `dagster-postgres` implementation which overrides the generic SQL implementation of
         `store_event`.
         """
+        # https://stackoverflow.com/a/54386260/324449
+        return SqlEventLogStorageTable.insert().values(**self._get_event_insert_values(event))
+
+    def _get_event_insert_values(self, event: EventLogEntry) -> Dict[str, Any]:
         dagster_event_type = None
         asset_key_str = None
         partition = None
@@ -145,10 +211,9 @@ def prepare_insert_event(self, event):
             if event.dagster_event.partition:
                 partition = event.dagster_event.partition
 
-        # https://stackoverflow.com/a/54386260/324449
-        return SqlEventLogStorageTable.insert().values(
+        return dict(
             run_id=event.run_id,
-            event=serialize_value(event),
+            event=serialize_value(event, codec=self._serdes_codec),
             dagster_event_type=dagster_event_type,
             # Postgres requires a datetime that is in UTC but has no timezone info set
             # in order to be stored correctly
@@ -333,17 +398,21 @@ def add_asset_event_tags(
                     ],
                 )
 
+    def _get_asset_event_tags(self, event: EventLogEntry) -> Optional[Mapping[str, str]]:
+        if not (event.dagster_event and event.dagster_event.asset_key):
+            return None
+        if event.dagster_event.is_step_materialization:
+            return event.dagster_event.step_materialization_data.materialization.tags
+        if event.dagster_event.is_asset_observation:
+            return event.dagster_event.asset_observation_data.asset_observation.tags
+        return None
+
     def store_asset_event_tags(self, event: EventLogEntry, event_id: int) -> None:
         check.inst_param(event, "event", EventLogEntry)
         check.int_param(event_id, "event_id")
 
         if event.dagster_event and event.dagster_event.asset_key:
-            if event.dagster_event.is_step_materialization:
-                tags = event.dagster_event.step_materialization_data.materialization.tags
-            elif event.dagster_event.is_asset_observation:
-                tags = event.dagster_event.asset_observation_data.asset_observation.tags
-            else:
-                tags = None
+            tags = self._get_asset_event_tags(event)
 
             if not tags or not self.has_table(AssetEventTagsTable.name):
                 # If tags table does not exist, silently exit. This is to support OSS
@@ -401,6 +470,151 @@ def store_event(self, event: EventLogEntry) -> None:
 
             self.store_asset_event_tags(event, event_id)
 
+        self._store_run_stats([event])
+
+    def store_events(self, events: Sequence[EventLogEntry]) -> None:
+        """Store a batch of events in a single transaction.
+
+        Event rows are written with multi-row inserts, and the asset index updates and asset event
+        tags for the whole batch are written in the same transaction. Storage ids are assigned in
+        the order in which the events are supplied.
+
+        Args:
+            events (Sequence[EventLogEntry]): The events to store.
+        """
+        check.sequence_param(events, "events", of_type=EventLogEntry)
+        if not events:
+            return
+
+        if self.is_run_sharded:
+            # run-sharded storages keep event rows and the cross-run asset index in different
+            # databases, and must override this method to batch writes to each of them
+            super().store_events(events)
+            return
+
+        # resolve schema capabilities up front, so that no other connections are opened while the
+        # write transaction is held
+        has_asset_key_index_cols = self.has_asset_key_index_cols()
+        has_asset_event_tags_table = self.has_table(AssetEventTagsTable.name)
+
+        try:
+            with self.index_connection() as conn:
+                with _transaction(conn):
+                    event_ids = self._insert_event_rows(conn, events)
+                    self._store_asset_index_rows(
+                        conn,
+                        [
+                            (event, event_id)
+                            for event, event_id in zip(events, event_ids)
+                            if _is_indexed_asset_event(event)
+                        ],
+                        has_asset_key_index_cols,
+                        has_asset_event_tags_table,
+                    )
+        except db_exc.IntegrityError:
+            # A concurrent writer created one of the batch's asset rows after we checked for it.
+            # The whole transaction was rolled back, so replay the batch through the per-event
+            # path, which resolves the conflict row by row.
+            for event in events:
+                self.store_event(event)
+        else:
+            self._store_run_stats(events)
+
+    def _insert_event_rows(
+        self, conn: Connection, events: Sequence[EventLogEntry]
+    ) -> Sequence[Optional[int]]:
+        """Insert event rows in the supplied order, returning the storage id of each row. Only the
+        ids of asset events are required, and None may be returned for the rest.
+
+        Consecutive non-asset events are written with a single multi-row insert; asset events are
+        inserted individually, since their storage ids are needed to index them.
+        """
+        event_ids: List[Optional[int]] = []
+        pending_rows: List[Dict[str, Any]] = []
+
+        for event in events:
+            if not _is_indexed_asset_event(event):
+                pending_rows.append(self._get_event_insert_values(event))
+                continue
+
+            if pending_rows:
+                conn.execute(SqlEventLogStorageTable.insert(), pending_rows)
+                event_ids.extend([None] * len(pending_rows))
+                pending_rows = []
+
+            result = conn.execute(
+                SqlEventLogStorageTable.insert().values(**self._get_event_insert_values(event))
+            )
+            event_ids.append(result.inserted_primary_key[0])
+
+        if pending_rows:
+            conn.execute(SqlEventLogStorageTable.insert(), pending_rows)
+            event_ids.extend([None] * len(pending_rows))
+
+        return event_ids
+
+    def _store_asset_index_rows(
+        self,
+        conn: Connection,
+        asset_events: Sequence[Tuple[EventLogEntry, Optional[int]]],
+        has_asset_key_index_cols: bool,
+        has_asset_event_tags_table: bool,
+    ) -> None:
+        """Batched equivalent of `store_asset_event` and `store_asset_event_tags`, issuing a
+        single write per asset key plus one multi-row insert for all of the asset event tags.
+        """
+        if not asset_events:
+            return
+
+        # Applying each event's column values in storage order leaves every asset row in the same
+        # state as sequential calls to `store_asset_event` would have.
+        values_by_asset_key: Dict[str, Dict[str, Any]] = OrderedDict()
+        tag_rows: List[Dict[str, Any]] = []
+        for event, event_id in asset_events:
+            if event_id is None:
+                raise DagsterInvariantViolationError(
+                    "Cannot store asset event tags for null event id."
+                )
+            asset_key_str = event.get_dagster_event().asset_key.to_string()  # type: ignore
+            values_by_asset_key.setdefault(asset_key_str, {}).update(
+                self._get_asset_entry_values(event, event_id, has_asset_key_index_cols)
+            )
+            tags = self._get_asset_event_tags(event) if has_asset_event_tags_table else None
+            if tags:
+                tag_rows.extend(
+                    dict(
+                        event_id=event_id,
+                        asset_key=asset_key_str,
+                        key=key,
+                        value=value,
+                        # Postgres requires a datetime that is in UTC but has no timezone info
+                        # set in order to be stored correctly
+                        event_timestamp=datetime.utcfromtimestamp(event.timestamp),
+                    )
+                    for key, value in tags.items()
+                )
+
+        existing_asset_keys = {
+            row[0]
+            for row in conn.execute(
+                db_select([AssetKeyTable.c.asset_key]).where(
+                    AssetKeyTable.c.asset_key.in_(list(values_by_asset_key.keys()))
+                )
+            ).fetchall()
+        }
+        for asset_key_str, values in values_by_asset_key.items():
+            if asset_key_str not in existing_asset_keys:
+                conn.execute(AssetKeyTable.insert().values(asset_key=asset_key_str, **values))
+            elif values:
+                conn.execute(
+                    AssetKeyTable.update()
+                    .values(**values)
+                    .where(AssetKeyTable.c.asset_key == asset_key_str)
+                )
+
+        if tag_rows:
+            conn.execute(AssetEventTagsTable.insert(), tag_rows)
+
     def get_records_for_run(
         self,
         run_id,
@@ -418,6 +632,123 @@ def get_records_for_run(
             of_type (Optional[DagsterEventType]): the dagster event type to filter the logs.
             limit (Optional[int]): the maximum number of events to fetch
         """
+        query = self._get_records_for_run_query(
+            [SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event],
+            run_id,
+            cursor=cursor,
+            of_type=of_type,
+            limit=limit,
+            ascending=ascending,
+        )
+
+        with self.run_connection(run_id) as conn:
+            results = conn.execute(query).fetchall()
+
+        last_record_id = None
+        try:
+            records = []
+            for (
+                record_id,
+                json_str,
+            ) in results:
+                records.append(
+                    EventLogRecord(
+                        storage_id=record_id,
+                        event_log_entry=deserialize_value(json_str, EventLogEntry),
+                    )
+                )
+                last_record_id = record_id
+        except (seven.JSONDecodeError, DeserializationError) as err:
+            raise DagsterEventLogInvalidForRun(run_id=run_id) from err
+
+        if last_record_id is not None:
+            next_cursor = EventLogCursor.from_storage_id(last_record_id).to_string()
+        elif cursor:
+            # record fetch returned no new logs, return the same cursor
+            next_cursor = cursor
+        else:
+            # rely on the fact that all storage ids will be positive integers
+            next_cursor = EventLogCursor.from_storage_id(-1).to_string()
+
+        return EventLogConnection(
+            records=records,
+            cursor=next_cursor,
+            has_more=bool(limit and len(results) == limit),
+        )
+
+    def iterate_records_for_run(
+        self,
+        run_id: str,
+        cursor: Optional[str] = None,
+        of_type: Optional[Union[DagsterEventType, Set[DagsterEventType]]] = None,
+        page_size: int = DEFAULT_RECORDS_PAGE_SIZE,
+    ) -> Iterator[EventLogRecord]:
+        check.int_param(page_size, "page_size")
+        check.invariant(page_size > 0, "page_size must be positive")
+
+        while True:
+            query = self._get_records_for_run_query(
+                [SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event],
+                run_id,
+                cursor=cursor,
+                of_type=of_type,
+                limit=page_size,
+            )
+            with self.run_connection(run_id) as conn:
+                results = conn.execute(query).fetchall()
+
+            # yield each record as it is decoded, rather than decoding the whole page up front
+            for record_id, json_str in results:
+                try:
+                    event_log_entry = deserialize_value(json_str, EventLogEntry)
+                except (seven.JSONDecodeError, DeserializationError) as err:
+                    raise DagsterEventLogInvalidForRun(run_id=run_id) from err
+                yield EventLogRecord(storage_id=record_id, event_log_entry=event_log_entry)
+
+            if len(results) < page_size:
+                return
+
+            # subsequent pages are keyed by storage id, which is stable under concurrent writes
+            cursor = EventLogCursor.from_storage_id(results[-1][0]).to_string()
+
+    def get_lazy_records_for_run(
+        self,
+        run_id: str,
+        cursor: Optional[str] = None,
+        of_type: Optional[Union[DagsterEventType, Set[DagsterEventType]]] = None,
+        limit: Optional[int] = None,
+        ascending: bool = True,
+        step_keys: Optional[Sequence[str]] = None,
+        include_event_body: bool = True,
+    ) -> Sequence[LazyEventLogRecord]:
+        check.opt_nullable_sequence_param(step_keys, "step_keys", of_type=str)
+        check.bool_param(include_event_body, "include_event_body")
+
+        query = self._get_records_for_run_query(
+            _lazy_record_columns(include_event_body),
+            run_id,
+            cursor=cursor,
+            of_type=of_type,
+            limit=limit,
+            ascending=ascending,
+        )
+        if step_keys:
+            query = query.where(SqlEventLogStorageTable.c.step_key.in_(step_keys))
+
+        with self.run_connection(run_id) as conn:
+            results = conn.execute(query).fetchall()
+
+        return [_lazy_record_from_row(run_id, row, include_event_body) for row in results]
+
+    def _get_records_for_run_query(
+        self,
+        columns: Sequence[Any],
+        run_id: str,
+        cursor: Optional[str] = None,
+        of_type: Optional[Union[DagsterEventType, Set[DagsterEventType]]] = None,
+        limit: Optional[int] = None,
+        ascending: bool = True,
+    ) -> SqlAlchemyQuery:
         check.str_param(run_id, "run_id")
         check.opt_str_param(cursor, "cursor")
 
@@ -430,7 +761,7 @@ def get_records_for_run(
         )
 
         query = (
-            db_select([SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event])
+            db_select(columns)
             .where(SqlEventLogStorageTable.c.run_id == run_id)
             .order_by(
                 SqlEventLogStorageTable.c.id.asc()
@@ -459,44 +790,16 @@ def get_records_for_run(
         if limit:
             query = query.limit(limit)
 
-        with self.run_connection(run_id) as conn:
-            results = conn.execute(query).fetchall()
-
-        last_record_id = None
-        try:
-            records = []
-            for (
-                record_id,
-                json_str,
-            ) in results:
-                records.append(
-                    EventLogRecord(
-                        storage_id=record_id,
-                        event_log_entry=deserialize_value(json_str, EventLogEntry),
-                    )
-                )
-                last_record_id = record_id
-        except (seven.JSONDecodeError, DeserializationError) as err:
-            raise DagsterEventLogInvalidForRun(run_id=run_id) from err
-
-        if last_record_id is not None:
-            next_cursor = EventLogCursor.from_storage_id(last_record_id).to_string()
-        elif cursor:
-            # record fetch returned no new logs, return the same cursor
-            next_cursor = cursor
-        else:
-            # rely on the fact that all storage ids will be positive integers
-            next_cursor = EventLogCursor.from_storage_id(-1).to_string()
-
-        return EventLogConnection(
-            records=records,
-            cursor=next_cursor,
-            has_more=bool(limit and len(results) == limit),
-        )
+        return query
 
     def get_stats_for_run(self, run_id: str) -> DagsterRunStatsSnapshot:
         check.str_param(run_id, "run_id")
 
+        if self._can_read_run_stats(run_id):
+            stats = self._get_stats_from_index(run_id)
+            if stats:
+                return stats
+
         query = (
             db_select(
                 [
@@ -566,45 +869,323 @@ def get_step_stats_for_run(
         #
         # For simplicity, we now just do the second type of query and derive the stats in Python
         # from the raw events.  This has the benefit of being easier to read and also the benefit of
-        # being able to share code with the in-memory event log storage implementation.  We may
-        # choose to revisit this in the future, especially if we are able to do JSON-column queries
-        # in SQL as a way of bypassing the serdes layer in all cases.
-        raw_event_query = (
-            db_select([SqlEventLogStorageTable.c.event])
-            .where(SqlEventLogStorageTable.c.run_id == run_id)
-            .where(SqlEventLogStorageTable.c.step_key != None)  # noqa: E711
-            .where(
-                SqlEventLogStorageTable.c.dagster_event_type.in_(
-                    [
-                        DagsterEventType.STEP_START.value,
-                        DagsterEventType.STEP_SUCCESS.value,
-                        DagsterEventType.STEP_SKIPPED.value,
-                        DagsterEventType.STEP_FAILURE.value,
-                        DagsterEventType.STEP_RESTARTED.value,
-                        DagsterEventType.ASSET_MATERIALIZATION.value,
-                        DagsterEventType.STEP_EXPECTATION_RESULT.value,
-                        DagsterEventType.STEP_RESTARTED.value,
-                        DagsterEventType.STEP_UP_FOR_RETRY.value,
-                    ]
-                    + [marker_event.value for marker_event in MARKER_EVENTS]
-                )
+        # being able to share code with the in-memory event log storage implementation.  Step
+        # times are read from the event bodies, since the timestamp column may be truncated to whole
+        # seconds in MySQL.
+        #
+        # Once the run stats tables have been built, the summary is read from the per-step rows
+        # instead, and only the materialization and expectation result events are fetched.
+        if self._can_read_run_stats(run_id):
+            step_stats = self._get_step_stats_from_index(run_id, step_keys)
+            if step_stats is not None:
+                return step_stats
+
+        records = self.get_lazy_records_for_run(
+            run_id,
+            of_type=STEP_STATS_EVENT_TYPES,
+            step_keys=step_keys,
+        )
+
+        try:
+            return build_run_step_stats_from_events(run_id, records)
+        except (seven.JSONDecodeError, DeserializationError) as err:
+            raise DagsterEventLogInvalidForRun(run_id=run_id) from err
+
+    def has_run_stats_index(self) -> bool:
+        """Whether run and step stats can be read from the run stats summary tables, which requires
+        both the schema migration that adds the tables and the data migration that builds them from
+        the existing event log.
+        """
+        return self.has_secondary_index(RUN_STATS_INDEX) and self._has_run_stats_tables()
+
+    def _has_run_stats_tables(self, run_id: Optional[str] = None) -> bool:
+        """Whether the run stats tables exist in the database storing the events of the given run.
+        Run-sharded storages should override this to check the shard of the run.
+        """
+        if not self._run_stats_tables_exist:
+            self._run_stats_tables_exist = self.has_table(RunStatsTable.name)
+        return self._run_stats_tables_exist
+
+    def _can_read_run_stats(self, run_id: str) -> bool:
+        return self.has_secondary_index(RUN_STATS_INDEX) and self._has_run_stats_tables(run_id)
+
+    def _get_stats_from_index(self, run_id: str) -> Optional[DagsterRunStatsSnapshot]:
+        """Reads the stats of a run from the run stats table. Returns None if no row has been written
+        for the run, in which case the stats must be computed from the event log.
+        """
+        query = db_select(
+            [
+                RunStatsTable.c.steps_succeeded,
+                RunStatsTable.c.steps_failed,
+                RunStatsTable.c.materializations,
+                RunStatsTable.c.expectations,
+                RunStatsTable.c.enqueued_time,
+                RunStatsTable.c.launch_time,
+                RunStatsTable.c.start_time,
+                RunStatsTable.c.end_time,
+            ]
+        ).where(RunStatsTable.c.run_id == run_id)
+
+        with self.run_connection(run_id) as conn:
+            row = conn.execute(query).fetchone()
+
+        return DagsterRunStatsSnapshot(run_id, *row) if row else None
+
+    def _get_step_stats_from_index(
+        self, run_id: str, step_keys: Optional[Sequence[str]]
+    ) -> Optional[Sequence[RunStepKeyStatsSnapshot]]:
+        """Reads the step stats of a run from the run step stats table. Returns None if no stats
+        have been written for the run, in which case they must be computed from the event log.
+        """
+        query = (
+            db_select(
+                [
+                    RunStepStatsTable.c.step_key,
+                    RunStepStatsTable.c.status,
+                    RunStepStatsTable.c.start_time,
+                    RunStepStatsTable.c.end_time,
+                    RunStepStatsTable.c.attempts,
+                    RunStepStatsTable.c.attempt_start_time,
+                    RunStepStatsTable.c.attempts_list,
+                    RunStepStatsTable.c.markers,
+                ]
             )
-            .order_by(SqlEventLogStorageTable.c.id.asc())
+            .where(RunStepStatsTable.c.run_id == run_id)
+            .order_by(RunStepStatsTable.c.id.asc())
         )
         if step_keys:
-            raw_event_query = raw_event_query.where(
-                SqlEventLogStorageTable.c.step_key.in_(step_keys)
-            )
+            query = query.where(RunStepStatsTable.c.step_key.in_(step_keys))
 
         with self.run_connection(run_id) as conn:
-            results = conn.execute(raw_event_query).fetchall()
+            has_run_row = conn.execute(
+                db_select([RunStatsTable.c.id]).where(RunStatsTable.c.run_id == run_id)
+            ).fetchone()
+            if not has_run_row:
+                return None
+            rows = conn.execute(query).fetchall()
+
+        if not rows:
+            return []
 
+        materialization_events: Dict[str, List[EventLogEntry]] = defaultdict(list)
+        expectation_results: Dict[str, List[ExpectationResult]] = defaultdict(list)
         try:
-            records = [deserialize_value(json_str, EventLogEntry) for (json_str,) in results]
-            return build_run_step_stats_from_events(run_id, records)
+            for record in self.get_lazy_records_for_run(
+                run_id,
+                of_type={
+                    DagsterEventType.ASSET_MATERIALIZATION,
+                    DagsterEventType.STEP_EXPECTATION_RESULT,
+                },
+                step_keys=step_keys,
+            ):
+                if not record.step_key:
+                    continue
+                if record.dagster_event_type == DagsterEventType.ASSET_MATERIALIZATION:
+                    materialization_events[record.step_key].append(record.event_log_entry)
+                else:
+                    expectation_data = cast(
+                        StepExpectationResultData,
+                        record.event_log_entry.get_dagster_event().event_specific_data,
+                    )
+                    expectation_results[record.step_key].append(expectation_data.expectation_result)
         except (seven.JSONDecodeError, DeserializationError) as err:
             raise DagsterEventLogInvalidForRun(run_id=run_id) from err
 
+        step_stats = []
+        for row in rows:
+            step_key = row[0]
+            state = _step_stats_state_from_row(row[1:])
+            if (
+                state["start_time"] is None
+                and state["end_time"] is None
+                and state["attempts"] is None
+                and step_key not in materialization_events
+                and step_key not in expectation_results
+            ):
+                # only retry or marker events have been stored for this step, which are not
+                # reported without any other step events
+                continue
+
+            attempts_list = [
+                RunStepMarker(start_time=start_time, end_time=end_time)
+                for start_time, end_time in state["attempts_list"]
+            ]
+            if state["end_time"] is not None:
+                attempts_list.append(
+                    RunStepMarker(
+                        start_time=state["attempt_start_time"], end_time=state["end_time"]
+                    )
+                )
+                status = StepEventStatus(state["status"]) if state["status"] else None
+            else:
+                status = StepEventStatus.IN_PROGRESS
+
+            step_stats.append(
+                RunStepKeyStatsSnapshot(
+                    run_id=run_id,
+                    step_key=step_key,
+                    status=status,
+                    start_time=state["start_time"],
+                    end_time=state["end_time"],
+                    materialization_events=materialization_events.get(step_key),
+                    expectation_results=expectation_results.get(step_key),
+                    attempts=state["attempts"],
+                    attempts_list=attempts_list,
+                    markers=[
+                        RunStepMarker(start_time=start_time, end_time=end_time)
+                        for start_time, end_time in state["markers"].values()
+                    ],
+                )
+            )
+        return step_stats
+
+    def _store_run_stats(self, events: Sequence[EventLogEntry]) -> None:
+        """Apply stored events to the run stats summary tables, which are used to serve run and step
+        stats without scanning the event log of the run.
+        """
+        events_by_run_id: Dict[str, List[EventLogEntry]] = defaultdict(list)
+        for event in events:
+            if event.is_dagster_event and (
+                event.dagster_event_type in RUN_STATS_COUNTERS
+                or event.dagster_event_type in RUN_STATS_TIMES
+                or _get_step_stats_key(event)
+            ):
+                events_by_run_id[event.run_id].append(event)
+
+        for run_id, run_events in events_by_run_id.items():
+            if not self._has_run_stats_tables(run_id):
+                continue
+
+            try:
+                self._update_run_stats_rows(run_id, run_events)
+            except db_exc.IntegrityError:
+                # A concurrent writer inserted one of the summary rows after we checked for it. The
+                # rows are written in a single transaction, which was rolled back, so apply the
+                # events again against the existing rows.
+                self._update_run_stats_rows(run_id, run_events)
+
+    def _update_run_stats_rows(self, run_id: str, events: Sequence[EventLogEntry]) -> None:
+        counts: Dict[str, int] = defaultdict(int)
+        times: Dict[str, float] = {}
+        events_by_step_key: Dict[str, List[EventLogEntry]] = defaultdict(list)
+        for event in events:
+            _update_run_stats_changes(counts, times, event)
+            step_key = _get_step_stats_key(event)
+            if step_key:
+                events_by_step_key[step_key].append(event)
+
+        # the counters are incremented rather than set, so all of the rows are written in a single
+        # transaction that is either applied or rolled back as a whole
+        with self.run_connection(run_id) as conn:
+            with _transaction(conn):
+                # the run row is written for any stats event, marking that the run's stats are
+                # tracked
+                has_run_row = conn.execute(
+                    db_select([RunStatsTable.c.id]).where(RunStatsTable.c.run_id == run_id)
+                ).fetchone()
+                if not has_run_row:
+                    conn.execute(RunStatsTable.insert().values(run_id=run_id, **counts, **times))
+                elif counts or times:
+                    # counters are incremented in the database, since the steps of a run may be
+                    # writing events concurrently
+                    conn.execute(
+                        RunStatsTable.update()
+                        .where(RunStatsTable.c.run_id == run_id)
+                        .values(
+                            **{
+                                column: RunStatsTable.c[column] + count
+                                for column, count in counts.items()
+                            },
+                            **times,
+                        )
+                    )
+
+                if not events_by_step_key:
+                    return
+
+                # the events of each step are written by a single process, so the step rows can be
+                # updated from their current values
+                step_rows = conn.execute(
+                    db_select(
+                        [
+                            RunStepStatsTable.c.step_key,
+                            RunStepStatsTable.c.status,
+                            RunStepStatsTable.c.start_time,
+                            RunStepStatsTable.c.end_time,
+                            RunStepStatsTable.c.attempts,
+                            RunStepStatsTable.c.attempt_start_time,
+                            RunStepStatsTable.c.attempts_list,
+                            RunStepStatsTable.c.markers,
+                        ]
+                    )
+                    .where(RunStepStatsTable.c.run_id == run_id)
+                    .where(RunStepStatsTable.c.step_key.in_(list(events_by_step_key.keys())))
+                ).fetchall()
+                states = {row[0]: _step_stats_state_from_row(row[1:]) for row in step_rows}
+
+                for step_key, step_events in events_by_step_key.items():
+                    state = states.get(step_key, _step_stats_state_from_row(None))
+                    for event in step_events:
+                        _apply_step_stats_event(state, event)
+
+                    if step_key in states:
+                        conn.execute(
+                            RunStepStatsTable.update()
+                            .where(RunStepStatsTable.c.run_id == run_id)
+                            .where(RunStepStatsTable.c.step_key == step_key)
+                            .values(**_step_stats_row_values(state))
+                        )
+                    else:
+                        conn.execute(
+                            RunStepStatsTable.insert().values(
+                                run_id=run_id, step_key=step_key, **_step_stats_row_values(state)
+                            )
+                        )
+
+    def get_event_log_run_ids(self) -> Sequence[str]:
+        """Returns the ids of all of the runs with stored events."""
+        query = db_select([SqlEventLogStorageTable.c.run_id]).distinct()
+        with self.run_connection(run_id=None) as conn:
+            return [row[0] for row in conn.execute(query).fetchall() if row[0]]
+
+    def rebuild_run_stats(self, run_id: str) -> None:
+        """Rebuilds the run stats summary rows of a run from its event log."""
+        check.str_param(run_id, "run_id")
+        if not self._has_run_stats_tables(run_id):
+            return
+
+        counts: Dict[str, int] = {column: 0 for column in RUN_STATS_COUNTERS.values()}
+        times: Dict[str, float] = {}
+        states: Dict[str, Dict[str, Any]] = {}
+        try:
+            for record in self.iterate_records_for_run(run_id):
+                event = record.event_log_entry
+                if not event.is_dagster_event:
+                    continue
+                _update_run_stats_changes(counts, times, event)
+                step_key = _get_step_stats_key(event)
+                if step_key:
+                    _apply_step_stats_event(
+                        states.setdefault(step_key, _step_stats_state_from_row(None)), event
+                    )
+        except DagsterEventLogInvalidForRun:
+            logging.exception("Could not build run stats for run %s.", run_id)
+            return
+
+        with self.run_connection(run_id) as conn:
+            with _transaction(conn):
+                conn.execute(RunStatsTable.delete().where(RunStatsTable.c.run_id == run_id))
+                conn.execute(RunStepStatsTable.delete().where(RunStepStatsTable.c.run_id == run_id))
+                conn.execute(RunStatsTable.insert().values(run_id=run_id, **counts, **times))
+                if states:
+                    conn.execute(
+                        RunStepStatsTable.insert(),
+                        [
+                            dict(run_id=run_id, step_key=step_key, **_step_stats_row_values(state))
+                            for step_key, state in states.items()
+                        ],
+                    )
+
     def _apply_migration(self, migration_name, migration_fn, print_fn, force):
         if self.has_secondary_index(migration_name):
             if not force:
@@ -650,6 +1231,10 @@ def wipe(self) -> None:
             if self.has_table("pending_steps"):
                 conn.execute(PendingStepsTable.delete())
 
+            if self.has_table("run_stats"):
+                conn.execute(RunStatsTable.delete())
+                conn.execute(RunStepStatsTable.delete())
+
         self._wipe_index()
 
     def _wipe_index(self):
@@ -669,6 +1254,10 @@ def _wipe_index(self):
             if self.has_table("pending_steps"):
                 conn.execute(PendingStepsTable.delete())
 
+            if self.has_table("run_stats"):
+                conn.execute(RunStatsTable.delete())
+                conn.execute(RunStepStatsTable.delete())
+
     def delete_events(self, run_id: str) -> None:
         with self.run_connection(run_id) as conn:
             self.delete_events_for_run(conn, run_id)
@@ -693,6 +1282,9 @@ def delete_events_for_run(self, conn: Connection, run_id: str) -> None:
             for row in conn.execute(removed_asset_key_query).fetchall()
         ]
         conn.execute(delete_statement)
+        if conn.dialect.has_table(conn, RunStatsTable.name):
+            conn.execute(RunStatsTable.delete().where(RunStatsTable.c.run_id == run_id))
+            conn.execute(RunStepStatsTable.delete().where(RunStepStatsTable.c.run_id == run_id))
         if len(removed_asset_keys) > 0:
             keys_to_check = []
             keys_to_check.extend([key.to_string() for key in removed_asset_keys])  # type: ignore  # (bad sig?)
@@ -733,7 +1325,7 @@ def update_event_log_record(self, record_id: int, event: EventLogEntry) -> None:
                 SqlEventLogStorageTable.update()
                 .where(SqlEventLogStorageTable.c.id == record_id)
                 .values(
-                    event=serialize_value(event),
+                    event=serialize_value(event, codec=self._serdes_codec),
                     dagster_event_type=dagster_event_type,
                     timestamp=datetime.utcfromtimestamp(event.timestamp),
                     step_key=event.step_key,
@@ -1046,6 +1638,38 @@ def get_maximum_record_id(self) -> Optional[int]:
             result = conn.execute(db_select([db.func.max(SqlEventLogStorageTable.c.id)])).fetchone()
             return result[0]  # type: ignore
 
+    def get_lazy_records_for_runs(
+        self,
+        run_ids: Sequence[str],
+        after_cursor: int = -1,
+        before_cursor: Optional[int] = None,
+        limit: Optional[int] = None,
+        include_event_body: bool = True,
+    ) -> Sequence[LazyEventLogRecord]:
+        check.sequence_param(run_ids, "run_ids", of_type=str)
+        check.int_param(after_cursor, "after_cursor")
+        check.opt_int_param(before_cursor, "before_cursor")
+        check.opt_int_param(limit, "limit")
+        check.bool_param(include_event_body, "include_event_body")
+        if not run_ids:
+            return []
+
+        query = (
+            db_select([SqlEventLogStorageTable.c.run_id, *_lazy_record_columns(include_event_body)])
+            .where(SqlEventLogStorageTable.c.run_id.in_(run_ids))
+            .where(SqlEventLogStorageTable.c.id > after_cursor)
+            .order_by(SqlEventLogStorageTable.c.id.asc())
+        )
+        if before_cursor is not None:
+            query = query.where(SqlEventLogStorageTable.c.id <= before_cursor)
+        if limit:
+            query = query.limit(limit)
+
+        with self.index_connection() as conn:
+            results = conn.execute(query).fetchall()
+
+        return [_lazy_record_from_row(row[0], row[1:], include_event_body) for row in results]
+
     def _construct_asset_record_from_row(
         self,
         row,
@@ -2495,3 +3119,148 @@ def _get_from_row(row: SqlAlchemyRow, column: str) -> object:
     if column not in row.keys():
         return None
     return row[column]
+
+
+def _lazy_record_columns(include_event_body: bool) -> List[Any]:
+    columns = [
+        SqlEventLogStorageTable.c.id,
+        SqlEventLogStorageTable.c.dagster_event_type,
+        SqlEventLogStorageTable.c.step_key,
+        SqlEventLogStorageTable.c.timestamp,
+        SqlEventLogStorageTable.c.asset_key,
+        SqlEventLogStorageTable.c.partition,
+    ]
+    if include_event_body:
+        columns.append(SqlEventLogStorageTable.c.event)
+    return columns
+
+
+def _lazy_record_from_row(
+    run_id: str, row: Sequence[Any], include_event_body: bool
+) -> LazyEventLogRecord:
+    return LazyEventLogRecord(
+        storage_id=row[0],
+        run_id=run_id,
+        dagster_event_type=DagsterEventType(row[1]) if row[1] else None,
+        step_key=row[2],
+        timestamp=datetime_as_float(row[3]),
+        asset_key=AssetKey.from_db_string(row[4]) if row[4] else None,
+        partition_key=row[5],
+        serialized_event=row[6] if include_event_body else None,
+    )
+
+
+def _is_indexed_asset_event(event: EventLogEntry) -> bool:
+    return bool(
+        event.is_dagster_event
+        and event.dagster_event_type in ASSET_EVENTS
+        and event.get_dagster_event().asset_key
+    )
+
+
+@contextmanager
+def _transaction(conn: Connection) -> Iterator[None]:
+    # some storages vend connections that are already inside a transaction block
+    if conn.in_transaction():
+        yield
+    else:
+        with conn.begin():
+            yield
+
+
+def _update_run_stats_changes(
+    counts: Dict[str, int], times: Dict[str, float], event: EventLogEntry
+) -> None:
+    event_type = event.dagster_event_type
+    if event_type in RUN_STATS_COUNTERS:
+        counts[RUN_STATS_COUNTERS[event_type]] += 1
+    elif event_type in RUN_STATS_TIMES:
+        times[RUN_STATS_TIMES[event_type]] = event.timestamp
+
+
+def _get_step_stats_key(event: EventLogEntry) -> Optional[str]:
+    """Returns the key of the step whose stats are affected by the event, if any."""
+    dagster_event = event.dagster_event
+    if not dagster_event or not dagster_event.step_key:
+        return None
+    if dagster_event.event_type not in STEP_STATS_EVENT_TYPES:
+        return None
+    if dagster_event.event_type in MARKER_EVENTS:
+        engine_event_data = dagster_event.engine_event_data
+        if not (engine_event_data.marker_start or engine_event_data.marker_end):
+            return None
+    return dagster_event.step_key
+
+
+def _step_stats_state_from_row(row: Optional[Sequence[Any]]) -> Dict[str, Any]:
+    if row is None:
+        return dict(
+            status=None,
+            start_time=None,
+            end_time=None,
+            attempts=None,
+            attempt_start_time=None,
+            attempts_list=[],
+            markers={},
+        )
+
+    status, start_time, end_time, attempts, attempt_start_time, attempts_list, markers = row
+    return dict(
+        status=status,
+        start_time=start_time,
+        end_time=end_time,
+        attempts=attempts,
+        attempt_start_time=attempt_start_time,
+        attempts_list=seven.json.loads(attempts_list) if attempts_list else [],
+        markers={key: [start, end] for key, start, end in seven.json.loads(markers)}
+        if markers
+        else {},
+    )
+
+
+def _step_stats_row_values(state: Mapping[str, Any]) -> Dict[str, Any]:
+    return dict(
+        status=state["status"],
+        start_time=state["start_time"],
+        end_time=state["end_time"],
+        attempts=state["attempts"],
+        attempt_start_time=state["attempt_start_time"],
+        attempts_list=seven.json.dumps(state["attempts_list"]),
+        markers=seven.json.dumps(
+            [[key, start, end] for key, (start, end) in state["markers"].items()]
+        ),
+    )
+
+
+def _apply_step_stats_event(state: Dict[str, Any], event: EventLogEntry) -> None:
+    """Incremental equivalent of `build_run_step_stats_from_events`, applying a single event to the
+    stored summary of a step.
+    """
+    dagster_event = event.get_dagster_event()
+    event_type = dagster_event.event_type
+    timestamp = event.timestamp
+
+    if event_type == DagsterEventType.STEP_START:
+        state["start_time"] = timestamp
+        state["attempts"] = 1
+        state["attempt_start_time"] = timestamp
+    elif event_type == DagsterEventType.STEP_FAILURE:
+        state["end_time"] = timestamp
+        state["status"] = StepEventStatus.FAILURE.value
+    elif event_type == DagsterEventType.STEP_SUCCESS:
+        state["end_time"] = timestamp
+        state["status"] = StepEventStatus.SUCCESS.value
+    elif event_type == DagsterEventType.STEP_SKIPPED:
+        state["end_time"] = timestamp
+        state["status"] = StepEventStatus.SKIPPED.value
+    elif event_type == DagsterEventType.STEP_RESTARTED:
+        state["attempts"] = (state["attempts"] or 0) + 1
+        state["attempt_start_time"] = timestamp
+    elif event_type == DagsterEventType.STEP_UP_FOR_RETRY:
+        state["attempts_list"].append([state["attempt_start_time"], timestamp])
+    elif event_type in MARKER_EVENTS:
+        engine_event_data = dagster_event.engine_event_data
+        if engine_event_data.marker_start:
+            state["markers"].setdefault(engine_event_data.marker_start, [None, None])[0] = timestamp
+        if engine_event_data.marker_end:
+            state["markers"].setdefault(engine_event_data.marker_end, [None, None])[1] = timestamp
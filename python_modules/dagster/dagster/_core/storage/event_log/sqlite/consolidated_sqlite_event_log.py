@@ -1,18 +1,13 @@
-import logging
 import os
-from collections import defaultdict
 from contextlib import contextmanager
 from typing import Any, Mapping, Optional
 
 import sqlalchemy as db
 from sqlalchemy.pool import NullPool
 from typing_extensions import Self
-from watchdog.events import PatternMatchingEventHandler
-from watchdog.observers import Observer
 
 import dagster._check as check
 from dagster._config import StringSource
-from dagster._core.storage.dagster_run import DagsterRunStatus
 from dagster._core.storage.event_log.base import EventLogCursor
 from dagster._core.storage.sql import (
     check_alembic_revision,
@@ -27,6 +22,7 @@
 
 from ..schema import SqlEventLogStorageMetadata
 from ..sql_event_log import SqlDbConnection, SqlEventLogStorage
+from .sqlite_event_watcher import SqliteEventWatcher
 
 SQLITE_EVENT_LOG_FILENAME = "event_log"
 
@@ -57,8 +53,9 @@ def __init__(self, base_dir, inst_data: Optional[ConfigurableClassData] = None):
         self._conn_string = create_db_conn_string(base_dir, SQLITE_EVENT_LOG_FILENAME)
         self._secondary_index_cache = {}
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
-        self._watchers = defaultdict(dict)
-        self._obs = None
+        self._event_watcher = SqliteEventWatcher(
+            self, self._base_dir, lambda _run_id: self.get_db_path()
+        )
 
         if not os.path.exists(self.get_db_path()):
             self._init_db()
@@ -136,72 +133,17 @@ def enable_secondary_index(self, name):
             del self._secondary_index_cache[name]
 
     def watch(self, run_id, cursor, callback):
-        if not self._obs:
-            self._obs = Observer()
-            self._obs.start()
-            self._obs.schedule(
-                ConsolidatedSqliteEventLogStorageWatchdog(self), self._base_dir, True
-            )
+        if cursor and EventLogCursor.parse(cursor).is_offset_cursor():
+            check.failed("Cannot call `watch` with an offset cursor")
 
-        self._watchers[run_id][callback] = cursor
+        self._event_watcher.watch_run(run_id, cursor, callback)
 
     @property
     def supports_global_concurrency_limits(self) -> bool:
         return False
 
-    def on_modified(self):
-        keys = [
-            (run_id, callback)
-            for run_id, callback_dict in self._watchers.items()
-            for callback, _ in callback_dict.items()
-        ]
-        for run_id, callback in keys:
-            cursor = self._watchers[run_id][callback]
-
-            # fetch events
-            connection = self.get_records_for_run(run_id, cursor)
-
-            # update cursor
-            if connection.cursor:
-                self._watchers[run_id][callback] = connection.cursor
-
-            for record in connection.records:
-                status = None
-                try:
-                    status = callback(
-                        record.event_log_entry,
-                        str(EventLogCursor.from_storage_id(record.storage_id)),
-                    )
-                except Exception:
-                    logging.exception("Exception in callback for event watch on run %s.", run_id)
-
-                if (
-                    status == DagsterRunStatus.SUCCESS
-                    or status == DagsterRunStatus.FAILURE
-                    or status == DagsterRunStatus.CANCELED
-                ):
-                    self.end_watch(run_id, callback)
-
     def end_watch(self, run_id, handler):
-        if run_id in self._watchers and handler in self._watchers[run_id]:
-            del self._watchers[run_id][handler]
+        self._event_watcher.unwatch_run(run_id, handler)
 
     def dispose(self):
-        if self._obs:
-            self._obs.stop()
-            self._obs.join(timeout=15)
-
-
-class ConsolidatedSqliteEventLogStorageWatchdog(PatternMatchingEventHandler):
-    def __init__(self, event_log_storage, **kwargs):
-        self._event_log_storage = check.inst_param(
-            event_log_storage, "event_log_storage", ConsolidatedSqliteEventLogStorage
-        )
-        self._log_path = event_log_storage.get_db_path()
-        super(ConsolidatedSqliteEventLogStorageWatchdog, self).__init__(
-            patterns=[self._log_path], **kwargs
-        )
-
-    def on_modified(self, event):
-        check.invariant(event.src_path == self._log_path)
-        self._event_log_storage.on_modified()
+        self._event_watcher.close()
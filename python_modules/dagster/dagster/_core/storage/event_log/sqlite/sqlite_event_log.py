@@ -8,15 +8,24 @@
 import time
 from collections import defaultdict
 from contextlib import contextmanager
-from typing import TYPE_CHECKING, Any, ContextManager, Iterable, Iterator, Optional, Sequence
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ContextManager,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+)
 
 import sqlalchemy as db
 import sqlalchemy.exc as db_exc
 from sqlalchemy.engine import Connection, Engine
 from sqlalchemy.pool import NullPool
 from tqdm import tqdm
-from watchdog.events import FileSystemEvent, PatternMatchingEventHandler
-from watchdog.observers import Observer
 
 import dagster._check as check
 import dagster._seven as seven
@@ -27,7 +36,7 @@
 from dagster._core.event_api import EventHandlerFn
 from dagster._core.events import ASSET_EVENTS
 from dagster._core.events.log import EventLogEntry
-from dagster._core.storage.dagster_run import DagsterRunStatus, RunsFilter
+from dagster._core.storage.dagster_run import RunsFilter
 from dagster._core.storage.event_log.base import EventLogCursor, EventLogRecord, EventRecordsFilter
 from dagster._core.storage.sql import (
     AlembicVersion,
@@ -47,8 +56,14 @@
 from dagster._serdes.serdes import deserialize_value
 from dagster._utils import mkdir_p
 
-from ..schema import SqlEventLogStorageMetadata, SqlEventLogStorageTable
+from ..schema import (
+    AssetEventTagsTable,
+    RunStatsTable,
+    SqlEventLogStorageMetadata,
+    SqlEventLogStorageTable,
+)
 from ..sql_event_log import RunShardedEventsCursor, SqlEventLogStorage
+from .sqlite_event_watcher import SqliteEventWatcher
 
 if TYPE_CHECKING:
     from dagster._core.storage.sqlite_storage import SqliteStorageConfig
@@ -87,15 +102,18 @@ def __init__(self, base_dir: str, inst_data: Optional[ConfigurableClassData] = N
         self._base_dir = os.path.abspath(check.str_param(base_dir, "base_dir"))
         mkdir_p(self._base_dir)
 
-        self._obs = None
-
-        self._watchers = defaultdict(dict)
+        # All watched runs are served by a single watcher thread, which is woken by changes to the
+        # shard files
+        self._event_watcher = SqliteEventWatcher(self, self._base_dir, self.path_for_shard)
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
 
         # Used to ensure that each run ID attempts to initialize its DB the first time it connects,
         # ensuring that the database will be created if it doesn't exist
         self._initialized_dbs = set()
 
+        # Run shards known to have the run stats tables
+        self._run_stats_shards: Set[str] = set()
+
         # Ensure that multiple threads (like the event log watcher) interact safely with each other
         self._db_lock = threading.Lock()
 
@@ -145,12 +163,26 @@ def get_all_run_ids(self) -> Sequence[str]:
             if os.path.splitext(os.path.basename(filename))[0] != INDEX_SHARD_NAME
         ]
 
+    def get_event_log_run_ids(self) -> Sequence[str]:
+        return self.get_all_run_ids()
+
     def has_table(self, table_name: str) -> bool:
         conn_string = self.conn_string_for_shard(INDEX_SHARD_NAME)
         engine = create_engine(conn_string, poolclass=NullPool)
         with engine.connect() as conn:
             return bool(engine.dialect.has_table(conn, table_name))
 
+    def _has_run_stats_tables(self, run_id: Optional[str] = None) -> bool:
+        if run_id is None:
+            return super()._has_run_stats_tables()
+
+        # run shards created before the run stats tables were added do not have them
+        if run_id not in self._run_stats_shards:
+            with self.run_connection(run_id) as conn:
+                if conn.dialect.has_table(conn, RunStatsTable.name):
+                    self._run_stats_shards.add(run_id)
+        return run_id in self._run_stats_shards
+
     def path_for_shard(self, run_id: str) -> str:
         return os.path.join(self._base_dir, f"{run_id}.db")
 
@@ -239,14 +271,10 @@ def store_event(self, event: EventLogEntry) -> None:
         with self.run_connection(run_id) as conn:
             conn.execute(insert_event_statement)
 
+        self._store_run_stats([event])
+
         if event.is_dagster_event and event.dagster_event.asset_key:  # type: ignore
-            check.invariant(
-                event.dagster_event_type in ASSET_EVENTS,
-                (
-                    "Can only store asset materializations, materialization_planned, and"
-                    " observations in index database"
-                ),
-            )
+            self._check_can_index_asset_event(event)
 
             event_id = None
 
@@ -264,6 +292,66 @@ def store_event(self, event: EventLogEntry) -> None:
 
             self.store_asset_event_tags(event, event_id)
 
+    def _check_can_index_asset_event(self, event: EventLogEntry) -> None:
+        check.invariant(
+            event.dagster_event_type in ASSET_EVENTS,
+            (
+                "Can only store asset materializations, materialization_planned, and"
+                " observations in index database"
+            ),
+        )
+
+    def store_events(self, events: Sequence[EventLogEntry]) -> None:
+        """Overridden method to batch the writes to each run shard, and to mirror the batch's asset
+        events in the central assets.db sqlite shard in a single transaction.
+
+        Args:
+            events (Sequence[EventLogEntry]): The events to store.
+        """
+        check.sequence_param(events, "events", of_type=EventLogEntry)
+
+        events_by_run_id: Dict[str, List[EventLogEntry]] = defaultdict(list)
+        asset_events = []
+        for event in events:
+            events_by_run_id[event.run_id].append(event)
+            if event.is_dagster_event and event.get_dagster_event().asset_key:
+                self._check_can_index_asset_event(event)
+                asset_events.append(event)
+
+        for run_id, run_events in events_by_run_id.items():
+            with self.run_connection(run_id) as conn:
+                conn.execute(
+                    SqlEventLogStorageTable.insert(),
+                    [self._get_event_insert_values(event) for event in run_events],
+                )
+
+        self._store_run_stats(events)
+
+        if not asset_events:
+            return
+
+        has_asset_key_index_cols = self.has_asset_key_index_cols()
+        has_asset_event_tags_table = self.has_table(AssetEventTagsTable.name)
+        try:
+            with self.index_connection() as conn:
+                event_ids = self._insert_event_rows(conn, asset_events)
+                self._store_asset_index_rows(
+                    conn,
+                    list(zip(asset_events, event_ids)),
+                    has_asset_key_index_cols,
+                    has_asset_event_tags_table,
+                )
+        except db_exc.IntegrityError:
+            # another process created one of the batch's asset rows concurrently; the index
+            # transaction was rolled back, so mirror the asset events one at a time instead
+            for event in asset_events:
+                with self.index_connection() as conn:
+                    event_id = conn.execute(self.prepare_insert_event(event)).inserted_primary_key[
+                        0
+                    ]
+                self.store_asset_event(event, event_id)
+                self.store_asset_event_tags(event, event_id)
+
     def get_event_records(
         self,
         event_records_filter: EventRecordsFilter,
@@ -402,26 +490,16 @@ def wipe_asset(self, asset_key: AssetKey) -> None:
         self._delete_mirrored_events_for_asset_key(asset_key)
 
     def watch(self, run_id: str, cursor: Optional[str], callback: EventHandlerFn) -> None:
-        if not self._obs:
-            self._obs = Observer()
-            self._obs.start()
-
-        watchdog = SqliteEventLogStorageWatchdog(self, run_id, callback, cursor)
-        self._watchers[run_id][callback] = (
-            watchdog,
-            self._obs.schedule(watchdog, self._base_dir, True),
-        )
+        if cursor and EventLogCursor.parse(cursor).is_offset_cursor():
+            check.failed("Cannot call `watch` with an offset cursor")
+
+        self._event_watcher.watch_run(run_id, cursor, callback)
 
     def end_watch(self, run_id: str, handler: EventHandlerFn) -> None:
-        if handler in self._watchers[run_id]:
-            event_handler, watch = self._watchers[run_id][handler]
-            self._obs.remove_handler_for_watch(event_handler, watch)  # type: ignore  # (possible none)
-            del self._watchers[run_id][handler]
+        self._event_watcher.unwatch_run(run_id, handler)
 
     def dispose(self) -> None:
-        if self._obs:
-            self._obs.stop()
-            self._obs.join(timeout=15)
+        self._event_watcher.close()
 
     def alembic_version(self) -> AlembicVersion:
         alembic_config = get_alembic_config(__file__)
@@ -435,46 +513,3 @@ def is_run_sharded(self) -> bool:
     @property
     def supports_global_concurrency_limits(self) -> bool:
         return False
-
-
-class SqliteEventLogStorageWatchdog(PatternMatchingEventHandler):
-    def __init__(
-        self,
-        event_log_storage: SqliteEventLogStorage,
-        run_id: str,
-        callback: EventHandlerFn,
-        cursor: Optional[str],
-        **kwargs: Any,
-    ):
-        self._event_log_storage = check.inst_param(
-            event_log_storage, "event_log_storage", SqliteEventLogStorage
-        )
-        self._run_id = check.str_param(run_id, "run_id")
-        self._cb = check.callable_param(callback, "callback")
-        self._log_path = event_log_storage.path_for_shard(run_id)
-        self._cursor = cursor
-        super(SqliteEventLogStorageWatchdog, self).__init__(patterns=[self._log_path], **kwargs)
-
-    def _process_log(self) -> None:
-        connection = self._event_log_storage.get_records_for_run(self._run_id, self._cursor)
-        if connection.cursor:
-            self._cursor = connection.cursor
-        for record in connection.records:
-            status = None
-            try:
-                status = self._cb(
-                    record.event_log_entry, str(EventLogCursor.from_storage_id(record.storage_id))
-                )
-            except Exception:
-                logging.exception("Exception in callback for event watch on run %s.", self._run_id)
-
-            if (
-                status == DagsterRunStatus.SUCCESS
-                or status == DagsterRunStatus.FAILURE
-                or status == DagsterRunStatus.CANCELED
-            ):
-                self._event_log_storage.end_watch(self._run_id, self._cb)
-
-    def on_modified(self, event: FileSystemEvent) -> None:
-        check.invariant(event.src_path == self._log_path)
-        self._process_log()
@@ -0,0 +1,182 @@
+import logging
+import os
+import sqlite3
+from typing import AbstractSet, Callable, Dict, Optional, Set, Tuple
+
+from watchdog.events import FileSystemEvent, PatternMatchingEventHandler
+from watchdog.observers import Observer
+
+import dagster._check as check
+from dagster._core.storage.event_log.base import EventLogStorage
+
+from ..polling_event_watcher import (
+    MAX_EVENTS_PER_POLL,
+    SqlPollingEventWatcher,
+    SqlPollingEventWatcherThread,
+)
+
+SQLITE_DB_FILE_PATTERNS = ["*.db", "*.db-wal"]
+
+
+class SqliteEventWatcher(SqlPollingEventWatcher):
+    """Event log watcher for the SQLite event log storages.
+
+    Like SqlPollingEventWatcher, all of the watched run_ids are served by a single thread. Instead of
+    querying on every poll, the thread is woken by filesystem notifications for the storage's
+    database files, and only queries the databases that have been written to since they were last
+    read, as reported by `PRAGMA data_version`. Notifications that arrive while the thread is busy
+    are coalesced into a single wake-up, so each change results in one incremental query for the
+    consolidated database, or one per changed run shard.
+    """
+
+    def __init__(
+        self,
+        event_log_storage: EventLogStorage,
+        base_dir: str,
+        db_path_for_run: Callable[[str], str],
+    ):
+        super().__init__(event_log_storage)
+        self._base_dir = check.str_param(base_dir, "base_dir")
+        self._db_path_for_run = check.callable_param(db_path_for_run, "db_path_for_run")
+
+    def _create_watcher_thread(self) -> SqlPollingEventWatcherThread:
+        return SqliteEventWatcherThread(
+            self._event_log_storage, self._base_dir, self._db_path_for_run
+        )
+
+
+class SqliteEventWatcherThread(SqlPollingEventWatcherThread):
+    """SqlPollingEventWatcherThread that skips polls when none of the watched databases changed.
+
+    The data version connections are only used from the watcher thread.
+    """
+
+    # SQLite allows a single writer at a time, so storage ids become visible in order
+    rescan_window_seconds = 0
+
+    def __init__(
+        self,
+        event_log_storage: EventLogStorage,
+        base_dir: str,
+        db_path_for_run: Callable[[str], str],
+    ):
+        super().__init__(event_log_storage)
+        self._base_dir = base_dir
+        self._db_path_for_run = db_path_for_run
+
+        # db path -> (connection, inode of the db file when the connection was opened)
+        self._data_version_connections: Dict[str, Tuple[sqlite3.Connection, int]] = {}
+        self._data_versions: Dict[str, int] = {}
+        self._changed_db_paths: Set[str] = set()
+        self._has_more_events = False
+        self.name = "sqlite-event-watch"
+
+    def notify(self) -> None:
+        self._wake.set()
+
+    def run(self):
+        observer = Observer()
+        observer.schedule(SqliteDbFileEventHandler(self.notify), self._base_dir, recursive=False)
+        observer.start()
+        try:
+            super().run()
+        finally:
+            observer.stop()
+            observer.join(timeout=15)
+            for conn, _ in self._data_version_connections.values():
+                conn.close()
+            self._data_version_connections = {}
+
+    def _poll(self) -> int:
+        with self._callbacks_lock:
+            run_ids = {
+                *self._callbacks_by_run_id.keys(),
+                *[run_id for run_id, _ in self._pending_callbacks],
+            }
+            has_pending_callbacks = bool(self._pending_callbacks)
+
+        # the data versions must be read before querying for new events, so that a write that
+        # lands in between is picked up by the next poll
+        self._changed_db_paths = self._get_changed_db_paths(
+            {self._db_path_for_run(run_id) for run_id in run_ids}
+        )
+        if not (self._changed_db_paths or has_pending_callbacks or self._has_more_events):
+            return 0
+
+        num_new_events = super()._poll()
+        # a poll of all runs is limited to MAX_EVENTS_PER_POLL events, so the rest have to be
+        # fetched without waiting for another change
+        self._has_more_events = num_new_events >= MAX_EVENTS_PER_POLL
+        return num_new_events
+
+    def _should_poll_run(self, run_id: str) -> bool:
+        # runs that were just added have not been polled yet
+        return (
+            run_id not in self._run_storage_id_cursors
+            or self._db_path_for_run(run_id) in self._changed_db_paths
+        )
+
+    def _get_changed_db_paths(self, db_paths: AbstractSet[str]) -> Set[str]:
+        for db_path in set(self._data_version_connections.keys()) - db_paths:
+            self._close_data_version_connection(db_path)
+
+        changed_db_paths = set()
+        for db_path in db_paths:
+            data_version = self._get_data_version(db_path)
+            if data_version is not None and data_version != self._data_versions.get(db_path):
+                self._data_versions[db_path] = data_version
+                changed_db_paths.add(db_path)
+        return changed_db_paths
+
+    def _get_data_version(self, db_path: str) -> Optional[int]:
+        # PRAGMA data_version only changes when another connection commits to the database, and
+        # is only comparable across reads from the same connection, so a connection is held open
+        # for each watched database. The database files may be deleted and recreated (e.g. when
+        # the storage is wiped), in which case the connection is reopened.
+        try:
+            inode = os.stat(db_path).st_ino
+        except FileNotFoundError:
+            self._close_data_version_connection(db_path)
+            return None
+
+        if db_path in self._data_version_connections:
+            conn, conn_inode = self._data_version_connections[db_path]
+            if conn_inode != inode:
+                self._close_data_version_connection(db_path)
+
+        try:
+            if db_path not in self._data_version_connections:
+                conn = sqlite3.connect(f"file:{db_path}?mode=rw", uri=True)
+                self._data_version_connections[db_path] = (conn, inode)
+            conn, _ = self._data_version_connections[db_path]
+            return conn.execute("PRAGMA data_version").fetchone()[0]
+        except sqlite3.Error:
+            logging.exception("Exception while checking %s for changes.", db_path)
+            self._close_data_version_connection(db_path)
+            return None
+
+    def _close_data_version_connection(self, db_path: str) -> None:
+        self._data_versions.pop(db_path, None)
+        if db_path in self._data_version_connections:
+            conn, _ = self._data_version_connections.pop(db_path)
+            conn.close()
+
+
+class SqliteDbFileEventHandler(PatternMatchingEventHandler):
+    def __init__(self, on_change: Callable[[], None], **kwargs):
+        self._on_change = check.callable_param(on_change, "on_change")
+        super(SqliteDbFileEventHandler, self).__init__(
+            patterns=SQLITE_DB_FILE_PATTERNS, ignore_directories=True, **kwargs
+        )
+
+    def on_created(self, event: FileSystemEvent) -> None:
+        self._on_change()
+
+    def on_modified(self, event: FileSystemEvent) -> None:
+        self._on_change()
+
+    def on_deleted(self, event: FileSystemEvent) -> None:
+        self._on_change()
+
+    def on_moved(self, event: FileSystemEvent) -> None:
+        self._on_change()
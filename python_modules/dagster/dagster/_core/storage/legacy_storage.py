@@ -1,6 +1,7 @@
 from typing import (
     TYPE_CHECKING,
     Iterable,
+    Iterator,
     Mapping,
     Optional,
     Sequence,
@@ -21,6 +22,7 @@
 
 from .base_storage import DagsterStorage
 from .event_log.base import (
+    DEFAULT_RECORDS_PAGE_SIZE,
     AssetRecord,
     EventLogConnection,
     EventLogRecord,
@@ -33,6 +35,7 @@
 if TYPE_CHECKING:
     from dagster._core.definitions.events import AssetKey
     from dagster._core.definitions.run_request import InstigatorType
+    from dagster._core.event_api import LazyEventLogRecord
     from dagster._core.events import DagsterEvent, DagsterEventType
     from dagster._core.events.log import EventLogEntry
     from dagster._core.execution.backfill import BulkActionStatus, PartitionBackfill
@@ -59,6 +62,7 @@
         TagBucket,
     )
     from dagster._core.storage.partition_status_cache import AssetStatusCacheValue
+    from dagster._core.storage.sql import SqlPoolStats
     from dagster._daemon.types import DaemonHeartbeat
 
 
@@ -303,6 +307,9 @@ def dispose(self) -> None:
     def optimize_for_webserver(self, statement_timeout: int, pool_recycle: int) -> None:
         return self._storage.run_storage.optimize_for_webserver(statement_timeout, pool_recycle)
 
+    def get_pool_stats(self) -> Optional["SqlPoolStats"]:
+        return self._storage.run_storage.get_pool_stats()
+
     def add_daemon_heartbeat(self, daemon_heartbeat: "DaemonHeartbeat") -> None:
         return self._storage.run_storage.add_daemon_heartbeat(daemon_heartbeat)
 
@@ -437,6 +444,9 @@ def optimize_for_webserver(self, statement_timeout: int, pool_recycle: int) -> N
             statement_timeout, pool_recycle
         )
 
+    def get_pool_stats(self) -> Optional["SqlPoolStats"]:
+        return self._storage.event_log_storage.get_pool_stats()
+
     def get_event_records(
         self,
         event_records_filter: Optional[EventRecordsFilter] = None,
@@ -568,6 +578,43 @@ def get_records_for_run(
             run_id, cursor, of_type, limit, ascending
         )
 
+    def iterate_records_for_run(
+        self,
+        run_id: str,
+        cursor: Optional[str] = None,
+        of_type: Optional[Union["DagsterEventType", Set["DagsterEventType"]]] = None,
+        page_size: int = DEFAULT_RECORDS_PAGE_SIZE,
+    ) -> Iterator[EventLogRecord]:
+        return self._storage.event_log_storage.iterate_records_for_run(
+            run_id, cursor, of_type, page_size
+        )
+
+    def get_lazy_records_for_run(
+        self,
+        run_id: str,
+        cursor: Optional[str] = None,
+        of_type: Optional[Union["DagsterEventType", Set["DagsterEventType"]]] = None,
+        limit: Optional[int] = None,
+        ascending: bool = True,
+        step_keys: Optional[Sequence[str]] = None,
+        include_event_body: bool = True,
+    ) -> Sequence["LazyEventLogRecord"]:
+        return self._storage.event_log_storage.get_lazy_records_for_run(
+            run_id, cursor, of_type, limit, ascending, step_keys, include_event_body
+        )
+
+    def get_lazy_records_for_runs(
+        self,
+        run_ids: Sequence[str],
+        after_cursor: int = -1,
+        before_cursor: Optional[int] = None,
+        limit: Optional[int] = None,
+        include_event_body: bool = True,
+    ) -> Sequence["LazyEventLogRecord"]:
+        return self._storage.event_log_storage.get_lazy_records_for_runs(
+            run_ids, after_cursor, before_cursor, limit, include_event_body
+        )
+
     def set_concurrency_slots(self, concurrency_key: str, num: int) -> None:
         return self._storage.event_log_storage.set_concurrency_slots(concurrency_key, num)
 
@@ -737,5 +784,8 @@ def optimize_for_webserver(self, statement_timeout: int, pool_recycle: int) -> N
             statement_timeout, pool_recycle
         )
 
+    def get_pool_stats(self) -> Optional["SqlPoolStats"]:
+        return self._storage.schedule_storage.get_pool_stats()
+
     def dispose(self) -> None:
         return self._storage.schedule_storage.dispose()
@@ -333,7 +333,7 @@ def _get_updated_failed_and_in_progress_partition_subset(
     unevaluated_event_records: Sequence[EventLogRecord],
     dynamic_partitions_store: DynamicPartitionsStore,
 ) -> Tuple[PartitionsSubset, PartitionsSubset, Optional[int]]:
-    current_failed_partitions = set(current_cached_subset.get_partition_keys())
+    newly_materialized_partitions = set()
 
     cursor = None
     incomplete_materialization_records: Dict[str, EventLogRecord] = {}
@@ -349,7 +349,7 @@ def _get_updated_failed_and_in_progress_partition_subset(
             if event.partition:
                 incomplete_materialization_records.pop(event.partition, None)
                 # if we have a new materialization for a partition, that negates the old failure
-                current_failed_partitions.discard(event.partition)
+                newly_materialized_partitions.add(event.partition)
 
     new_failed_partitions = set()
     in_progress_partitions = set()
@@ -376,11 +376,18 @@ def _get_updated_failed_and_in_progress_partition_subset(
                     # If the run is not finished, keep track of the event id so we can check on it next time
                     cursor = record.storage_id
 
+    # Update the cached subset with subset operations rather than through its partition keys, which
+    # for multipartitioned assets would expand the product of the dimensions' keys
+    current_failed_subset = (
+        current_cached_subset
+        - partitions_def.empty_subset().with_partition_keys(newly_materialized_partitions)
+        if newly_materialized_partitions
+        else current_cached_subset
+    )
     return (
-        partitions_def.empty_subset().with_partition_keys(
-            get_validated_partition_keys(
-                instance, partitions_def, new_failed_partitions | current_failed_partitions
-            )
+        current_failed_subset
+        | partitions_def.empty_subset().with_partition_keys(
+            get_validated_partition_keys(instance, partitions_def, new_failed_partitions)
         ),
         partitions_def.empty_subset().with_partition_keys(
             get_validated_partition_keys(instance, partitions_def, in_progress_partitions)
@@ -15,7 +15,7 @@
     RunsFilter,
     TagBucket,
 )
-from dagster._core.storage.sql import AlembicVersion
+from dagster._core.storage.sql import AlembicVersion, SqlPoolStats
 from dagster._daemon.types import DaemonHeartbeat
 from dagster._utils import PrintFn
 
@@ -355,6 +355,10 @@ def optimize_for_webserver(self, statement_timeout: int, pool_recycle: int) -> N
         """Allows for optimizing database connection / use in the context of a long lived webserver process.
         """
 
+    def get_pool_stats(self) -> Optional[SqlPoolStats]:
+        """Connection pool statistics, for storages that connect to a database server."""
+        return None
+
     # Daemon Heartbeat Storage
     #
     # Holds heartbeats from the Dagster Daemon so that other system components can alert when it's not
@@ -58,6 +58,7 @@
 )
 from dagster._daemon.types import DaemonHeartbeat
 from dagster._serdes import (
+    SerdesCodec,
     deserialize_value,
     serialize_value,
 )
@@ -111,6 +112,11 @@ def upgrade(self) -> None:
         out-of-date instance of the storage up to date.
         """
 
+    @property
+    def _serdes_codec(self) -> Optional[SerdesCodec]:
+        # the codec for stored run bodies, configured with the `serdes_codec` instance setting
+        return self._instance.serdes_codec if self.has_instance else None
+
     def fetchall(self, query: SqlAlchemyQuery) -> Sequence[Any]:
         with self.connect() as conn:
             return db_fetch_mappings(conn, query)
@@ -140,7 +146,7 @@ def add_run(self, dagster_run: DagsterRun) -> DagsterRun:
             run_id=dagster_run.run_id,
             pipeline_name=dagster_run.job_name,
             status=dagster_run.status.value,
-            run_body=serialize_value(dagster_run),
+            run_body=serialize_value(dagster_run, codec=self._serdes_codec),
             snapshot_id=dagster_run.job_snapshot_id,
             partition=partition,
             partition_set=partition_set,
@@ -200,7 +206,9 @@ def handle_run_event(self, run_id: str, event: DagsterEvent) -> None:
                 RunsTable.update()
                 .where(RunsTable.c.run_id == run_id)
                 .values(
-                    run_body=serialize_value(run.with_status(new_job_status)),
+                    run_body=serialize_value(
+                        run.with_status(new_job_status), codec=self._serdes_codec
+                    ),
                     status=new_job_status.value,
                     update_timestamp=now,
                     **kwargs,
@@ -571,7 +579,10 @@ def add_run_tags(self, run_id: str, new_tags: Mapping[str, str]) -> None:
                 RunsTable.update()
                 .where(RunsTable.c.run_id == run_id)
                 .values(
-                    run_body=serialize_value(run.with_tags(merge_dicts(current_tags, new_tags))),
+                    run_body=serialize_value(
+                        run.with_tags(merge_dicts(current_tags, new_tags)),
+                        codec=self._serdes_codec,
+                    ),
                     partition=partition,
                     partition_set=partition_set,
                     update_timestamp=pendulum.now("UTC"),
@@ -1162,7 +1173,9 @@ def replace_job_origin(self, run: DagsterRun, job_origin: ExternalJobOrigin) ->
                 RunsTable.update()
                 .where(RunsTable.c.run_id == run.run_id)
                 .values(
-                    run_body=serialize_value(run.with_job_origin(job_origin)),
+                    run_body=serialize_value(
+                        run.with_job_origin(job_origin), codec=self._serdes_codec
+                    ),
                 )
             )
             conn.execute(
@@ -13,7 +13,7 @@
     TickData,
     TickStatus,
 )
-from dagster._core.storage.sql import AlembicVersion
+from dagster._core.storage.sql import AlembicVersion, SqlPoolStats
 from dagster._utils import PrintFn
 
 
@@ -183,6 +183,10 @@ def optimize_for_webserver(self, statement_timeout: int, pool_recycle: int) -> N
         """Allows for optimizing database connection / use in the context of a long lived webserver process.
         """
 
+    def get_pool_stats(self) -> Optional[SqlPoolStats]:
+        """Connection pool statistics, for storages that connect to a database server."""
+        return None
+
     def alembic_version(self) -> Optional[AlembicVersion]:
         return None
 
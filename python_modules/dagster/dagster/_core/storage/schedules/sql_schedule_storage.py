@@ -34,7 +34,7 @@
 )
 from dagster._core.storage.sql import SqlAlchemyQuery, SqlAlchemyRow
 from dagster._core.storage.sqlalchemy_compat import db_fetch_mappings, db_select, db_subquery
-from dagster._serdes import serialize_value
+from dagster._serdes import SerdesCodec, serialize_value
 from dagster._serdes.serdes import deserialize_value
 from dagster._utils import PrintFn, utc_datetime_from_timestamp
 
@@ -63,6 +63,11 @@ class SqlScheduleStorage(ScheduleStorage):
     def connect(self) -> ContextManager[Connection]:
         """Context manager yielding a sqlalchemy.engine.Connection."""
 
+    @property
+    def _serdes_codec(self) -> Optional[SerdesCodec]:
+        # the codec for stored tick bodies, configured with the `serdes_codec` instance setting
+        return self._instance.serdes_codec if self.has_instance else None
+
     def execute(self, query: SqlAlchemyQuery) -> Sequence[SqlAlchemyRow]:
         with self.connect() as conn:
             result_proxy = conn.execute(query)
@@ -388,7 +393,7 @@ def create_tick(self, tick_data: TickData) -> InstigatorTick:
             "status": tick_data.status.value,
             "type": tick_data.instigator_type.value,
             "timestamp": utc_datetime_from_timestamp(tick_data.timestamp),
-            "tick_body": serialize_value(tick_data),
+            "tick_body": serialize_value(tick_data, codec=self._serdes_codec),
         }
         if self.has_instigators_table() and tick_data.selector_id:
             values["selector_id"] = tick_data.selector_id
@@ -412,7 +417,7 @@ def update_tick(self, tick: InstigatorTick) -> InstigatorTick:
             "status": tick.status.value,
             "type": tick.instigator_type.value,
             "timestamp": utc_datetime_from_timestamp(tick.timestamp),
-            "tick_body": serialize_value(tick.tick_data),
+            "tick_body": serialize_value(tick.tick_data, codec=self._serdes_codec),
         }
         if self.has_instigators_table() and tick.selector_id:
             values["selector_id"] = tick.selector_id
@@ -478,7 +483,9 @@ def add_auto_materialize_asset_evaluations(
                     {
                         "evaluation_id": evaluation_id,
                         "asset_key": evaluation.asset_key.to_string(),
-                        "asset_evaluation_body": serialize_value(evaluation),
+                        "asset_evaluation_body": serialize_value(
+                            evaluation, codec=self._serdes_codec
+                        ),
                         "num_requested": evaluation.num_requested,
                         "num_skipped": evaluation.num_skipped,
                         "num_discarded": evaluation.num_discarded,
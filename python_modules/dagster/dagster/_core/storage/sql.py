@@ -1,8 +1,11 @@
+import logging
 import threading
+import time
 from functools import lru_cache
-from typing import Any, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Mapping, NamedTuple, Optional, Tuple, Union
 
 import sqlalchemy as db
+import sqlalchemy.pool as db_pool
 from alembic.command import downgrade, stamp, upgrade
 from alembic.config import Config
 from alembic.runtime.environment import EnvironmentContext
@@ -78,6 +81,144 @@ def check_alembic_revision(alembic_config: Config, conn: Connection) -> AlembicV
     return (db_revision, head_revision)
 
 
+# the `pool` storage settings, which are passed through to `create_engine`
+SQL_POOL_ENGINE_KWARGS = [
+    "pool_size",
+    "max_overflow",
+    "pool_timeout",
+    "pool_recycle",
+    "pool_pre_ping",
+]
+
+
+def get_pool_engine_kwargs(
+    pool_config: Optional[Mapping[str, Any]],
+    default_pool_config: Optional[Mapping[str, Any]] = None,
+) -> Dict[str, Any]:
+    """Returns the `create_engine` arguments for the `pool` settings of a SQL storage, falling back
+    to `default_pool_config` for the settings that are not set. Without any pool settings, storages
+    do not hold any connections open, and open a new connection for every use.
+    """
+    pool_config = {**(default_pool_config or {}), **(pool_config or {})}
+    if not pool_config:
+        return {"poolclass": db_pool.NullPool}
+
+    return {
+        "poolclass": db_pool.QueuePool,
+        **{key: pool_config[key] for key in SQL_POOL_ENGINE_KWARGS if key in pool_config},
+    }
+
+
+class SqlPoolStats(
+    NamedTuple(
+        "_SqlPoolStats",
+        [
+            ("pool_size", Optional[int]),
+            ("in_use", int),
+            ("overflow", int),
+            ("checkouts", int),
+            ("checkout_timeouts", int),
+            ("total_checkout_seconds", float),
+            ("max_checkout_seconds", float),
+        ],
+    )
+):
+    """Connection pool statistics of a SQL storage.
+
+    Args:
+        pool_size (Optional[int]): The number of connections that the pool keeps open, or None if
+            the storage opens a new connection for every use.
+        in_use (int): The number of connections that are currently checked out.
+        overflow (int): The number of connections that are open beyond `pool_size`.
+        checkouts (int): The number of connections that have been checked out.
+        checkout_timeouts (int): The number of checkouts that timed out waiting for a connection.
+        total_checkout_seconds (float): The total time spent waiting to check out connections.
+        max_checkout_seconds (float): The longest time spent waiting to check out a connection.
+    """
+
+
+class SqlPoolMetrics:
+    """Tracks the connection checkouts of a SQL storage.
+
+    Storages check out connections through `connect`, which times how long each checkout waits for
+    a connection and counts the checkouts that time out because the pool is exhausted. Listeners
+    added with `add_listener` are called after each checkout with its latency and the current
+    `SqlPoolStats`, e.g. to report them to a metrics system.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._engine: Optional[db.engine.Engine] = None
+        self._in_use = 0
+        self._checkouts = 0
+        self._checkout_timeouts = 0
+        self._total_checkout_seconds = 0.0
+        self._max_checkout_seconds = 0.0
+        self._listeners: List[Callable[[float, SqlPoolStats], None]] = []
+
+    def instrument(self, engine: db.engine.Engine) -> None:
+        """Track the connections of the given engine, which replaces any engine tracked before."""
+        db.event.listen(engine, "checkout", self._on_checkout)
+        db.event.listen(engine, "checkin", self._on_checkin)
+        self._engine = engine
+
+    def add_listener(self, listener: Callable[[float, SqlPoolStats], None]) -> None:
+        with self._lock:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[float, SqlPoolStats], None]) -> None:
+        with self._lock:
+            self._listeners.remove(listener)
+
+    def connect(self, engine: db.engine.Engine) -> Connection:
+        start = time.perf_counter()
+        try:
+            conn = engine.connect()
+        except db.exc.TimeoutError:
+            with self._lock:
+                self._checkout_timeouts += 1
+            raise
+
+        checkout_seconds = time.perf_counter() - start
+        with self._lock:
+            self._checkouts += 1
+            self._total_checkout_seconds += checkout_seconds
+            self._max_checkout_seconds = max(self._max_checkout_seconds, checkout_seconds)
+            listeners = list(self._listeners)
+
+        if listeners:
+            stats = self.get_stats()
+            for listener in listeners:
+                try:
+                    listener(checkout_seconds, stats)
+                except Exception:
+                    logging.exception("Exception in SQL connection pool listener.")
+
+        return conn
+
+    def get_stats(self) -> SqlPoolStats:
+        pool = self._engine.pool if self._engine else None
+        is_queue_pool = isinstance(pool, db_pool.QueuePool)
+        with self._lock:
+            return SqlPoolStats(
+                pool_size=pool.size() if is_queue_pool else None,  # type: ignore  # (pool is a QueuePool)
+                in_use=self._in_use,
+                overflow=max(pool.overflow(), 0) if is_queue_pool else 0,  # type: ignore  # (pool is a QueuePool)
+                checkouts=self._checkouts,
+                checkout_timeouts=self._checkout_timeouts,
+                total_checkout_seconds=self._total_checkout_seconds,
+                max_checkout_seconds=self._max_checkout_seconds,
+            )
+
+    def _on_checkout(self, _dbapi_connection, _connection_record, _connection_proxy) -> None:
+        with self._lock:
+            self._in_use += 1
+
+    def _on_checkin(self, _dbapi_connection, _connection_record) -> None:
+        with self._lock:
+            self._in_use -= 1
+
+
 def run_migrations_offline(
     context: EnvironmentContext, config: Config, target_metadata: db.MetaData
 ) -> None:
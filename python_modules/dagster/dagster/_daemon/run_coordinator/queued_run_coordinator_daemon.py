@@ -351,9 +351,11 @@ def _dequeue_run(
                             now + run_queue_config.user_code_failure_retry_delay
                         )
 
-                enqueue_event_records = instance.get_records_for_run(
-                    run_id=run.run_id, of_type=DagsterEventType.PIPELINE_ENQUEUED
-                ).records
+                enqueue_event_records = instance.get_lazy_records_for_run(
+                    run_id=run.run_id,
+                    of_type=DagsterEventType.PIPELINE_ENQUEUED,
+                    include_event_body=False,
+                )
 
                 check.invariant(len(enqueue_event_records), "Could not find enqueue event for run")
 
@@ -1,3 +1,7 @@
+from .codecs import (
+    SerdesCodec as SerdesCodec,
+    get_serdes_codec as get_serdes_codec,
+)
 from .config_class import (
     ConfigurableClass as ConfigurableClass,
     ConfigurableClassData as ConfigurableClassData,
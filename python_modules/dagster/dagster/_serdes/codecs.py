@@ -0,0 +1,139 @@
+"""Encodings for packed serdes values written to storage.
+
+`serialize_value` produces JSON text by default, which is what every reader expects and what
+snapshot ids are hashed over. Storages may instead encode the bodies they persist (events, runs,
+ticks) with an alternate `SerdesCodec`, selected with the `serdes_codec` instance setting.
+Encoded values remain text so that they fit the existing storage columns, and
+`deserialize_value` detects the encoding of each value on read, so rows written with different
+codecs can be mixed freely.
+"""
+import base64
+import math
+import zlib
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Dict, Optional
+
+import dagster._seven as seven
+
+from .errors import SerdesUsageError
+
+if TYPE_CHECKING:
+    from .serdes import JsonSerializableValue
+
+# No JSON document can start with this prefix, which lets binary encoded values be told apart from
+# JSON text on read.
+MSGPACK_PREFIX = "~msgpack:"
+
+
+class SerdesCodec(ABC):
+    name: str
+
+    @abstractmethod
+    def encode(self, packed: "JsonSerializableValue") -> str:
+        ...
+
+    @abstractmethod
+    def decode(self, val: str) -> "JsonSerializableValue":
+        ...
+
+
+class JsonCodec(SerdesCodec):
+    name = "json"
+
+    def encode(self, packed: "JsonSerializableValue") -> str:
+        return seven.json.dumps(packed)
+
+    def decode(self, val: str) -> "JsonSerializableValue":
+        return seven.json.loads(val)
+
+
+class OrjsonCodec(SerdesCodec):
+    """JSON encoded with orjson. Output is plain JSON, so it is read back by the standard decoder.
+    """
+
+    name = "orjson"
+
+    def __init__(self):
+        try:
+            import orjson
+        except ImportError:
+            raise SerdesUsageError(
+                'The "orjson" serdes codec requires the orjson package to be installed.'
+            )
+        self._orjson = orjson
+
+    def encode(self, packed: "JsonSerializableValue") -> str:
+        # orjson writes NaN and infinite floats as null, which would not read back as floats
+        if _has_non_finite_float(packed):
+            return seven.json.dumps(packed)
+        try:
+            return self._orjson.dumps(packed, option=self._orjson.OPT_SORT_KEYS).decode("utf-8")
+        except self._orjson.JSONEncodeError:
+            # orjson only supports 64-bit integers
+            return seven.json.dumps(packed)
+
+    def decode(self, val: str) -> "JsonSerializableValue":
+        try:
+            return self._orjson.loads(val)
+        except self._orjson.JSONDecodeError:
+            # bodies with non-finite floats are written by the standard encoder
+            return seven.json.loads(val)
+
+
+def _has_non_finite_float(packed: "JsonSerializableValue") -> bool:
+    if isinstance(packed, float):
+        return not math.isfinite(packed)
+    if isinstance(packed, dict):
+        return any(_has_non_finite_float(v) for v in packed.values())
+    if isinstance(packed, list):
+        return any(_has_non_finite_float(v) for v in packed)
+    return False
+
+
+class MsgpackCodec(SerdesCodec):
+    """zlib-compressed msgpack, base64 encoded behind `MSGPACK_PREFIX` so that it can be stored in
+    text columns.
+    """
+
+    name = "msgpack"
+
+    def __init__(self):
+        try:
+            import msgpack
+        except ImportError:
+            raise SerdesUsageError(
+                'The "msgpack" serdes codec requires the msgpack package to be installed.'
+            )
+        self._msgpack = msgpack
+
+    def encode(self, packed: "JsonSerializableValue") -> str:
+        try:
+            packed_bytes = self._msgpack.packb(packed)
+        except OverflowError:
+            # msgpack only supports 64-bit integers
+            return seven.json.dumps(packed)
+        return MSGPACK_PREFIX + base64.b64encode(zlib.compress(packed_bytes)).decode("ascii")
+
+    def decode(self, val: str) -> "JsonSerializableValue":
+        packed_bytes = zlib.decompress(base64.b64decode(val[len(MSGPACK_PREFIX) :]))
+        return self._msgpack.unpackb(packed_bytes, strict_map_key=False)
+
+
+_CODEC_CLASSES = {codec.name: codec for codec in (JsonCodec, OrjsonCodec, MsgpackCodec)}
+_CODECS: Dict[str, SerdesCodec] = {}
+
+
+def get_serdes_codec(name: Optional[str]) -> SerdesCodec:
+    """Return the (shared) codec instance for the given codec name. Defaults to JSON."""
+    name = name or JsonCodec.name
+    if name not in _CODEC_CLASSES:
+        raise SerdesUsageError(
+            f'Unknown serdes codec "{name}". Expected one of {sorted(_CODEC_CLASSES.keys())}.'
+        )
+    if name not in _CODECS:
+        _CODECS[name] = _CODEC_CLASSES[name]()
+    return _CODECS[name]
+
+
+def is_msgpack_encoded(val: str) -> bool:
+    return val.startswith(MSGPACK_PREFIX)
@@ -45,6 +45,7 @@
 from dagster._utils import is_named_tuple_instance, is_named_tuple_subclass
 from dagster._utils.cached_method import cached_method
 
+from .codecs import MsgpackCodec, SerdesCodec, get_serdes_codec, is_msgpack_encoded
 from .errors import DeserializationError, SerdesUsageError, SerializationError
 
 ###################################################################################################
@@ -448,27 +449,28 @@ def unpack(
         try:
             unpacked_dict = self.before_unpack(context, unpacked_dict)
             unpacked: Dict[str, PackableValue] = {}
+            unpack_plan = self._unpack_plan
             for key, value in unpacked_dict.items():
-                loaded_name = self.loaded_field_names.get(key, key)
+                field_plan = unpack_plan.get(key)
                 # Naively implements backwards compatibility by filtering arguments that aren't present in
                 # the constructor. If a property is present in the serialized object, but doesn't exist in
                 # the version of the class loaded into memory, that property will be completely ignored.
-                if loaded_name in self.constructor_param_names:
-                    # custom unpack regardless of hook vs recursive descent
-                    custom = self.field_serializers.get(loaded_name)
-                    if custom:
-                        unpacked[loaded_name] = custom.unpack(
-                            value,
-                            whitelist_map=whitelist_map,
-                            context=context,
-                        )
-                    elif context.observed_unknown_serdes_values:
-                        unpacked[loaded_name] = context.assert_no_unknown_values(value)
-                    else:
-                        unpacked[loaded_name] = cast(PackableValue, value)
-
-                else:
+                if field_plan is None:
                     context.clear_ignored_unknown_values(value)
+                    continue
+
+                loaded_name, custom = field_plan
+                # custom unpack regardless of hook vs recursive descent
+                if custom:
+                    unpacked[loaded_name] = custom.unpack(
+                        value,
+                        whitelist_map=whitelist_map,
+                        context=context,
+                    )
+                elif context.observed_unknown_serdes_values:
+                    unpacked[loaded_name] = context.assert_no_unknown_values(value)
+                else:
+                    unpacked[loaded_name] = cast(PackableValue, value)
 
             # False positive type error here due to an eccentricity of `NamedTuple`-- calling `NamedTuple`
             # directly acts as a class factory, which is not true for `NamedTuple` subclasses (which act
@@ -509,22 +511,27 @@ def pack(
     ) -> Dict[str, JsonSerializableValue]:
         packed: Dict[str, JsonSerializableValue] = {}
         packed["__class__"] = self.get_storage_name()
-        for key, inner_value in value._asdict().items():
-            if key in self.skip_when_empty_fields and inner_value in EMPTY_VALUES_TO_SKIP:
+        pack_plan = (
+            self._pack_plan
+            if value.__class__ is self.klass
+            else self._build_pack_plan(value._fields)
+        )
+        for (storage_key, path_suffix, custom, skip_when_empty), inner_value in zip(
+            pack_plan, value
+        ):
+            if skip_when_empty and inner_value in EMPTY_VALUES_TO_SKIP:
                 continue
-            storage_key = self.storage_field_names.get(key, key)
-            custom = self.field_serializers.get(key)
             if custom:
                 packed[storage_key] = custom.pack(
                     inner_value,
                     whitelist_map=whitelist_map,
-                    descent_path=f"{descent_path}.{key}",
+                    descent_path=descent_path + path_suffix,
                 )
             else:
                 packed[storage_key] = _pack_value(
                     inner_value,
                     whitelist_map=whitelist_map,
-                    descent_path=f"{descent_path}.{key}",
+                    descent_path=descent_path + path_suffix,
                 )
         for key, default in self.old_fields.items():
             packed[key] = default
@@ -541,6 +548,43 @@ def after_pack(self, **packed_dict: JsonSerializableValue) -> Dict[str, JsonSeri
     def constructor_param_names(self) -> Sequence[str]:
         return list(signature(self.klass.__new__).parameters.keys())
 
+    # The pack/unpack plans below resolve storage names, field serializers and skip rules for each
+    # field once per class, so that the per-object work in `pack` and `unpack` reduces to a single
+    # dict lookup (or tuple iteration) per field.
+
+    @property
+    @cached_method
+    def _unpack_plan(self) -> Mapping[str, Tuple[str, Optional["FieldSerializer"]]]:
+        # maps each key that may appear in a stored dict to the constructor argument it loads into
+        by_param_name = {
+            name: (name, self.field_serializers.get(name)) for name in self.constructor_param_names
+        }
+        plan = dict(by_param_name)
+        for storage_name, loaded_name in self.loaded_field_names.items():
+            if loaded_name in by_param_name:
+                plan[storage_name] = by_param_name[loaded_name]
+            else:
+                plan.pop(storage_name, None)
+        return plan
+
+    @property
+    @cached_method
+    def _pack_plan(self) -> Sequence[Tuple[str, str, Optional["FieldSerializer"], bool]]:
+        return self._build_pack_plan(self.klass._fields)
+
+    def _build_pack_plan(
+        self, fields: Sequence[str]
+    ) -> Sequence[Tuple[str, str, Optional["FieldSerializer"], bool]]:
+        return [
+            (
+                self.storage_field_names.get(key, key),
+                f".{key}",
+                self.field_serializers.get(key),
+                key in self.skip_when_empty_fields,
+            )
+            for key in fields
+        ]
+
     def get_storage_name(self) -> str:
         return self.storage_name or self.klass.__name__
 
@@ -600,13 +644,18 @@ def pack(
 def serialize_value(
     val: PackableValue,
     whitelist_map: WhitelistMap = _WHITELIST_MAP,
+    codec: Optional[SerdesCodec] = None,
     **json_kwargs: Any,
 ) -> str:
     """Serialize an object to a JSON string.
 
-    Objects are first converted to a JSON-serializable form with `pack_value`.
+    Objects are first converted to a JSON-serializable form with `pack_value`. If a `codec` is
+    passed, the packed value is encoded with it instead of the default JSON encoder.
     """
     packed_value = pack_value(val, whitelist_map=whitelist_map)
+    if codec:
+        check.invariant(not json_kwargs, "Cannot pass json kwargs when serializing with a codec")
+        return codec.encode(packed_value)
     return seven.json.dumps(packed_value, **json_kwargs)
 
 
@@ -678,15 +727,14 @@ def _pack_value(
 
     # inlined is_named_tuple_instance
     if isinstance(val, tuple) and hasattr(val, "_fields"):
-        klass_name = val.__class__.__name__
-        if not whitelist_map.has_tuple_serializer(klass_name):
+        serializer = whitelist_map.tuple_serializers.get(val.__class__.__name__)
+        if serializer is None:
             raise SerializationError(
                 (
                     "Can only serialize whitelisted namedtuples, received"
                     f" {val}.\nDescent path: {descent_path}"
                 ),
             )
-        serializer = whitelist_map.get_tuple_serializer(klass_name)
         return serializer.pack(cast(NamedTuple, val), whitelist_map, descent_path)
     if isinstance(val, Enum):
         klass_name = val.__class__.__name__
@@ -780,7 +828,7 @@ def deserialize_value(
 
     Three steps:
 
-    - Parse the input string as JSON.
+    - Parse the input string as JSON (or decode it with the binary codec it was written with).
     - Unpack the complex of lists, dicts, and scalars resulting from JSON parsing into a complex of richer
       Python objects (e.g. dagster-specific `NamedTuple` objects).
     - Optionally, check that the resulting object is of the expected type.
@@ -791,9 +839,15 @@ def deserialize_value(
     with warnings.catch_warnings():
         warnings.simplefilter("ignore", DeprecationWarning)
         context = UnpackContext()
-        unpacked_value = seven.json.loads(
-            val, object_hook=partial(_unpack_object, whitelist_map=whitelist_map, context=context)
-        )
+        if is_msgpack_encoded(val):
+            unpacked_value = _unpack_value(
+                get_serdes_codec(MsgpackCodec.name).decode(val), whitelist_map, context
+            )
+        else:
+            unpacked_value = seven.json.loads(
+                val,
+                object_hook=partial(_unpack_object, whitelist_map=whitelist_map, context=context),
+            )
         unpacked_value = context.finalize_unpack(unpacked_value)
         if as_type and not (
             is_named_tuple_instance(unpacked_value)
@@ -816,7 +870,8 @@ def __init__(self, message: str, value: Mapping[str, UnpackedValue]):
 def _unpack_object(val: dict, whitelist_map: WhitelistMap, context: UnpackContext):
     if "__class__" in val:
         klass_name = cast(str, val["__class__"])
-        if not whitelist_map.has_tuple_deserializer(klass_name):
+        deserializer = whitelist_map.tuple_deserializers.get(klass_name)
+        if deserializer is None:
             return context.observe_unknown_value(
                 UnknownSerdesValue(
                     f'Attempted to deserialize class "{klass_name}" which is not in the whitelist.',
@@ -825,7 +880,6 @@ def _unpack_object(val: dict, whitelist_map: WhitelistMap, context: UnpackContex
             )
 
         val.pop("__class__")
-        deserializer = whitelist_map.get_tuple_deserializer(klass_name)
         return deserializer.unpack(val, whitelist_map, context)
 
     if "__enum__" in val:
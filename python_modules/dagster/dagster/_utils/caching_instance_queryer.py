@@ -374,9 +374,11 @@ def _get_planned_materializations_for_run_from_events(
         Args:
             run_id (str): The run id
         """
-        materializations_planned = self.instance.get_records_for_run(
-            run_id=run_id, of_type=DagsterEventType.ASSET_MATERIALIZATION_PLANNED
-        ).records
+        materializations_planned = self.instance.get_lazy_records_for_run(
+            run_id=run_id,
+            of_type=DagsterEventType.ASSET_MATERIALIZATION_PLANNED,
+            include_event_body=False,
+        )
         return set(cast(AssetKey, record.asset_key) for record in materializations_planned)
 
     def get_planned_materializations_for_run(self, run_id: str) -> AbstractSet[AssetKey]:
@@ -418,10 +420,11 @@ def get_current_materializations_for_run(self, *, run_id: str) -> AbstractSet[As
         Args:
             run_id (str): The run id
         """
-        materializations = self.instance.get_records_for_run(
+        materializations = self.instance.get_lazy_records_for_run(
             run_id=run_id,
             of_type=DagsterEventType.ASSET_MATERIALIZATION,
-        ).records
+            include_event_body=False,
+        )
         return set(cast(AssetKey, record.asset_key) for record in materializations)
 
     ####################
@@ -0,0 +1,62 @@
+import threading
+import time
+from typing import Any, Callable, ContextManager, List, NamedTuple, Sequence
+
+import dagster._check as check
+
+
+class SqlPoolLoadResult(NamedTuple):
+    num_connected: int
+    errors: Sequence[Exception]
+    checkout_seconds: Sequence[float]
+
+
+def run_sql_pool_load(
+    connect: Callable[[], ContextManager[Any]],
+    num_workers: int,
+    hold_seconds: float,
+    num_iterations: int = 1,
+) -> SqlPoolLoadResult:
+    """Load test for the connection pool of a SQL storage.
+
+    Starts `num_workers` threads at once, each of which opens a connection with `connect` (e.g. the
+    `connect` method of a run storage) `num_iterations` times and holds it for `hold_seconds`. With
+    more workers than the pool has connections, the workers wait for connections to be returned to
+    the pool, and fail once they have waited longer than the pool's timeout, which reproduces pool
+    exhaustion against a local database server or SQLite file.
+    """
+    check.callable_param(connect, "connect")
+    check.int_param(num_workers, "num_workers")
+    check.numeric_param(hold_seconds, "hold_seconds")
+    check.int_param(num_iterations, "num_iterations")
+
+    lock = threading.Lock()
+    start_barrier = threading.Barrier(num_workers)
+    errors: List[Exception] = []
+    checkout_seconds: List[float] = []
+
+    def _work():
+        start_barrier.wait()
+        for _ in range(num_iterations):
+            start = time.perf_counter()
+            try:
+                with connect():
+                    with lock:
+                        checkout_seconds.append(time.perf_counter() - start)
+                    time.sleep(hold_seconds)
+            except Exception as e:
+                with lock:
+                    errors.append(e)
+
+    workers = [
+        threading.Thread(target=_work, name=f"sql-pool-load-{i}", daemon=True)
+        for i in range(num_workers)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    return SqlPoolLoadResult(
+        num_connected=len(checkout_seconds), errors=errors, checkout_seconds=checkout_seconds
+    )
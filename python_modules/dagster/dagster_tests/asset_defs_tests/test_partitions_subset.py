@@ -1,7 +1,8 @@
 import pytest
 from dagster import DailyPartitionsDefinition, MultiPartitionsDefinition, StaticPartitionsDefinition
 from dagster._core.definitions.multi_dimensional_partitions import MultiPartitionsSubset
-from dagster._core.definitions.partition import DefaultPartitionsSubset
+from dagster._core.definitions.partition import BitmapPartitionsSubset, DefaultPartitionsSubset
+from dagster._core.definitions.partition_key_range import PartitionKeyRange
 from dagster._core.definitions.time_window_partitions import (
     TimeWindowPartitionsSubset,
 )
@@ -76,5 +77,54 @@ def test_get_subset_type():
 
 def test_empty_subsets():
     assert type(composite.empty_subset()) is MultiPartitionsSubset
-    assert type(static_partitions.empty_subset()) is DefaultPartitionsSubset
+    assert type(static_partitions.empty_subset()) is BitmapPartitionsSubset
     assert type(time_window_partitions.empty_subset()) is TimeWindowPartitionsSubset
+
+
+def test_bitmap_subset_set_operations():
+    partitions_def = StaticPartitionsDefinition([str(i) for i in range(200)])
+    evens = partitions_def.subset_with_partition_keys(str(i) for i in range(0, 200, 2))
+    low = partitions_def.empty_subset().with_partition_key_range(PartitionKeyRange("0", "99"))
+
+    assert len(evens) == 100
+    assert len(low) == 100
+    assert "4" in evens and "5" not in evens and "nonexistent" not in evens
+
+    assert (evens | low).get_partition_keys() == {
+        *(str(i) for i in range(100)),
+        *(str(i) for i in range(100, 200, 2)),
+    }
+    assert (evens & low).get_partition_keys() == {str(i) for i in range(0, 100, 2)}
+    assert (low - evens).get_partition_keys() == {str(i) for i in range(1, 100, 2)}
+    assert low.get_partition_keys_not_in_subset() == {str(i) for i in range(100, 200)}
+    assert low.get_partition_key_ranges() == [PartitionKeyRange("0", "99")]
+    assert (low - evens).get_partition_key_ranges()[:2] == [
+        PartitionKeyRange("1", "1"),
+        PartitionKeyRange("3", "3"),
+    ]
+
+    # subsets with the same keys are equal regardless of their representation
+    assert low == DefaultPartitionsSubset(partitions_def, {str(i) for i in range(100)})
+    assert DefaultPartitionsSubset(partitions_def, {str(i) for i in range(100)}) == low
+
+    # keys that are not partitions of the definition are ignored
+    assert len(low.with_partition_keys(["nonexistent"])) == 100
+
+
+def test_bitmap_subset_serialization():
+    partitions_def = StaticPartitionsDefinition([f"key_{i}" for i in range(10000)])
+    subset = partitions_def.subset_with_partition_keys(f"key_{i}" for i in range(0, 10000, 3))
+
+    serialized = subset.serialize()
+    # the bitmap of 10000 keys is much smaller than the list of the 3334 keys in the subset
+    assert len(serialized) < 2000
+    assert partitions_def.can_deserialize_subset(serialized, None, "StaticPartitionsDefinition")
+    assert partitions_def.deserialize_subset(serialized) == subset
+
+    # the bitmap can not be read for a definition with different partition keys
+    other_partitions_def = StaticPartitionsDefinition([f"key_{i}" for i in range(10001)])
+    assert not other_partitions_def.can_deserialize_subset(
+        serialized, None, "StaticPartitionsDefinition"
+    )
+    with pytest.raises(DagsterInvalidDeserializationVersionError):
+        other_partitions_def.deserialize_subset(serialized)
@@ -453,6 +453,39 @@ def test_grpc_override_settings():
         assert instance.code_server_process_startup_timeout == 60
 
 
+@pytest.mark.parametrize("codec_name", ["orjson", "msgpack"])
+def test_serdes_codec(codec_name):
+    pytest.importorskip(codec_name)
+
+    @op
+    def noop_op():
+        pass
+
+    @job
+    def noop_job():
+        noop_op()
+
+    with instance_for_test() as json_instance:
+        json_result = noop_job.execute_in_process(instance=json_instance)
+        assert json_result.success
+
+        with instance_for_test(
+            overrides={"serdes_codec": codec_name}, temp_dir=json_instance.root_directory
+        ) as instance:
+            assert instance.serdes_codec.name == codec_name
+            result = noop_job.execute_in_process(instance=instance)
+            assert result.success
+
+            # rows written with either codec are readable
+            for run_id in [json_result.run_id, result.run_id]:
+                run = instance.get_run_by_id(run_id)
+                assert run and run.is_success
+                assert any(
+                    event.is_dagster_event and event.dagster_event_type == "STEP_SUCCESS"
+                    for event in instance.all_logs(run_id)
+                )
+
+
 def test_run_monitoring(capsys):
     with instance_for_test(
         overrides={
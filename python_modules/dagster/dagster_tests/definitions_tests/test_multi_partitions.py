@@ -1,3 +1,4 @@
+import json
 from datetime import datetime
 
 import pendulum
@@ -10,6 +11,7 @@
     DimensionPartitionMapping,
     DynamicPartitionsDefinition,
     EventRecordsFilter,
+    HourlyPartitionsDefinition,
     IdentityPartitionMapping,
     IOManager,
     MultiPartitionKey,
@@ -20,7 +22,11 @@
     repository,
 )
 from dagster._core.definitions.asset_graph import AssetGraph
-from dagster._core.definitions.multi_dimensional_partitions import MultiPartitionsDefinition
+from dagster._core.definitions.multi_dimensional_partitions import (
+    MultiPartitionsDefinition,
+    MultiPartitionsSubset,
+)
+from dagster._core.definitions.partition_key_range import PartitionKeyRange
 from dagster._core.definitions.time_window_partitions import TimeWindow, get_time_partitions_def
 from dagster._core.errors import DagsterInvalidDefinitionError, DagsterInvariantViolationError
 from dagster._core.storage.tags import get_multidimensional_partition_tag
@@ -324,6 +330,85 @@ def test_multipartitions_subset_addition(initial, added):
     )
 
 
+def test_multipartitions_subset_many_partitions():
+    static_keys = ["a", "b", "c", "d"]
+    hourly_partitions_def = HourlyPartitionsDefinition(
+        start_date="2015-01-01-00:00", end_date="2023-01-01-00:00"
+    )
+    multipartitions_def = MultiPartitionsDefinition(
+        {"hour": hourly_partitions_def, "static": StaticPartitionsDefinition(static_keys)}
+    )
+    num_hours = hourly_partitions_def.get_num_partitions()
+    assert num_hours == 70128
+
+    all_hours = hourly_partitions_def.empty_subset().with_partition_key_range(
+        PartitionKeyRange("2015-01-01-00:00", "2022-12-31-23:00")
+    )
+    first_year = hourly_partitions_def.empty_subset().with_partition_key_range(
+        PartitionKeyRange("2015-01-01-00:00", "2015-12-31-23:00")
+    )
+    subset = (
+        multipartitions_def.empty_subset()
+        .with_primary_subset(["a", "b"], all_hours)
+        .with_primary_subset(["c"], first_year)
+    )
+    assert isinstance(subset, MultiPartitionsSubset)
+    assert len(subset) == 2 * num_hours + 8760
+    assert MultiPartitionKey({"hour": "2020-06-01-12:00", "static": "b"}) in subset
+    assert "2015-06-01-12:00|c" in subset
+    assert "2016-06-01-12:00|c" not in subset
+    assert "2015-06-01-12:00|d" not in subset
+    assert "2015-06-01-12:00" not in subset
+
+    serialized = subset.serialize()
+    # each secondary key's subset is stored as a time window, not as the partition keys
+    assert len(serialized) < 2000
+    assert multipartitions_def.can_deserialize_subset(serialized, None, "MultiPartitionsDefinition")
+    assert multipartitions_def.deserialize_subset(serialized) == subset
+
+    other = (
+        multipartitions_def.empty_subset()
+        .with_primary_subset(["a"], first_year)
+        .with_primary_subset(["c", "d"], all_hours)
+    )
+    assert len(subset | other) == 3 * num_hours + num_hours
+    assert len(subset & other) == 8760 + 8760
+    assert len(subset - other) == num_hours - 8760 + num_hours
+    assert (subset - other).get_primary_subset("c") == hourly_partitions_def.empty_subset()
+    assert (subset - other) | (subset & other) == subset
+
+    assert set(subset.get_multipartition_keys_with_dimension_value("hour", "2015-03-01-00:00")) == {
+        MultiPartitionKey({"hour": "2015-03-01-00:00", "static": key}) for key in ["a", "b", "c"]
+    }
+    assert len(subset.get_multipartition_keys_with_dimension_value("static", "c")) == 8760
+
+    # subsets built from partition keys are equal to the factored ones
+    assert multipartitions_def.empty_subset().with_partition_keys(
+        subset.get_multipartition_keys_with_dimension_value("static", "c")
+    ) == multipartitions_def.empty_subset().with_primary_subset(["c"], first_year)
+
+
+def test_multipartitions_subset_backcompat_key_list_serialization():
+    multipartitions_def = MultiPartitionsDefinition(
+        {
+            "date": DailyPartitionsDefinition(start_date="2015-01-01", end_date="2015-02-01"),
+            "static": StaticPartitionsDefinition(["a", "b"]),
+        }
+    )
+    partition_keys = {
+        MultiPartitionKey({"date": "2015-01-01", "static": "a"}),
+        MultiPartitionKey({"date": "2015-01-02", "static": "a"}),
+        MultiPartitionKey({"date": "2015-01-05", "static": "b"}),
+    }
+    version_1_serialization = json.dumps({"version": 1, "subset": list(partition_keys)})
+    assert multipartitions_def.can_deserialize_subset(
+        version_1_serialization, None, "MultiPartitionsDefinition"
+    )
+    subset = multipartitions_def.deserialize_subset(version_1_serialization)
+    assert subset.get_partition_keys() == partition_keys
+    assert subset == multipartitions_def.empty_subset().with_partition_keys(partition_keys)
+
+
 def test_asset_partition_key_is_multipartition_key():
     class MyIOManager(IOManager):
         def handle_output(self, context, obj):
@@ -1,3 +1,4 @@
+import time
 from datetime import datetime
 from typing import Optional, Sequence, cast
 
@@ -901,6 +902,76 @@ def test_partition_subset_with_partition_keys(initial: str, added: str):
     assert len(updated_subset) == updated_subset_str.count("+")
 
 
+@pytest.mark.parametrize(
+    "first, second",
+    [
+        ("+++---++-+", "-++++--+-+"),
+        ("----------", "++--++--++"),
+        ("++++++++++", "-+-+-+-+-+"),
+        ("+-+-+-+-+-", "-+-+-+-+-+"),
+    ],
+)
+def test_time_window_partitions_subset_set_operations(first: str, second: str):
+    partitions_def = HourlyPartitionsDefinition(start_date="2015-01-01-00:00")
+    all_keys = partitions_def.get_partition_keys_between_indexes(0, len(first))
+
+    def _subset(subset_str: str):
+        return partitions_def.empty_subset().with_partition_keys(
+            [key for key, included in zip(all_keys, subset_str) if included == "+"]
+        )
+
+    first_subset, second_subset = _subset(first), _subset(second)
+    first_keys, second_keys = set(first_subset.get_partition_keys()), set(
+        second_subset.get_partition_keys()
+    )
+    for subset, expected_keys in [
+        (first_subset | second_subset, first_keys | second_keys),
+        (first_subset & second_subset, first_keys & second_keys),
+        (first_subset - second_subset, first_keys - second_keys),
+        (second_subset - first_subset, second_keys - first_keys),
+    ]:
+        assert isinstance(subset, TimeWindowPartitionsSubset)
+        assert set(subset.get_partition_keys()) == expected_keys
+        assert len(subset) == len(expected_keys)
+        assert all((key in subset) == (key in expected_keys) for key in all_keys)
+        assert subset == _subset("".join("+" if key in expected_keys else "-" for key in all_keys))
+
+
+def test_time_window_partitions_subset_many_partitions():
+    partitions_def = HourlyPartitionsDefinition(start_date="2015-01-01-00:00")
+    current_time = create_pendulum_time(2023, 1, 1, tz="UTC")
+    num_partitions = partitions_def.get_num_partitions(current_time=current_time)
+
+    all_partitions = partitions_def.empty_subset().with_partition_key_range(
+        PartitionKeyRange(
+            partitions_def.get_first_partition_key(),
+            partitions_def.get_last_partition_key(current_time=current_time),
+        )
+    )
+    one_day = partitions_def.empty_subset().with_partition_key_range(
+        PartitionKeyRange("2020-02-29-00:00", "2020-02-29-23:00")
+    )
+    assert len(all_partitions) == num_partitions == 70128
+
+    without_one_day = all_partitions - one_day
+    assert len(without_one_day) == num_partitions - 24
+    assert "2020-02-29-05:00" not in without_one_day
+    assert "2020-03-01-00:00" in without_one_day
+    assert without_one_day.get_partition_key_ranges() == [
+        PartitionKeyRange("2015-01-01-00:00", "2020-02-28-23:00"),
+        PartitionKeyRange("2020-03-01-00:00", "2022-12-31-23:00"),
+    ]
+    assert len(without_one_day & one_day) == 0
+    assert without_one_day | one_day == all_partitions
+    assert (without_one_day | one_day).get_partition_key_ranges() == [
+        PartitionKeyRange("2015-01-01-00:00", "2022-12-31-23:00")
+    ]
+
+    with_keys = without_one_day.with_partition_keys(["2020-02-29-05:00", "2021-01-01-00:00"])
+    assert len(with_keys) == num_partitions - 23
+    assert "2020-02-29-05:00" in with_keys
+
+
 def test_weekly_time_window_partitions_subset():
     weekly_partitions_def = WeeklyPartitionsDefinition(start_date="2022-01-01")
 
@@ -1188,3 +1259,128 @@ def test_has_partition_key():
     )
     assert partitions_def.has_partition_key("2020-01-01")
     assert partitions_def.has_partition_key("2020-03-15")
+
+
+FIXED_INTERVAL_PARTITIONS_DEFS = [
+    HourlyPartitionsDefinition(start_date="2021-05-05-01:00", minute_offset=15),
+    HourlyPartitionsDefinition(start_date="2021-10-25-00:00", timezone="US/Central", end_offset=3),
+    HourlyPartitionsDefinition(
+        start_date="2021-10-25-00:00+0200",
+        timezone="Europe/Berlin",
+        fmt="%Y-%m-%d-%H:%M%z",
+        end_offset=-2,
+    ),
+    DailyPartitionsDefinition(start_date="2020-01-01", end_offset=-1),
+    DailyPartitionsDefinition(
+        start_date="2020-01-01", timezone="US/Central", hour_offset=2, minute_offset=30
+    ),
+    DailyPartitionsDefinition(
+        start_date="2020-01-01", timezone="Europe/Berlin", hour_offset=1, end_date="2022-03-28"
+    ),
+    WeeklyPartitionsDefinition(
+        start_date="2020-01-01", timezone="US/Central", day_offset=0, hour_offset=2, end_offset=1
+    ),
+    MonthlyPartitionsDefinition(
+        start_date="2019-12-01", timezone="America/Sao_Paulo", day_offset=15, hour_offset=3
+    ),
+    TimeWindowPartitionsDefinition(
+        start="2022-03-01-00:00", fmt="%Y-%m-%d-%H:%M", cron_schedule="*/15 * * * *"
+    ),
+]
+
+
+@pytest.mark.parametrize("partitions_def", FIXED_INTERVAL_PARTITIONS_DEFS)
+def test_fixed_interval_partitions_match_cron_iteration(partitions_def, monkeypatch):
+    assert partitions_def._get_fixed_interval_schedule() is not None  # noqa: SLF001
+    current_times = [
+        create_pendulum_time(2021, 11, 7, 7, 30, tz="UTC"),
+        create_pendulum_time(2022, 3, 27, 1, tz="UTC"),
+        create_pendulum_time(2020, 1, 1, 12, tz="UTC"),
+    ]
+    time_windows = [
+        time_window("2021-03-13T00:00:00+00:00", "2021-03-16T12:00:00+00:00"),
+        time_window("2021-10-30T22:00:00+00:00", "2021-11-08T01:00:00+00:00"),
+        time_window("2020-02-01T00:00:00+00:00", "2020-04-01T00:00:00+00:00"),
+    ]
+
+    def _get_partitions_info():
+        info = []
+        for current_time in current_times:
+            partition_keys = partitions_def.get_partition_keys(current_time=current_time)
+            info.append(
+                (
+                    partitions_def.get_num_partitions(current_time=current_time),
+                    partition_keys,
+                    partitions_def.get_first_partition_window(current_time=current_time),
+                    partitions_def.get_last_partition_window(current_time=current_time),
+                    partitions_def.time_windows_for_partition_keys(partition_keys[-300:]),
+                    [
+                        partitions_def.time_window_for_partition_key(partition_key)
+                        for partition_key in partition_keys[:20]
+                    ],
+                )
+            )
+        for window in time_windows:
+            info.append(partitions_def.get_partition_keys_in_time_window(window))
+        return info
+
+    info = _get_partitions_info()
+    monkeypatch.setattr(
+        TimeWindowPartitionsDefinition, "_get_fixed_interval_schedule", lambda _self: None
+    )
+    partitions_def._get_first_partition_window.cache_clear()  # noqa: SLF001
+    partitions_def._get_last_partition_window.cache_clear()  # noqa: SLF001
+    partitions_def._time_window_for_partition_key.cache_clear()  # noqa: SLF001
+    assert info == _get_partitions_info()
+
+
+def test_fixed_interval_schedules():
+    not_fixed_interval_partitions_defs = [
+        TimeWindowPartitionsDefinition(
+            start="2021-05-05", fmt="%Y-%m-%d", cron_schedule="0 0 * * 1-5"
+        ),
+        MonthlyPartitionsDefinition(start_date="2021-05-31", day_offset=31),
+        # croniter steps through the repeated hour of a DST transition in wall-clock time
+        TimeWindowPartitionsDefinition(
+            start="2021-05-05-00:00",
+            fmt="%Y-%m-%d-%H:%M",
+            cron_schedule="*/15 * * * *",
+            timezone="US/Central",
+        ),
+    ]
+    for partitions_def in not_fixed_interval_partitions_defs:
+        assert partitions_def._get_fixed_interval_schedule() is None  # noqa: SLF001
+
+
+def test_fixed_interval_partition_keys_benchmark(monkeypatch):
+    # two years of hourly partitions, of which only the last day is formatted as keys
+    partitions_def = HourlyPartitionsDefinition(
+        start_date="2021-01-01-00:00", timezone="US/Central", end_offset=1
+    )
+    current_time = create_pendulum_time(2023, 1, 1, tz="US/Central")
+    window = time_window("2022-12-31T06:00:00+00:00", "2023-01-01T06:00:00+00:00")
+
+    def _time_partition_key_lookups():
+        start = time.perf_counter()
+        num_partitions = partitions_def.get_num_partitions(current_time=current_time)
+        result = (
+            num_partitions,
+            partitions_def.get_partition_keys_between_indexes(
+                num_partitions - 25, num_partitions, current_time=current_time
+            ),
+            partitions_def.get_partition_keys_in_time_window(window),
+            partitions_def.get_last_partition_key(current_time=current_time),
+        )
+        return time.perf_counter() - start, result
+
+    fixed_interval_seconds, fixed_interval_result = _time_partition_key_lookups()
+    monkeypatch.setattr(
+        TimeWindowPartitionsDefinition, "_get_fixed_interval_schedule", lambda _self: None
+    )
+    cron_iteration_seconds, cron_iteration_result = _time_partition_key_lookups()
+
+    assert fixed_interval_result == cron_iteration_result
+    assert fixed_interval_result[0] == 17521
+    assert fixed_interval_result[1][:-1] == fixed_interval_result[2]
+    assert fixed_interval_result[3] == "2023-01-01-00:00"
+    assert fixed_interval_seconds * 10 < cron_iteration_seconds
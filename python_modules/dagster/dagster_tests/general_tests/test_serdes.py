@@ -1,3 +1,4 @@
+import math
 import re
 import string
 from collections import namedtuple
@@ -6,6 +7,7 @@
 
 import pytest
 from dagster._check import ParameterCheckError, inst_param, set_param
+from dagster._serdes.codecs import get_serdes_codec
 from dagster._serdes.errors import DeserializationError, SerdesUsageError, SerializationError
 from dagster._serdes.serdes import (
     EnumSerializer,
@@ -490,6 +492,9 @@ class Foo(NamedTuple):
     deserialized = deserialize_value(serialized, whitelist_map=test_env)
     assert deserialized == val
 
+    # the in-memory field name is still accepted on load
+    assert deserialize_value('{"__class__": "Foo", "color": "red"}', whitelist_map=test_env) == val
+
 
 def test_named_tuple_old_fields() -> None:
     test_env = WhitelistMap.create()
@@ -727,3 +732,62 @@ class Foo(Enum):
     assert serialized == '{"__enum__": "Foo.BLUE"}'
     deserialized = deserialize_value(serialized, whitelist_map=test_env)
     assert deserialized == Foo.RED
+
+
+@pytest.mark.parametrize("codec_name", ["json", "orjson", "msgpack"])
+def test_codec_round_trip(codec_name: str) -> None:
+    pytest.importorskip(codec_name)
+    test_env = WhitelistMap.create()
+
+    @_whitelist_for_serdes(test_env)
+    class Color(Enum):
+        RED = "red"
+
+    @_whitelist_for_serdes(test_env)
+    class Foo(NamedTuple):
+        color: Color
+        tags: Mapping[str, str]
+        values: Sequence[int]
+        flags: AbstractSet[str]
+
+    codec = get_serdes_codec(codec_name)
+    val = Foo(Color.RED, {"a": "b"}, [1, 2**70], {"x", "y"})
+    serialized = serialize_value(val, whitelist_map=test_env, codec=codec)
+    assert deserialize_value(serialized, whitelist_map=test_env) == val
+
+    small_val = Foo(Color.RED, {"a": "b"}, [1, 2], {"x", "y"})
+    serialized = serialize_value(small_val, whitelist_map=test_env, codec=codec)
+    assert deserialize_value(serialized, whitelist_map=test_env) == small_val
+    if codec_name == "msgpack":
+        assert not serialized.startswith("{")
+
+
+@pytest.mark.parametrize("codec_name", ["json", "orjson", "msgpack"])
+def test_codec_non_finite_floats(codec_name: str) -> None:
+    pytest.importorskip(codec_name)
+    test_env = WhitelistMap.create()
+
+    @_whitelist_for_serdes(test_env)
+    class Foo(NamedTuple):
+        value: float
+        values: Sequence[float]
+
+    codec = get_serdes_codec(codec_name)
+    for val in [
+        Foo(float("nan"), [1.0]),
+        Foo(1.0, [float("inf")]),
+        Foo(float("-inf"), [float("nan"), 2.5]),
+    ]:
+        serialized = serialize_value(val, whitelist_map=test_env, codec=codec)
+        deserialized = deserialize_value(serialized, whitelist_map=test_env)
+        assert isinstance(deserialized, Foo)
+        for expected, actual in zip(
+            [val.value, *val.values], [deserialized.value, *deserialized.values]
+        ):
+            assert isinstance(actual, float)
+            assert (math.isnan(expected) and math.isnan(actual)) or expected == actual
+
+
+def test_unknown_codec() -> None:
+    with pytest.raises(SerdesUsageError, match="Unknown serdes codec"):
+        get_serdes_codec("pickle")
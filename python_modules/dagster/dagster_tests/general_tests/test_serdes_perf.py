@@ -0,0 +1,169 @@
+import time
+from typing import Callable, NamedTuple, Optional, Sequence
+
+import pytest
+from dagster import (
+    AssetKey,
+    AssetMaterialization,
+    DailyPartitionsDefinition,
+    In,
+    Out,
+    Output,
+    ScheduleDefinition,
+    asset,
+    define_asset_job,
+    job,
+    op,
+    repository,
+)
+from dagster._core.events.log import EventLogEntry
+from dagster._core.host_representation.external_data import (
+    ExternalRepositoryData,
+    external_repository_data_from_def,
+)
+from dagster._core.storage.dagster_run import DagsterRun
+from dagster._core.test_utils import instance_for_test
+from dagster._serdes import deserialize_value, get_serdes_codec, serialize_value
+from dagster._serdes.serdes import PackableValue
+
+
+@op(out=Out(int))
+def emit_one():
+    return 1
+
+
+@op(ins={"num": In(int)})
+def materialize_num(context, num):
+    for i in range(5):
+        yield AssetMaterialization(
+            asset_key=AssetKey(["serdes_perf", f"asset_{i}"]),
+            metadata={"num": num, "index": i, "text": "x" * 100},
+        )
+    yield Output(num)
+
+
+@job
+def serdes_perf_job():
+    for i in range(10):
+        materialize_num.alias(f"materialize_num_{i}")(emit_one.alias(f"emit_one_{i}")())
+
+
+def build_event_log_entries() -> Sequence[EventLogEntry]:
+    with instance_for_test() as instance:
+        result = serdes_perf_job.execute_in_process(instance=instance)
+        return instance.all_logs(result.run_id)
+
+
+def build_dagster_runs() -> Sequence[DagsterRun]:
+    with instance_for_test() as instance:
+        result = serdes_perf_job.execute_in_process(instance=instance)
+        return [result.dagster_run]
+
+
+def build_external_repository_data() -> Sequence[ExternalRepositoryData]:
+    partitions_def = DailyPartitionsDefinition(start_date="2023-01-01")
+    assets = []
+    for i in range(50):
+
+        @asset(
+            name=f"asset_{i}",
+            partitions_def=partitions_def,
+            non_argument_deps={f"asset_{i - 1}"} if i else set(),
+        )
+        def _asset():
+            pass
+
+        assets.append(_asset)
+
+    @repository
+    def serdes_perf_repo():
+        return [
+            *assets,
+            serdes_perf_job,
+            define_asset_job("all_assets", partitions_def=partitions_def),
+            ScheduleDefinition(job_name="serdes_perf_job", cron_schedule="@daily"),
+        ]
+
+    return [external_repository_data_from_def(serdes_perf_repo)]
+
+
+class SerdesPerfScenario(NamedTuple):
+    name: str
+    build_values: Callable[[], Sequence[PackableValue]]
+    iterations: int
+    max_execution_time_seconds: int
+    codec_name: Optional[str] = None
+
+    def do_scenario(self):
+        if self.codec_name:
+            pytest.importorskip(self.codec_name)
+        codec = get_serdes_codec(self.codec_name)
+        values = self.build_values()
+        serialized = [serialize_value(value, codec=codec) for value in values]
+
+        # output must round trip exactly
+        for value, serialized_value in zip(values, serialized):
+            assert deserialize_value(serialized_value) == value
+            assert (
+                serialize_value(deserialize_value(serialized_value), codec=codec)
+                == serialized_value
+            )
+
+        start = time.time()
+        for _ in range(self.iterations):
+            for value in values:
+                serialize_value(value, codec=codec)
+        pack_seconds = time.time() - start
+
+        start = time.time()
+        for _ in range(self.iterations):
+            for serialized_value in serialized:
+                deserialize_value(serialized_value)
+        unpack_seconds = time.time() - start
+
+        print(  # noqa: T201
+            f"{self.name} ({codec.name}): {len(values)} values x {self.iterations} iterations, "
+            f"{sum(len(s) for s in serialized)} bytes, "
+            f"serialize {pack_seconds:.3f}s, deserialize {unpack_seconds:.3f}s"
+        )
+        assert pack_seconds + unpack_seconds < self.max_execution_time_seconds
+
+
+serdes_perf_scenarios = [
+    SerdesPerfScenario(
+        name="event_log_entries",
+        build_values=build_event_log_entries,
+        iterations=20,
+        max_execution_time_seconds=30,
+    ),
+    SerdesPerfScenario(
+        name="dagster_run",
+        build_values=build_dagster_runs,
+        iterations=2000,
+        max_execution_time_seconds=30,
+    ),
+    SerdesPerfScenario(
+        name="external_repository_data",
+        build_values=build_external_repository_data,
+        iterations=20,
+        max_execution_time_seconds=30,
+    ),
+    # storage size and round trip time of event log bodies for each of the storage codecs
+    *[
+        SerdesPerfScenario(
+            name=f"event_log_entries_{codec_name}",
+            build_values=build_event_log_entries,
+            iterations=20,
+            max_execution_time_seconds=30,
+            codec_name=codec_name,
+        )
+        for codec_name in ["orjson", "msgpack"]
+    ],
+]
+
+
+@pytest.mark.parametrize(
+    "scenario", serdes_perf_scenarios, ids=[s.name for s in serdes_perf_scenarios]
+)
+def test_serdes_perf(scenario: SerdesPerfScenario):
+    scenario.do_scenario()
@@ -1,4 +1,7 @@
 import logging
+import threading
+import time
+from contextlib import contextmanager
 from typing import Mapping, Optional, Sequence, Union
 
 import mock
@@ -8,6 +11,8 @@
 from dagster._core.definitions.decorators.job_decorator import job
 from dagster._core.definitions.job_definition import JobDefinition
 from dagster._core.definitions.reconstruct import ReconstructableJob
+from dagster._core.errors import DagsterEventLogWriterError
+from dagster._core.events import DagsterEvent, DagsterEventType, EngineEventData
 from dagster._core.execution.api import execute_job
 from dagster._core.test_utils import instance_for_test
 
@@ -446,3 +451,176 @@ def _fake_handle_new_event(event):
                     run_config={"execution": {"config": {"in_process": {}}}},
                     instance=instance,
                 )
+
+
+def define_buffered_logging_job():
+    @op
+    def opA(context):
+        context.log.info("opA first")
+        context.log.info("opA second")
+        return 1
+
+    @op
+    def opB(context, _in):
+        context.log.info("opB")
+
+    @job
+    def buffered_job():
+        opB(opA())
+
+    return buffered_job
+
+
+@pytest.mark.parametrize(
+    "run_config",
+    [
+        {"execution": {"config": {"in_process": {}}}},
+        {"execution": {"config": {"multiprocess": {}}}},
+    ],
+)
+@pytest.mark.parametrize(
+    "buffer_settings",
+    [
+        {"enabled": True, "max_buffered_events": 100},
+        {"enabled": True, "max_buffered_events": 100, "write_in_background": True},
+    ],
+)
+def test_buffered_event_logging(run_config, buffer_settings):
+    with instance_for_test(overrides={"event_log_buffer": buffer_settings}) as instance:
+        with mock.patch.object(
+            instance, "handle_new_events", wraps=instance.handle_new_events
+        ) as handle_new_events:
+            result = execute_job(
+                reconstructable(define_buffered_logging_job),
+                run_config=run_config,
+                instance=instance,
+            )
+            assert result.success
+            if "in_process" in run_config["execution"]["config"]:
+                assert handle_new_events.called
+
+        event_records = instance.event_log_storage.get_logs_for_run(result.run_id)
+        user_messages = [
+            er.user_message
+            for er in event_records
+            if not er.dagster_event and er.user_message.startswith("op")
+        ]
+        assert user_messages == ["opA first", "opA second", "opB"]
+
+        # buffered messages are written ahead of the dagster events that follow them
+        op_a_log_idx = next(
+            idx for idx, er in enumerate(event_records) if er.user_message == "opA second"
+        )
+        op_a_success_idx = next(
+            idx
+            for idx, er in enumerate(event_records)
+            if er.dagster_event
+            and er.dagster_event.is_step_success
+            and er.dagster_event.step_key == "opA"
+        )
+        assert op_a_log_idx < op_a_success_idx
+
+
+@contextmanager
+def instance_event_log_handler(instance):
+    handler = instance.get_handlers()[0]
+    logger = logging.getLogger("instance_event_log_handler")
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+    logger.addHandler(handler)
+
+    def _log(message, dagster_event=None):
+        logger.info(
+            message,
+            extra={
+                "dagster_meta": {
+                    "orig_message": message,
+                    "run_id": "foo",
+                    "dagster_event": dagster_event,
+                }
+            },
+        )
+
+    try:
+        yield handler, _log
+    finally:
+        logger.removeHandler(handler)
+
+
+def test_background_event_logging_write_failure():
+    with instance_for_test(
+        overrides={"event_log_buffer": {"enabled": True, "write_in_background": True}}
+    ) as instance:
+        with instance_event_log_handler(instance) as (handler, log), mock.patch.object(
+            instance, "handle_new_event", side_effect=Exception("failed writing event")
+        ):
+            log(
+                "engine event",
+                DagsterEvent(
+                    DagsterEventType.ENGINE_EVENT.value,
+                    "nonce",
+                    event_specific_data=EngineEventData.in_process(999),
+                ),
+            )
+            with pytest.raises(DagsterEventLogWriterError) as exc_info:
+                handler.flush_events()
+            assert "failed writing event" in str(exc_info.value.__cause__)
+
+            # the failure is only raised once
+            handler.flush_events()
+
+
+def test_background_event_logging_writer_falls_behind():
+    with instance_for_test(
+        overrides={
+            "event_log_buffer": {
+                "enabled": True,
+                "write_in_background": True,
+                "max_queued_events": 1,
+                "max_queue_wait_seconds": 0.1,
+            }
+        }
+    ) as instance:
+        write_started = threading.Event()
+        finish_write = threading.Event()
+
+        def _slow_handle_new_event(_event):
+            write_started.set()
+            finish_write.wait()
+
+        try:
+            with instance_event_log_handler(instance) as (handler, log), mock.patch.object(
+                instance, "handle_new_event", _slow_handle_new_event
+            ):
+                log("first")  # picked up by the writer, which blocks
+                assert write_started.wait(5)
+                log("second")  # fills the queue
+                with pytest.raises(DagsterEventLogWriterError, match="Timed out"):
+                    log("third")
+
+                finish_write.set()
+                handler.flush_events()
+        finally:
+            finish_write.set()
+
+
+def test_buffered_event_logging_flush_interval():
+    with instance_for_test(
+        overrides={
+            "event_log_buffer": {
+                "enabled": True,
+                "max_buffered_events": 100,
+                "flush_interval_seconds": 0.2,
+            }
+        }
+    ) as instance:
+        with instance_event_log_handler(instance) as (_handler, log):
+            log("buffered")
+            assert not instance.all_logs("foo")
+
+            # the buffered message is written once the interval has elapsed, even though nothing
+            # else is logged
+            start = time.time()
+            while not instance.all_logs("foo") and time.time() - start < 5:
+                time.sleep(0.05)
+            assert [record.user_message for record in instance.all_logs("foo")] == ["buffered"]
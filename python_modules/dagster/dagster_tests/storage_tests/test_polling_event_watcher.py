@@ -1,4 +1,5 @@
 import tempfile
+import threading
 import time
 from contextlib import contextmanager
 from typing import Any, Callable, Mapping, Union
@@ -6,8 +7,14 @@
 import dagster._check as check
 from dagster._core.events import DagsterEvent, DagsterEventType, EngineEventData
 from dagster._core.events.log import EventLogEntry
-from dagster._core.storage.event_log import SqliteEventLogStorage, SqlPollingEventWatcher
+from dagster._core.storage.event_log import (
+    ConsolidatedSqliteEventLogStorage,
+    SqliteEventLogStorage,
+    SqlPollingEventWatcher,
+)
 from dagster._core.storage.event_log.base import EventLogCursor
+from dagster._core.storage.event_log.schema import SqlEventLogStorageTable
+from dagster._serdes import serialize_value
 from dagster._serdes.config_class import ConfigurableClassData
 from typing_extensions import Self
 
@@ -16,7 +23,7 @@ class SqlitePollingEventLogStorage(SqliteEventLogStorage):
     """SQLite-backed event log storage that uses SqlPollingEventWatcher for watching runs.
 
     This class is a subclass of SqliteEventLogStorage that uses the SqlPollingEventWatcher class
-    (polling via SELECT queries) instead of the SqliteEventLogStorageWatchdog (filesystem watcher) to
+    (polling via SELECT queries) instead of the SqliteEventWatcher (filesystem notifications) to
     observe runs.
     """
 
@@ -138,3 +145,173 @@ def watch_two(event, _cursor):
 
     # calling end_watch after dispose does not error
     storage.end_watch(RUN_ID, watch_two)
+
+
+def _wait_for(condition, attempts=50):
+    while not condition() and attempts > 0:
+        time.sleep(0.1)
+        attempts -= 1
+
+
+def test_multiplexed_watch():
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        storage = ConsolidatedSqliteEventLogStorage(tmpdir_path)
+        watcher = SqlPollingEventWatcher(storage)
+        run_ids = ["run_a", "run_b", "run_c"]
+        watched = {run_id: [] for run_id in run_ids}
+
+        def _make_callback(run_id):
+            def _callback(event, _cursor):
+                watched[run_id].append(int(event.message))
+
+            return _callback
+
+        callbacks = {run_id: _make_callback(run_id) for run_id in run_ids}
+
+        # events stored before watching are delivered after the callback's cursor
+        storage.store_event(create_event(1, "run_a"))
+        storage.store_event(create_event(2, "run_a"))
+        first_storage_id = storage.get_records_for_run("run_a").records[0].storage_id
+
+        try:
+            watcher.watch_run(
+                "run_a", str(EventLogCursor.from_storage_id(first_storage_id)), callbacks["run_a"]
+            )
+            watcher.watch_run("run_b", None, callbacks["run_b"])
+            _wait_for(lambda: watched["run_a"] == [2])
+            assert watched["run_a"] == [2]
+
+            watcher.watch_run("run_c", None, callbacks["run_c"])
+            assert watcher.has_run_id("run_c")
+            assert (
+                len(
+                    [thread for thread in threading.enumerate() if thread.name == "sql-event-watch"]
+                )
+                == 1
+            )
+
+            storage.store_event(create_event(3, "run_b"))
+            storage.store_event(create_event(4, "run_c"))
+            storage.store_event(create_event(5, "run_a"))
+            storage.store_event(create_event(6, "unwatched_run"))
+
+            _wait_for(
+                lambda: watched == {"run_a": [2, 5], "run_b": [3], "run_c": [4]},
+            )
+            assert watched == {"run_a": [2, 5], "run_b": [3], "run_c": [4]}
+
+            for run_id in run_ids:
+                watcher.unwatch_run(run_id, callbacks[run_id])
+            assert not watcher.has_run_id("run_a")
+
+            storage.store_event(create_event(7, "run_a"))
+            time.sleep(0.5)
+            assert watched["run_a"] == [2, 5]
+        finally:
+            watcher.close()
+            storage.dispose()
+
+
+def test_watch_dispatches_late_commits():
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        storage = ConsolidatedSqliteEventLogStorage(tmpdir_path)
+        watcher = SqlPollingEventWatcher(storage)
+        watched = []
+
+        def _callback(event, _cursor):
+            watched.append(int(event.message))
+
+        try:
+            watcher.watch_run("run_a", None, _callback)
+            storage.store_event(create_event(0, "run_a"))
+            _wait_for(lambda: watched == [0])
+
+            # the event of the other run stands in for an event of the watched run whose storage id
+            # was allocated before the next event's, but which is committed after it
+            storage.store_event(create_event(1, "other_run"))
+            storage.store_event(create_event(2, "run_a"))
+            _wait_for(lambda: watched == [0, 2])
+            assert watched == [0, 2]
+
+            late_storage_id = storage.get_records_for_run("other_run").records[0].storage_id
+            with storage.index_connection() as conn:
+                conn.execute(
+                    SqlEventLogStorageTable.update()
+                    .where(SqlEventLogStorageTable.c.id == late_storage_id)
+                    .values(run_id="run_a", event=serialize_value(create_event(1, "run_a")))
+                )
+
+            _wait_for(lambda: watched == [0, 2, 1])
+            time.sleep(0.5)
+            assert watched == [0, 2, 1]
+        finally:
+            watcher.close()
+            storage.dispose()
+
+
+class QueryCountingSqliteEventLogStorage(SqliteEventLogStorage):
+    def __init__(self, *args, **kwargs):
+        super(QueryCountingSqliteEventLogStorage, self).__init__(*args, **kwargs)
+        self.queried_run_ids = []
+
+    def get_records_for_run(self, run_id, *args, **kwargs):
+        self.queried_run_ids.append(run_id)
+        return super(QueryCountingSqliteEventLogStorage, self).get_records_for_run(
+            run_id, *args, **kwargs
+        )
+
+
+def test_sqlite_watch_only_queries_changed_shards():
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        storage = QueryCountingSqliteEventLogStorage(tmpdir_path)
+        watched = {"run_a": [], "run_b": []}
+
+        def _make_callback(run_id):
+            def _callback(event, _cursor):
+                watched[run_id].append(int(event.message))
+
+            return _callback
+
+        callbacks = {run_id: _make_callback(run_id) for run_id in watched}
+        storage.store_event(create_event(1, "run_a"))
+        storage.store_event(create_event(2, "run_b"))
+
+        try:
+            for run_id in watched:
+                storage.watch(run_id, None, callbacks[run_id])
+            _wait_for(lambda: watched == {"run_a": [1], "run_b": [2]})
+            assert watched == {"run_a": [1], "run_b": [2]}
+            assert (
+                len(
+                    [
+                        thread
+                        for thread in threading.enumerate()
+                        if thread.name == "sqlite-event-watch"
+                    ]
+                )
+                == 1
+            )
+
+            # nothing is queried while the shards are unchanged
+            storage.queried_run_ids = []
+            time.sleep(1)
+            assert storage.queried_run_ids == []
+
+            # only the shard that was written to is queried
+            storage.store_event(create_event(3, "run_a"))
+            storage.store_event(create_event(4, "run_a"))
+            _wait_for(lambda: watched["run_a"] == [1, 3, 4])
+            assert watched == {"run_a": [1, 3, 4], "run_b": [2]}
+            assert storage.queried_run_ids
+            assert set(storage.queried_run_ids) == {"run_a"}
+
+            # rewatching a run catches up on the events stored after its cursor
+            storage.end_watch("run_b", callbacks["run_b"])
+            storage.store_event(create_event(5, "run_b"))
+            storage.watch("run_b", None, callbacks["run_b"])
+            _wait_for(lambda: watched["run_b"] == [2, 2, 5])
+            assert watched["run_b"] == [2, 2, 5]
+        finally:
+            for run_id in watched:
+                storage.end_watch(run_id, callbacks[run_id])
+            storage.dispose()
@@ -0,0 +1,137 @@
+import os
+import tempfile
+from contextlib import contextmanager
+
+import sqlalchemy as db
+import sqlalchemy.pool as db_pool
+from dagster._config import validate_config
+from dagster._core.storage.config import mysql_config, pg_config
+from dagster._core.storage.sql import (
+    SqlPoolMetrics,
+    create_engine,
+    get_pool_engine_kwargs,
+)
+from dagster._utils.test.sql_pool_load import run_sql_pool_load
+
+
+def test_pool_engine_kwargs():
+    assert get_pool_engine_kwargs(None) == {"poolclass": db_pool.NullPool}
+    assert get_pool_engine_kwargs({}) == {"poolclass": db_pool.NullPool}
+    assert get_pool_engine_kwargs({"pool_size": 5, "pool_pre_ping": True}) == {
+        "poolclass": db_pool.QueuePool,
+        "pool_size": 5,
+        "pool_pre_ping": True,
+    }
+    # configured settings take precedence over the defaults
+    assert get_pool_engine_kwargs({"pool_size": 5}, {"pool_size": 1, "pool_recycle": 3600}) == {
+        "poolclass": db_pool.QueuePool,
+        "pool_size": 5,
+        "pool_recycle": 3600,
+    }
+
+
+def test_pool_config():
+    pool = {"pool_size": 5, "max_overflow": 2, "pool_timeout": 1.5, "pool_pre_ping": True}
+    assert validate_config(pg_config(), {"postgres_url": "postgresql://", "pool": pool}).success
+    assert validate_config(mysql_config(), {"mysql_url": "mysql://", "pool": pool}).success
+    assert not validate_config(pg_config(), {"postgres_url": "", "pool": {"size": 5}}).success
+
+
+@contextmanager
+def sqlite_pool_metrics(pool_config):
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        engine = create_engine(
+            f"sqlite:///{os.path.join(tmpdir_path, 'pool.db')}",
+            connect_args={"check_same_thread": False},
+            **get_pool_engine_kwargs(pool_config),
+        )
+        metrics = SqlPoolMetrics()
+        metrics.instrument(engine)
+        try:
+            yield engine, metrics
+        finally:
+            engine.dispose()
+
+
+def test_pool_stats():
+    with sqlite_pool_metrics({"pool_size": 2, "max_overflow": 1}) as (engine, metrics):
+        stats = metrics.get_stats()
+        assert stats.pool_size == 2
+        assert stats.in_use == 0
+        assert stats.checkouts == 0
+
+        with metrics.connect(engine) as conn:
+            conn.execute(db.text("SELECT 1"))
+            with metrics.connect(engine), metrics.connect(engine):
+                stats = metrics.get_stats()
+                assert stats.in_use == 3
+                assert stats.overflow == 1
+
+            assert metrics.get_stats().in_use == 1
+
+        stats = metrics.get_stats()
+        assert stats.in_use == 0
+        assert stats.checkouts == 3
+        assert stats.checkout_timeouts == 0
+
+
+def test_pool_stats_without_pool():
+    with sqlite_pool_metrics(None) as (engine, metrics):
+        with metrics.connect(engine):
+            stats = metrics.get_stats()
+            assert stats.pool_size is None
+            assert stats.in_use == 1
+            assert stats.overflow == 0
+
+
+def test_pool_exhaustion():
+    with sqlite_pool_metrics({"pool_size": 2, "max_overflow": 0, "pool_timeout": 0.2}) as (
+        engine,
+        metrics,
+    ):
+        listener_calls = []
+        metrics.add_listener(lambda latency, stats: listener_calls.append((latency, stats)))
+
+        result = run_sql_pool_load(lambda: metrics.connect(engine), num_workers=4, hold_seconds=1)
+
+        # two workers hold the pool's connections for longer than the others wait for one
+        assert result.num_connected == 2
+        assert len(result.errors) == 2
+        assert all(isinstance(error, db.exc.TimeoutError) for error in result.errors)
+
+        stats = metrics.get_stats()
+        assert stats.checkouts == 2
+        assert stats.checkout_timeouts == 2
+        assert stats.in_use == 0
+        assert len(listener_calls) == 2
+        assert listener_calls[-1][1].checkouts == 2
+
+
+def test_pool_checkout_latency():
+    with sqlite_pool_metrics({"pool_size": 1, "max_overflow": 0, "pool_timeout": 10}) as (
+        engine,
+        metrics,
+    ):
+        result = run_sql_pool_load(lambda: metrics.connect(engine), num_workers=3, hold_seconds=0.2)
+        assert result.num_connected == 3
+        assert not result.errors
+
+        # the workers are served one at a time, so the last one waits for the other two
+        stats = metrics.get_stats()
+        assert stats.checkouts == 3
+        assert stats.max_checkout_seconds >= 0.3
+        assert stats.total_checkout_seconds >= stats.max_checkout_seconds
+
+
+def test_pool_listener_errors_are_logged():
+    with sqlite_pool_metrics({"pool_size": 1}) as (engine, metrics):
+
+        def _failing_listener(_latency, _stats):
+            raise Exception("listener failed")
+
+        metrics.add_listener(_failing_listener)
+        with metrics.connect(engine):
+            pass
+
+        metrics.remove_listener(_failing_listener)
+        assert metrics.get_stats().checkouts == 1
@@ -55,14 +55,18 @@
 from dagster._core.execution.job_execution_result import JobExecutionResult
 from dagster._core.execution.plan.handle import StepHandle
 from dagster._core.execution.plan.objects import StepFailureData, StepSuccessData
-from dagster._core.execution.stats import StepEventStatus
+from dagster._core.execution.stats import (
+    StepEventStatus,
+    build_run_stats_from_events,
+    build_run_step_stats_from_events,
+)
 from dagster._core.host_representation.origin import (
     ExternalJobOrigin,
     ExternalRepositoryOrigin,
     InProcessCodeLocationOrigin,
 )
 from dagster._core.storage.event_log import InMemoryEventLogStorage, SqlEventLogStorage
-from dagster._core.storage.event_log.base import EventLogStorage
+from dagster._core.storage.event_log.base import EventLogCursor, EventLogStorage
 from dagster._core.storage.event_log.migration import (
     EVENT_LOG_DATA_MIGRATIONS,
     migrate_asset_key_data,
@@ -473,6 +477,136 @@ def test_event_log_storage_store_with_multiple_runs(self, instance, storage):
             for run in runs:
                 instance.delete_run(run)
 
+    def test_store_events_batch(self, storage, instance):
+        @op
+        def batch_op(context):
+            context.log.info("before")
+            yield AssetMaterialization(
+                asset_key="batch_asset", tags={"dagster/partition/country": "US"}
+            )
+            context.log.info("between")
+            yield AssetObservation(asset_key="batch_asset")
+            yield AssetMaterialization(asset_key="other_batch_asset")
+            yield Output(1)
+
+        run_id = make_new_run_id()
+        with create_and_delete_test_runs(instance, [run_id]):
+            events, _ = _synthesize_events(lambda: batch_op(), run_id)
+            storage.store_events(events)
+
+            records = storage.get_records_for_run(run_id).records
+            assert [record.event_log_entry.message for record in records] == [
+                event.message for event in events
+            ]
+            storage_ids = [record.storage_id for record in records]
+            assert storage_ids == sorted(storage_ids)
+            assert len(set(storage_ids)) == len(storage_ids)
+
+            materializations = storage.get_event_records(
+                EventRecordsFilter(
+                    DagsterEventType.ASSET_MATERIALIZATION, asset_key=AssetKey("batch_asset")
+                )
+            )
+            assert len(materializations) == 1
+            asset_records = storage.get_asset_records([AssetKey("batch_asset")])
+            assert len(asset_records) == 1
+            assert (
+                asset_records[0].asset_entry.last_materialization_record.storage_id
+                == materializations[0].storage_id
+            )
+            assert storage.has_asset_key(AssetKey("other_batch_asset"))
+
+            if storage.supports_add_asset_event_tags():
+                assert storage.get_event_tags_for_asset(AssetKey("batch_asset")) == [
+                    {"dagster/partition/country": "US"}
+                ]
+
+    def test_get_lazy_records_for_run(self, storage, instance):
+        @op
+        def lazy_op(context):
+            context.log.info("hello")
+            yield AssetMaterialization(asset_key="lazy_asset", partition="a")
+            yield Output(1)
+
+        run_id = make_new_run_id()
+        with create_and_delete_test_runs(instance, [run_id]):
+            events, _ = _synthesize_events(lambda: lazy_op(), run_id)
+            for event in events:
+                storage.store_event(event)
+
+            records = storage.get_records_for_run(run_id).records
+            lazy_records = storage.get_lazy_records_for_run(run_id)
+            assert [record.storage_id for record in lazy_records] == [
+                record.storage_id for record in records
+            ]
+            for record, lazy_record in zip(records, lazy_records):
+                entry = record.event_log_entry
+                assert lazy_record.run_id == run_id
+                assert lazy_record.dagster_event_type == entry.dagster_event_type
+                assert lazy_record.asset_key == record.asset_key
+                assert lazy_record.partition_key == record.partition_key
+                assert lazy_record.timestamp == pytest.approx(entry.timestamp, abs=1e-3)
+                assert lazy_record.event_log_entry == entry
+                assert lazy_record.to_event_log_record() == record
+
+            projected = storage.get_lazy_records_for_run(
+                run_id,
+                of_type=DagsterEventType.ASSET_MATERIALIZATION,
+                step_keys=["lazy_op"],
+                include_event_body=False,
+            )
+            assert len(projected) == 1
+            assert projected[0].step_key == "lazy_op"
+            assert projected[0].asset_key == AssetKey("lazy_asset")
+            assert projected[0].partition_key == "a"
+            assert not projected[0].has_event_log_entry
+            with pytest.raises(check.CheckError):
+                _ = projected[0].event_log_entry
+
+            assert not storage.get_lazy_records_for_run(run_id, step_keys=["other_op"])
+
+    def test_iterate_records_for_run(self, storage, instance):
+        @op
+        def chatty_op(context):
+            for i in range(5):
+                context.log.info(f"log {i}")
+            yield Output(1)
+
+        run_id = make_new_run_id()
+        with create_and_delete_test_runs(instance, [run_id]):
+            events, _ = _synthesize_events(lambda: chatty_op(), run_id)
+            for event in events:
+                storage.store_event(event)
+
+            records = storage.get_records_for_run(run_id).records
+            assert len(records) > 3
+
+            for page_size in [1, 3, len(records), 1000]:
+                iterated = list(storage.iterate_records_for_run(run_id, page_size=page_size))
+                assert iterated == list(records)
+
+            # resumes after a storage id cursor
+            cursor = EventLogCursor.from_storage_id(records[1].storage_id).to_string()
+            assert list(
+                storage.iterate_records_for_run(run_id, cursor=cursor, page_size=2)
+            ) == list(records[2:])
+
+            # offset cursors are supported for the first page
+            cursor = EventLogCursor.from_offset(2).to_string()
+            assert list(
+                storage.iterate_records_for_run(run_id, cursor=cursor, page_size=2)
+            ) == list(records[2:])
+
+            of_type = list(
+                storage.iterate_records_for_run(
+                    run_id, of_type=DagsterEventType.STEP_SUCCESS, page_size=1
+                )
+            )
+            assert len(of_type) == 1
+            assert of_type[0].event_log_entry.dagster_event_type == DagsterEventType.STEP_SUCCESS
+
+            assert not list(storage.iterate_records_for_run(make_new_run_id()))
+
     # .watch() is async, there's a small chance they don't run before the asserts
     @pytest.mark.flaky(reruns=1)
     def test_event_log_storage_watch(self, test_run_id, storage):
@@ -1258,6 +1392,52 @@ def _pipeline():
         assert len(step_stats[0].markers) == 1
         assert step_stats[0].markers[0].end_time >= step_stats[0].markers[0].start_time + 0.1
 
+    def test_run_stats_index(self, storage, test_run_id):
+        if not isinstance(storage, SqlEventLogStorage):
+            pytest.skip("This test is for SQL-backed Event Log behavior")
+
+        assert storage.has_run_stats_index()
+
+        @op
+        def should_retry():
+            raise RetryRequested(max_retries=2)
+
+        def _ops():
+            should_succeed()
+            should_retry()
+
+        events, result = _synthesize_events(_ops, check_success=False, run_id=test_run_id)
+        for event in [*events, *_stats_records(run_id=test_run_id)]:
+            storage.store_event(event)
+
+        def _assert_matches_event_log():
+            logs = storage.get_logs_for_run(test_run_id)
+            assert storage.get_stats_for_run(test_run_id) == build_run_stats_from_events(
+                test_run_id, logs
+            )
+            assert storage.get_step_stats_for_run(test_run_id) == build_run_step_stats_from_events(
+                test_run_id, logs
+            )
+            assert storage.get_step_stats_for_run(
+                test_run_id, step_keys=["should_retry", "D"]
+            ) == build_run_step_stats_from_events(
+                test_run_id,
+                [log for log in logs if log.step_key in {"should_retry", "D"}],
+            )
+
+        step_stats = storage.get_step_stats_for_run(test_run_id, step_keys=["should_retry"])
+        assert step_stats[0].attempts == 3
+        _assert_matches_event_log()
+
+        # the summary rows can be rebuilt from the event log
+        storage.rebuild_run_stats(test_run_id)
+        _assert_matches_event_log()
+
+        assert test_run_id in storage.get_event_log_run_ids()
+        storage.delete_events(test_run_id)
+        assert storage.get_stats_for_run(test_run_id).steps_succeeded == 0
+        assert storage.get_step_stats_for_run(test_run_id) == []
+
     @pytest.mark.parametrize(
         "cursor_dt", cursor_datetime_args()
     )  # test both tz-aware and naive datetimes
@@ -8,7 +8,7 @@
 from dagster._config.config_schema import UserConfigSchema
 from dagster._core.event_api import EventHandlerFn
 from dagster._core.events.log import EventLogEntry
-from dagster._core.storage.config import MySqlStorageConfig, mysql_config
+from dagster._core.storage.config import MySqlStorageConfig, SqlPoolConfig, mysql_config
 from dagster._core.storage.event_log import (
     AssetKeyTable,
     SqlEventLogStorage,
@@ -19,8 +19,11 @@
 from dagster._core.storage.event_log.migration import ASSET_KEY_INDEX_COLS
 from dagster._core.storage.sql import (
     AlembicVersion,
+    SqlPoolMetrics,
+    SqlPoolStats,
     check_alembic_revision,
     create_engine,
+    get_pool_engine_kwargs,
     run_alembic_upgrade,
     stamp_alembic_rev,
 )
@@ -58,19 +61,28 @@ class MySQLEventLogStorage(SqlEventLogStorage, ConfigurableClass):
 
     """
 
-    def __init__(self, mysql_url: str, inst_data: Optional[ConfigurableClassData] = None):
+    def __init__(
+        self,
+        mysql_url: str,
+        inst_data: Optional[ConfigurableClassData] = None,
+        pool_config: Optional[SqlPoolConfig] = None,
+    ):
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
         self.mysql_url = check.str_param(mysql_url, "mysql_url")
         self._disposed = False
 
         self._event_watcher = SqlPollingEventWatcher(self)
 
-        # Default to not holding any connections open to prevent accumulating connections per DagsterInstance
+        # Default to not holding any connections open to prevent accumulating connections per
+        # DagsterInstance, unless a connection pool is configured
+        self._pool_config = check.opt_mapping_param(pool_config, "pool_config")
         self._engine = create_engine(
             self.mysql_url,
             isolation_level=mysql_isolation_level(),
-            poolclass=db_pool.NullPool,
+            **get_pool_engine_kwargs(self._pool_config),
         )
+        self._pool_metrics = SqlPoolMetrics()
+        self._pool_metrics.instrument(self._engine)
         self._secondary_index_cache = {}
 
         table_names = retry_mysql_connection_fn(db.inspect(self._engine).get_table_names)
@@ -97,9 +109,14 @@ def optimize_for_webserver(self, statement_timeout: int, pool_recycle: int) -> N
         self._engine = create_engine(
             self.mysql_url,
             isolation_level=mysql_isolation_level(),
-            pool_size=1,
-            pool_recycle=pool_recycle,
+            **get_pool_engine_kwargs(
+                self._pool_config, {"pool_size": 1, "pool_recycle": pool_recycle}
+            ),
         )
+        self._pool_metrics.instrument(self._engine)
+
+    def get_pool_stats(self) -> SqlPoolStats:
+        return self._pool_metrics.get_stats()
 
     def upgrade(self) -> None:
         alembic_config = mysql_alembic_config(__file__)
@@ -119,7 +136,9 @@ def from_config_value(
         cls, inst_data: Optional[ConfigurableClassData], config_value: MySqlStorageConfig
     ) -> "MySQLEventLogStorage":
         return MySQLEventLogStorage(
-            inst_data=inst_data, mysql_url=mysql_url_from_config(config_value)
+            inst_data=inst_data,
+            mysql_url=mysql_url_from_config(config_value),
+            pool_config=config_value.get("pool"),
         )
 
     @staticmethod
@@ -176,7 +195,7 @@ def store_asset_event(self, event: EventLogEntry, event_id: int) -> None:
                     pass
 
     def _connect(self) -> ContextManager[Connection]:
-        return create_mysql_connection(self._engine, __file__, "event log")
+        return create_mysql_connection(self._engine, __file__, "event log", self._pool_metrics)
 
     def run_connection(self, run_id: Optional[str] = None) -> ContextManager[Connection]:
         return self._connect()
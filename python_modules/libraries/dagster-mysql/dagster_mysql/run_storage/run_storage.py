@@ -5,7 +5,7 @@
 import sqlalchemy.dialects as db_dialects
 import sqlalchemy.pool as db_pool
 from dagster._config.config_schema import UserConfigSchema
-from dagster._core.storage.config import MySqlStorageConfig, mysql_config
+from dagster._core.storage.config import MySqlStorageConfig, SqlPoolConfig, mysql_config
 from dagster._core.storage.runs import (
     DaemonHeartbeatsTable,
     InstanceInfo,
@@ -15,8 +15,11 @@
 from dagster._core.storage.runs.schema import KeyValueStoreTable
 from dagster._core.storage.sql import (
     AlembicVersion,
+    SqlPoolMetrics,
+    SqlPoolStats,
     check_alembic_revision,
     create_engine,
+    get_pool_engine_kwargs,
     run_alembic_upgrade,
     stamp_alembic_rev,
 )
@@ -57,16 +60,25 @@ class MySQLRunStorage(SqlRunStorage, ConfigurableClass):
     :py:class:`~dagster.IntSource` and can be configured from environment variables.
     """
 
-    def __init__(self, mysql_url: str, inst_data: Optional[ConfigurableClassData] = None):
+    def __init__(
+        self,
+        mysql_url: str,
+        inst_data: Optional[ConfigurableClassData] = None,
+        pool_config: Optional[SqlPoolConfig] = None,
+    ):
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
         self.mysql_url = mysql_url
 
-        # Default to not holding any connections open to prevent accumulating connections per DagsterInstance
+        # Default to not holding any connections open to prevent accumulating connections per
+        # DagsterInstance, unless a connection pool is configured
+        self._pool_config = check.opt_mapping_param(pool_config, "pool_config")
         self._engine = create_engine(
             self.mysql_url,
             isolation_level=mysql_isolation_level(),
-            poolclass=db_pool.NullPool,
+            **get_pool_engine_kwargs(self._pool_config),
         )
+        self._pool_metrics = SqlPoolMetrics()
+        self._pool_metrics.instrument(self._engine)
 
         self._index_migration_cache = {}
         table_names = retry_mysql_connection_fn(db.inspect(self._engine).get_table_names)
@@ -96,9 +108,14 @@ def optimize_for_webserver(self, statement_timeout: int, pool_recycle: int) -> N
         self._engine = create_engine(
             self.mysql_url,
             isolation_level=mysql_isolation_level(),
-            pool_size=1,
-            pool_recycle=pool_recycle,
+            **get_pool_engine_kwargs(
+                self._pool_config, {"pool_size": 1, "pool_recycle": pool_recycle}
+            ),
         )
+        self._pool_metrics.instrument(self._engine)
+
+    def get_pool_stats(self) -> SqlPoolStats:
+        return self._pool_metrics.get_stats()
 
     @property
     def inst_data(self) -> Optional[ConfigurableClassData]:
@@ -121,7 +138,11 @@ def get_server_version(self) -> Optional[str]:
     def from_config_value(
         cls, inst_data: Optional[ConfigurableClassData], config_value: MySqlStorageConfig
     ) -> "MySQLRunStorage":
-        return MySQLRunStorage(inst_data=inst_data, mysql_url=mysql_url_from_config(config_value))
+        return MySQLRunStorage(
+            inst_data=inst_data,
+            mysql_url=mysql_url_from_config(config_value),
+            pool_config=config_value.get("pool"),
+        )
 
     @staticmethod
     def wipe_storage(mysql_url: str) -> None:
@@ -139,7 +160,7 @@ def create_clean_storage(mysql_url: str) -> "MySQLRunStorage":
         return MySQLRunStorage(mysql_url)
 
     def connect(self, run_id: Optional[str] = None) -> ContextManager[Connection]:
-        return create_mysql_connection(self._engine, __file__, "run")
+        return create_mysql_connection(self._engine, __file__, "run", self._pool_metrics)
 
     def upgrade(self) -> None:
         alembic_config = mysql_alembic_config(__file__)
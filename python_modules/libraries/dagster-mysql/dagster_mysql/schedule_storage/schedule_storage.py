@@ -6,13 +6,16 @@
 import sqlalchemy.dialects as db_dialects
 import sqlalchemy.pool as db_pool
 from dagster._config.config_schema import UserConfigSchema
-from dagster._core.storage.config import MySqlStorageConfig, mysql_config
+from dagster._core.storage.config import MySqlStorageConfig, SqlPoolConfig, mysql_config
 from dagster._core.storage.schedules import ScheduleStorageSqlMetadata, SqlScheduleStorage
 from dagster._core.storage.schedules.schema import InstigatorsTable
 from dagster._core.storage.sql import (
     AlembicVersion,
+    SqlPoolMetrics,
+    SqlPoolStats,
     check_alembic_revision,
     create_engine,
+    get_pool_engine_kwargs,
     run_alembic_upgrade,
     stamp_alembic_rev,
 )
@@ -49,16 +52,25 @@ class MySQLScheduleStorage(SqlScheduleStorage, ConfigurableClass):
     :py:class:`~dagster.IntSource` and can be configured from environment variables.
     """
 
-    def __init__(self, mysql_url: str, inst_data: Optional[ConfigurableClassData] = None):
+    def __init__(
+        self,
+        mysql_url: str,
+        inst_data: Optional[ConfigurableClassData] = None,
+        pool_config: Optional[SqlPoolConfig] = None,
+    ):
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
         self.mysql_url = mysql_url
 
-        # Default to not holding any connections open to prevent accumulating connections per DagsterInstance
+        # Default to not holding any connections open to prevent accumulating connections per
+        # DagsterInstance, unless a connection pool is configured
+        self._pool_config = check.opt_mapping_param(pool_config, "pool_config")
         self._engine = create_engine(
             self.mysql_url,
             isolation_level=mysql_isolation_level(),
-            poolclass=db_pool.NullPool,
+            **get_pool_engine_kwargs(self._pool_config),
         )
+        self._pool_metrics = SqlPoolMetrics()
+        self._pool_metrics.instrument(self._engine)
 
         # Stamp and create tables if the main table does not exist (we can't check alembic
         # revision because alembic config may be shared with other storage classes)
@@ -85,9 +97,14 @@ def optimize_for_webserver(self, statement_timeout: int, pool_recycle: int) -> N
         self._engine = create_engine(
             self.mysql_url,
             isolation_level=mysql_isolation_level(),
-            pool_size=1,
-            pool_recycle=pool_recycle,
+            **get_pool_engine_kwargs(
+                self._pool_config, {"pool_size": 1, "pool_recycle": pool_recycle}
+            ),
         )
+        self._pool_metrics.instrument(self._engine)
+
+    def get_pool_stats(self) -> SqlPoolStats:
+        return self._pool_metrics.get_stats()
 
     @property
     def inst_data(self) -> Optional[ConfigurableClassData]:
@@ -102,7 +119,9 @@ def from_config_value(
         cls, inst_data: Optional[ConfigurableClassData], config_value: MySqlStorageConfig
     ) -> "MySQLScheduleStorage":
         return MySQLScheduleStorage(
-            inst_data=inst_data, mysql_url=mysql_url_from_config(config_value)
+            inst_data=inst_data,
+            mysql_url=mysql_url_from_config(config_value),
+            pool_config=config_value.get("pool"),
         )
 
     @staticmethod
@@ -121,7 +140,7 @@ def create_clean_storage(mysql_url: str) -> "MySQLScheduleStorage":
         return MySQLScheduleStorage(mysql_url)
 
     def connect(self) -> ContextManager[Connection]:
-        return create_mysql_connection(self._engine, __file__, "schedule")
+        return create_mysql_connection(self._engine, __file__, "schedule", self._pool_metrics)
 
     @property
     def supports_batch_queries(self) -> bool:
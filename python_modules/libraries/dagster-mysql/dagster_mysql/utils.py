@@ -15,7 +15,7 @@
 from alembic.config import Config
 from dagster import _check as check
 from dagster._core.storage.config import MySqlStorageConfig
-from dagster._core.storage.sql import get_alembic_config
+from dagster._core.storage.sql import SqlPoolMetrics, get_alembic_config
 from mysql.connector.pooling import PooledMySQLConnection
 from sqlalchemy.engine import Connection
 from typing_extensions import TypeAlias
@@ -50,9 +50,18 @@ def get_conn(conn_string: str) -> MySQLConnectionUnion:
 
 def mysql_url_from_config(config_value: MySqlStorageConfig) -> str:
     if config_value.get("mysql_url"):
+        check.invariant(
+            "mysql_db" not in config_value,
+            "mysql storage config must have exactly one of `mysql_url` or `mysql_db`",
+        )
         return config_value["mysql_url"]
+    else:
+        check.invariant(
+            "mysql_db" in config_value,
+            "mysql storage config must have exactly one of `mysql_url` or `mysql_db`",
+        )
 
-    return get_conn_string(**config_value["mysql_db"])
+        return get_conn_string(**config_value["mysql_db"])
 
 
 def get_conn_string(
@@ -190,18 +199,24 @@ def mysql_isolation_level():
 
 @contextmanager
 def create_mysql_connection(
-    engine: db.engine.Engine, dunder_file: str, storage_type_desc: Optional[str] = None
+    engine: db.engine.Engine,
+    dunder_file: str,
+    storage_type_desc: Optional[str] = None,
+    pool_metrics: Optional[SqlPoolMetrics] = None,
 ) -> Iterator[Connection]:
     check.inst_param(engine, "engine", db.engine.Engine)
     check.str_param(dunder_file, "dunder_file")
     check.opt_str_param(storage_type_desc, "storage_type_desc", "")
+    check.opt_inst_param(pool_metrics, "pool_metrics", SqlPoolMetrics)
 
     if storage_type_desc:
         storage_type_desc += " "
     else:
         storage_type_desc = ""
 
-    conn_cm = retry_mysql_connection_fn(engine.connect)
+    conn_cm = retry_mysql_connection_fn(
+        lambda: pool_metrics.connect(engine) if pool_metrics else engine.connect()
+    )
     with conn_cm as conn:
         with conn.begin():
             yield conn
@@ -9,7 +9,7 @@
 from dagster._core.event_api import EventHandlerFn
 from dagster._core.events import ASSET_EVENTS
 from dagster._core.events.log import EventLogEntry
-from dagster._core.storage.config import pg_config
+from dagster._core.storage.config import SqlPoolConfig, pg_config
 from dagster._core.storage.event_log import (
     AssetKeyTable,
     DynamicPartitionsTable,
@@ -22,8 +22,11 @@
 from dagster._core.storage.event_log.polling_event_watcher import SqlPollingEventWatcher
 from dagster._core.storage.sql import (
     AlembicVersion,
+    SqlPoolMetrics,
+    SqlPoolStats,
     check_alembic_revision,
     create_engine,
+    get_pool_engine_kwargs,
     run_alembic_upgrade,
     stamp_alembic_rev,
 )
@@ -77,6 +80,7 @@ def __init__(
         postgres_url: str,
         should_autocreate_tables: bool = True,
         inst_data: Optional[ConfigurableClassData] = None,
+        pool_config: Optional[SqlPoolConfig] = None,
     ):
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
         self.postgres_url = check.str_param(postgres_url, "postgres_url")
@@ -86,10 +90,16 @@ def __init__(
 
         self._disposed = False
 
-        # Default to not holding any connections open to prevent accumulating connections per DagsterInstance
+        # Default to not holding any connections open to prevent accumulating connections per
+        # DagsterInstance, unless a connection pool is configured
+        self._pool_config = check.opt_mapping_param(pool_config, "pool_config")
         self._engine = create_engine(
-            self.postgres_url, isolation_level="AUTOCOMMIT", poolclass=db_pool.NullPool
+            self.postgres_url,
+            isolation_level="AUTOCOMMIT",
+            **get_pool_engine_kwargs(self._pool_config),
         )
+        self._pool_metrics = SqlPoolMetrics()
+        self._pool_metrics.instrument(self._engine)
 
         self._event_watcher = SqlPollingEventWatcher(self)
 
@@ -123,10 +133,15 @@ def optimize_for_webserver(self, statement_timeout: int, pool_recycle: int) -> N
         self._engine = create_engine(
             self.postgres_url,
             isolation_level="AUTOCOMMIT",
-            pool_size=1,
             connect_args={"options": options},
-            pool_recycle=pool_recycle,
+            **get_pool_engine_kwargs(
+                self._pool_config, {"pool_size": 1, "pool_recycle": pool_recycle}
+            ),
         )
+        self._pool_metrics.instrument(self._engine)
+
+    def get_pool_stats(self) -> SqlPoolStats:
+        return self._pool_metrics.get_stats()
 
     def upgrade(self) -> None:
         alembic_config = pg_alembic_config(__file__)
@@ -149,6 +164,7 @@ def from_config_value(
             inst_data=inst_data,
             postgres_url=pg_url_from_config(config_value),
             should_autocreate_tables=config_value.get("should_autocreate_tables", True),
+            pool_config=config_value.get("pool"),
         )
 
     @staticmethod
@@ -203,6 +219,20 @@ def store_event(self, event: EventLogEntry) -> None:
 
             self.store_asset_event_tags(event, event_id)
 
+        self._store_run_stats([event])
+
+    def _insert_event_rows(
+        self, conn: Connection, events: Sequence[EventLogEntry]
+    ) -> Sequence[Optional[int]]:
+        # Postgres returns the ids of every row of a multi-row insert, so the whole batch can be
+        # written with a single statement.  Ids are drawn from the sequence in row order.
+        result = conn.execute(
+            SqlEventLogStorageTable.insert()
+            .values([self._get_event_insert_values(event) for event in events])
+            .returning(SqlEventLogStorageTable.c.id)
+        )
+        return sorted(int(row[0]) for row in result.fetchall())
+
     def store_asset_event(self, event: EventLogEntry, event_id: int) -> None:
         check.inst_param(event, "event", EventLogEntry)
         if not (event.dagster_event and event.dagster_event.asset_key):
@@ -276,7 +306,7 @@ def add_dynamic_partitions(
             )
 
     def _connect(self) -> ContextManager[Connection]:
-        return create_pg_connection(self._engine)
+        return create_pg_connection(self._engine, self._pool_metrics)
 
     def run_connection(self, run_id: Optional[str] = None) -> ContextManager[Connection]:
         return self._connect()
@@ -6,7 +6,7 @@
 import sqlalchemy.dialects as db_dialects
 import sqlalchemy.pool as db_pool
 from dagster._config.config_schema import UserConfigSchema
-from dagster._core.storage.config import PostgresStorageConfig, pg_config
+from dagster._core.storage.config import PostgresStorageConfig, SqlPoolConfig, pg_config
 from dagster._core.storage.runs import (
     DaemonHeartbeatsTable,
     InstanceInfo,
@@ -17,8 +17,11 @@
 from dagster._core.storage.runs.sql_run_storage import SnapshotType
 from dagster._core.storage.sql import (
     AlembicVersion,
+    SqlPoolMetrics,
+    SqlPoolStats,
     check_alembic_revision,
     create_engine,
+    get_pool_engine_kwargs,
     run_alembic_upgrade,
     stamp_alembic_rev,
 )
@@ -70,6 +73,7 @@ def __init__(
         postgres_url: str,
         should_autocreate_tables: bool = True,
         inst_data: Optional[ConfigurableClassData] = None,
+        pool_config: Optional[SqlPoolConfig] = None,
     ):
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
         self.postgres_url = postgres_url
@@ -77,12 +81,16 @@ def __init__(
             should_autocreate_tables, "should_autocreate_tables"
         )
 
-        # Default to not holding any connections open to prevent accumulating connections per DagsterInstance
+        # Default to not holding any connections open to prevent accumulating connections per
+        # DagsterInstance, unless a connection pool is configured
+        self._pool_config = check.opt_mapping_param(pool_config, "pool_config")
         self._engine = create_engine(
             self.postgres_url,
             isolation_level="AUTOCOMMIT",
-            poolclass=db_pool.NullPool,
+            **get_pool_engine_kwargs(self._pool_config),
         )
+        self._pool_metrics = SqlPoolMetrics()
+        self._pool_metrics.instrument(self._engine)
 
         self._index_migration_cache = {}
 
@@ -117,10 +125,15 @@ def optimize_for_webserver(self, statement_timeout: int, pool_recycle: int) -> N
         self._engine = create_engine(
             self.postgres_url,
             isolation_level="AUTOCOMMIT",
-            pool_size=1,
             connect_args={"options": options},
-            pool_recycle=pool_recycle,
+            **get_pool_engine_kwargs(
+                self._pool_config, {"pool_size": 1, "pool_recycle": pool_recycle}
+            ),
         )
+        self._pool_metrics.instrument(self._engine)
+
+    def get_pool_stats(self) -> SqlPoolStats:
+        return self._pool_metrics.get_stats()
 
     @property
     def inst_data(self) -> Optional[ConfigurableClassData]:
@@ -138,6 +151,7 @@ def from_config_value(
             inst_data=inst_data,
             postgres_url=pg_url_from_config(config_value),
             should_autocreate_tables=config_value.get("should_autocreate_tables", True),
+            pool_config=config_value.get("pool"),
         )
 
     @staticmethod
@@ -154,7 +168,7 @@ def create_clean_storage(
         return PostgresRunStorage(postgres_url, should_autocreate_tables)
 
     def connect(self) -> ContextManager[Connection]:
-        return create_pg_connection(self._engine)
+        return create_pg_connection(self._engine, self._pool_metrics)
 
     def upgrade(self) -> None:
         with self.connect() as conn:
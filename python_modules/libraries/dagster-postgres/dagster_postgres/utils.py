@@ -16,7 +16,7 @@
 # re-export
 from dagster._core.storage.config import pg_config as pg_config
 from dagster._core.storage.event_log.sql_event_log import SqlDbConnection
-from dagster._core.storage.sql import get_alembic_config
+from dagster._core.storage.sql import SqlPoolMetrics, get_alembic_config
 from sqlalchemy.engine import Connection
 
 T = TypeVar("T")
@@ -157,12 +157,16 @@ def pg_alembic_config(
 @contextmanager
 def create_pg_connection(
     engine: sqlalchemy.engine.Engine,
+    pool_metrics: Optional[SqlPoolMetrics] = None,
 ) -> Iterator[Connection]:
     check.inst_param(engine, "engine", sqlalchemy.engine.Engine)
+    check.opt_inst_param(pool_metrics, "pool_metrics", SqlPoolMetrics)
     conn = None
     try:
         # Retry connection to gracefully handle transient connection issues
-        conn = retry_pg_connection_fn(engine.connect)
+        conn = retry_pg_connection_fn(
+            lambda: pool_metrics.connect(engine) if pool_metrics else engine.connect()
+        )
         yield conn
     finally:
         if conn:
@@ -8,6 +8,8 @@
 from dagster._core.instance.ref import InstanceRef
 from dagster._core.test_utils import instance_for_test
 from dagster._utils.test.postgres_instance import TestPostgresInstance
+from dagster._utils.test.sql_pool_load import run_sql_pool_load
+from dagster_postgres.run_storage import PostgresRunStorage
 from dagster_postgres.utils import get_conn, get_conn_string
 
 
@@ -319,3 +321,28 @@ def test_configured_other_schema(hostname):
         instance.get_runs()
         instance.all_asset_keys()
         instance.all_instigator_state()
+
+
+def test_connection_pool(hostname):
+    config = yaml.safe_load(unified_pg_config(hostname))
+    config["storage"]["postgres"]["pool"] = {
+        "pool_size": 2,
+        "max_overflow": 0,
+        "pool_timeout": 10,
+    }
+    with instance_for_test(overrides=config) as instance:
+        instance.get_runs()
+        pool_stats = instance.get_storage_pool_stats()
+        assert set(pool_stats.keys()) == {"run_storage", "event_log_storage", "schedule_storage"}
+        assert pool_stats["run_storage"].pool_size == 2
+
+        run_storage = instance.run_storage
+        assert isinstance(run_storage, PostgresRunStorage)
+        result = run_sql_pool_load(run_storage.connect, num_workers=4, hold_seconds=0.5)
+        assert result.num_connected == 4
+        assert not result.errors
+
+        # the pool has two connections, so two of the workers wait for the others to finish
+        stats = instance.get_storage_pool_stats()["run_storage"]
+        assert stats.in_use == 0
+        assert stats.max_checkout_seconds >= 0.4